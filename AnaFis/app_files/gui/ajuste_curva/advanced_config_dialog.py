@@ -1,18 +1,18 @@
 """Advanced configuration dialog for curve fitting"""
 
-import tkinter as tk
-from tkinter import ttk
-from typing import TYPE_CHECKING, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, cast
 import logging
 
-from app_files.utils.translations.api import get_string
+from app_files.utils.translations.api import get_string_cached as _tr
 
 # Lazy import utility
 from app_files.utils.lazy_loader import lazy_import
-# Error handler import (assume it's in utils or startup)
-from app_files.utils import error_handler
-# Import for type hints only
+# Import for type hints only; tkinter itself is imported when the dialog opens
 if TYPE_CHECKING:
+    import tkinter as tk
+    from tkinter import ttk
     from app_files.gui.ajuste_curva.main_gui import AjusteCurvaFrame
     from app_files.gui.ajuste_curva.adjustment_points_manager import (
         AdjustmentPointsManager,
@@ -23,6 +23,13 @@ if TYPE_CHECKING:
     from app_files.gui.ajuste_curva.custom_function_manager import CustomFunctionManager
 
 
+# Delay that coalesces bursts of theme-change notifications into one recolor
+THEME_UPDATE_DELAY_MS = 50
+# Initial popup size, also used to center it without a geometry pass
+DIALOG_WIDTH = 620
+DIALOG_HEIGHT = 670
+
+
 class AdvancedConfigDialog:
     """Dialog for advanced configuration options"""
 
@@ -52,21 +59,60 @@ class AdvancedConfigDialog:
         self.parameter_estimates_manager = parameter_estimates_manager
         self.adjustment_points_manager = adjustment_points_manager  # Store the manager
         self.popup_window: Optional[tk.Toplevel] = None  # For theme updates
+        # Theme manager resolved on first use, and whether our callback is registered
+        self._theme_manager: Any = None
+        self._theme_callback_registered = False
+        # Pending after() id for the debounced theme recolor
+        self._theme_after_id: Optional[str] = None
+        # Notebook tabs by index, their builders and whether each has run
+        self._tab_frames: Dict[int, ttk.Frame] = {}
+        self._tab_builders: Dict[int, Callable[[ttk.Frame], None]] = {}
+        self._tab_built: Dict[int, bool] = {}
+        # Widgets whose text follows the language, kept to relabel them directly
+        self._notebook: Optional[ttk.Notebook] = None
+        self._tabs: List[Tuple[ttk.Frame, str]] = []
+        self._numba_check: Optional[ttk.Checkbutton] = None
+        self._close_button: Optional[ttk.Button] = None
+        # Language the open popup's texts are in, so a switch to it is a no-op
+        self._ui_language: Optional[str] = None
 
     def show_dialog(self) -> None:
         """Show the advanced configuration dialog"""
-        theme_manager = lazy_import("app_files.utils.theme_manager", "theme_manager")
+        import tkinter as tk
+        from tkinter import ttk
+
+        # Already open (popup_window is cleared on close): bring it forward
+        # instead of building a second one
+        if self.popup_window is not None and self.popup_window.winfo_exists():
+            self.popup_window.deiconify()
+            self.popup_window.lift()
+            self.popup_window.focus_force()
+            return
+
+        theme_manager = self._get_theme_manager()
+        parent_window = self.parent.parent
         # Create a new top-level window
-        popup = tk.Toplevel(self.parent.parent)
+        popup = tk.Toplevel(parent_window)
         popup.title(
-            get_string(
+            _tr(
                 "ajuste_curva",
                 "advanced_config",
                 self.language,
                 fallback="Configuração avançada",
             )
         )
-        popup.geometry("620x670")
+        # Size and center on the parent in one call, from the known size
+        x = (
+            parent_window.winfo_x()
+            + (parent_window.winfo_width() // 2)
+            - (DIALOG_WIDTH // 2)
+        )
+        y = (
+            parent_window.winfo_y()
+            + (parent_window.winfo_height() // 2)
+            - (DIALOG_HEIGHT // 2)
+        )
+        popup.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
         popup.resizable(True, True)
         # Apply theme-adaptive background
         popup.configure(bg=theme_manager.get_adaptive_color("background"))
@@ -74,12 +120,14 @@ class AdvancedConfigDialog:
         # Store reference to popup for theme updates
         self.popup_window = popup
 
-        # Register for theme change callbacks
-        theme_manager.register_color_callback(self._update_popup_colors)
+        # Register for theme change callbacks (dropped again in _on_close)
+        if not self._theme_callback_registered:
+            theme_manager.register_color_callback(self._update_popup_colors)
+            self._theme_callback_registered = True
 
         # Fix the transient call by checking if parent is a window
-        if isinstance(self.parent.parent, (tk.Tk, tk.Toplevel)):
-            popup.transient(self.parent.parent)  # Make it a child of main window
+        if isinstance(parent_window, (tk.Tk, tk.Toplevel)):
+            popup.transient(parent_window)  # Make it a child of main window
 
         popup.grab_set()  # Make it modal
 
@@ -87,72 +135,32 @@ class AdvancedConfigDialog:
         notebook = ttk.Notebook(popup)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # === First tab: Adjustment Points ===
+        # Tabs start empty and are filled the first time they are selected,
+        # so opening the dialog only pays for the visible one
         adjust_tab = ttk.Frame(notebook)
         notebook.add(
             adjust_tab,
-            text=get_string(
+            text=_tr(
                 "ajuste_curva",
                 "adjustment_points",
                 self.language,
                 fallback="Pontos de ajuste",
             ),
         )
-
-        # Configure grid weights to maximize scrollbox space
-        adjust_tab.columnconfigure(0, weight=1)
-        adjust_tab.rowconfigure(1, weight=1)  # Make the row with scrollbox expandable
-
-        # Set up the adjustment points UI with expanded scrollbox
-        if self.adjustment_points_manager is None:
-            logging.error("adjustment_points_manager is None, cannot set up UI")
-            error_handler.handle_error(
-                get_string("ajuste_curva", "error", self.language, fallback="Erro"),
-                get_string(
-                    "ajuste_curva",
-                    "config_error_adjust_manager",
-                    self.language,
-                    fallback="Erro ao configurar o gerenciador de pontos de ajuste.",
-                ),
-            )
-            return
-
-        self.adjustment_points_manager.setup_ui(adjust_tab, maximize_scrollbox=True)
-
-        # === Second tab: Initial Estimates ===
         estimates_tab = ttk.Frame(notebook)
         notebook.add(
             estimates_tab,
-            text=get_string(
+            text=_tr(
                 "ajuste_curva",
                 "initial_estimates",
                 self.language,
                 fallback="Estimativas iniciais",
             ),
         )
-
-        # Add a safety check before calling setup_ui
-        if self.parameter_estimates_manager is None:
-            logging.error("parameter_estimates_manager is None, cannot set up UI")
-            error_handler.handle_error(
-                get_string("ajuste_curva", "error", self.language, fallback="Erro"),
-                get_string(
-                    "ajuste_curva",
-                    "config_error_param_manager",
-                    self.language,
-                    fallback="Erro ao configurar o gerenciador de parâmetros.",
-                ),
-            )
-            return
-
-        # Set up the parameter estimates UI
-        self.parameter_estimates_manager.setup_ui(estimates_tab)
-
-        # === Third tab: Custom Functions ===
         funcs_tab = ttk.Frame(notebook)
         notebook.add(
             funcs_tab,
-            text=get_string(
+            text=_tr(
                 "ajuste_curva",
                 "custom_functions",
                 self.language,
@@ -160,78 +168,212 @@ class AdvancedConfigDialog:
             ),
         )
 
-        # Configure grid weights for custom functions tab
-        funcs_tab.columnconfigure(0, weight=1)
-        funcs_tab.rowconfigure(1, weight=1)  # Make the row with scrollbox expandable
+        self._notebook = notebook
+        self._ui_language = self.language
+        self._tabs = [
+            (adjust_tab, "adjustment_points"),
+            (estimates_tab, "initial_estimates"),
+            (funcs_tab, "custom_functions"),
+        ]
+        self._numba_check = None
+        self._close_button = None
+        self._tab_frames = {0: adjust_tab, 1: estimates_tab, 2: funcs_tab}
+        self._tab_builders = {
+            0: self._build_adjustment_tab,
+            1: self._build_estimates_tab,
+            2: self._build_functions_tab,
+        }
+        self._tab_built = {0: False, 1: False, 2: False}
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
-        # Set up the custom functions UI with expanded scrollbox
-        if self.custom_function_manager is None:
-            logging.error("custom_function_manager is None, cannot set up UI")
-            error_handler.handle_error(
-                get_string("ajuste_curva", "error", self.language, fallback="Erro"),
-                get_string(
-                    "ajuste_curva",
-                    "config_error_custom_func",
-                    self.language,
-                    fallback="Erro ao configurar funções personalizadas.",
-                ),
-            )
-            return
+        # Also handle window close via X button
+        popup.protocol("WM_DELETE_WINDOW", lambda: self._on_close(popup))
 
-        self.custom_function_manager.setup_ui(funcs_tab, maximize_scrollbox=True)
+        # Fill the first tab once Tk has painted the empty window, so the
+        # dialog shows up immediately instead of after all its widgets exist
+        popup.after_idle(lambda: self._deferred_build(popup))
 
-        # Function to handle popup closing
-        def on_close() -> None:
+    def _get_theme_manager(self) -> Any:
+        """Return the theme manager, importing it on first use"""
+        if self._theme_manager is None:
+            self._theme_manager = lazy_import(
+                "app_files.utils.theme_manager", "theme_manager"
+            )
+        return self._theme_manager
+
+    def _on_close(self, popup: tk.Toplevel) -> None:
+        """Hide the popup at once, then save the managers' state and destroy it"""
+        # Stop theme notifications so neither this dialog nor the destroyed
+        # popup is kept alive by the theme manager
+        if self._theme_callback_registered:
+            self._get_theme_manager().unregister_color_callback(
+                self._update_popup_colors
+            )
+            self._theme_callback_registered = False
+        if self._theme_after_id is not None:
+            popup.after_cancel(self._theme_after_id)
+            self._theme_after_id = None
+        self.popup_window = None
+
+        # Saving adjustment points refits and replots the main window, which
+        # has to stay on the Tk thread and still reads the popup's widgets,
+        # so the popup is only withdrawn until that has run
+        popup.grab_release()
+        popup.withdraw()
+        popup.after_idle(lambda: self._finish_close(popup))
+
+    def _finish_close(self, popup: tk.Toplevel) -> None:
+        """Save the managers' state and destroy the hidden popup"""
+        try:
             # Save adjustment points when closing
             if self.adjustment_points_manager is not None:
                 self.adjustment_points_manager.save_points()
             # Save custom functions
             if self.custom_function_manager is not None:
                 self.custom_function_manager.save_functions()
+        finally:
             # Destroy the popup
             popup.destroy()
 
+    def _deferred_build(self, popup: tk.Toplevel) -> None:
+        """Build the first tab and the buttons"""
+        from tkinter import ttk
+
+        if not popup.winfo_exists():
+            return
+
+        self._build_tab(0)
+
+        # Numba toggle, read by perform_fit when the model is built; greyed
+        # out when numba is not installed
+        from app_files.gui.ajuste_curva.model_manager import NUMBA_AVAILABLE
+
+        self._numba_check = ttk.Checkbutton(
+            popup,
+            text=_tr(
+                "ajuste_curva",
+                "use_numba",
+                self.language,
+                fallback="Compilar o modelo com numba (mais rápido em muitos pontos)",
+            ),
+            variable=self.parent.use_numba,
+            state="normal" if NUMBA_AVAILABLE else "disabled",
+        )
+        self._numba_check.pack(anchor="w", padx=10)
+
         # Button to close the popup - now calls our custom close function
         button_frame = ttk.Frame(popup)
         button_frame.pack(pady=10, fill="x")
 
-        close_button = ttk.Button(
+        self._close_button = ttk.Button(
             button_frame,
-            text=get_string("ajuste_curva", "close", self.language, fallback="Fechar"),
-            command=on_close,
+            text=_tr("ajuste_curva", "close", self.language, fallback="Fechar"),
+            command=lambda: self._on_close(popup),
         )
-        close_button.pack(anchor="center")
+        self._close_button.pack(anchor="center")
 
-        # Also handle window close via X button
-        popup.protocol("WM_DELETE_WINDOW", on_close)
+    def _on_tab_changed(self, event: tk.Event) -> None:
+        """Build the selected tab's content the first time it is shown"""
+        notebook = cast("ttk.Notebook", event.widget)
+        self._build_tab(notebook.index(notebook.select()))
 
-        # Center the popup on the parent window
-        popup.update_idletasks()
-        parent_window = self.parent.parent
-        x = (
-            parent_window.winfo_x()
-            + (parent_window.winfo_width() // 2)
-            - (popup.winfo_width() // 2)
-        )
-        y = (
-            parent_window.winfo_y()
-            + (parent_window.winfo_height() // 2)
-            - (popup.winfo_height() // 2)
+    def _build_tab(self, index: int) -> None:
+        """Run a tab's builder once
+
+        Args:
+            index: Position of the tab in the notebook
+        """
+        if self._tab_built.get(index, True):
+            return
+        self._tab_built[index] = True
+        self._tab_builders[index](self._tab_frames[index])
+
+    def _require_manager(self, manager: Any, name: str, error_key: str) -> bool:
+        """Report a missing manager; returns True when it is available
+
+        Args:
+            manager: Manager that will build the tab
+            name: Attribute name, for the log message
+            error_key: Translation key of the error shown to the user
+        """
+        if manager is not None:
+            return True
+        # Imported here since error_handler pulls in tkinter.messagebox
+        from app_files.utils import error_handler
+
+        logging.error("%s is None, cannot set up UI", name)
+        error_handler.handle_error(
+            _tr("ajuste_curva", "error", self.language, fallback="Erro"),
+            _tr("ajuste_curva", error_key, self.language),
         )
-        popup.geometry(f"+{x}+{y}")
+        return False
+
+    def _build_adjustment_tab(self, adjust_tab: ttk.Frame) -> None:
+        """Fill the adjustment points tab"""
+        # Set up the adjustment points UI with expanded scrollbox; setup_ui
+        # gives the tab's column 0 and scrollbox row their grid weights
+        if not self._require_manager(
+            self.adjustment_points_manager,
+            "adjustment_points_manager",
+            "config_error_adjust_manager",
+        ):
+            return
+        assert self.adjustment_points_manager is not None
+
+        self.adjustment_points_manager.setup_ui(adjust_tab, maximize_scrollbox=True)
+
+    def _build_estimates_tab(self, estimates_tab: ttk.Frame) -> None:
+        """Fill the initial estimates tab"""
+        # Add a safety check before calling setup_ui
+        if not self._require_manager(
+            self.parameter_estimates_manager,
+            "parameter_estimates_manager",
+            "config_error_param_manager",
+        ):
+            return
+        assert self.parameter_estimates_manager is not None
+
+        # Set up the parameter estimates UI
+        self.parameter_estimates_manager.setup_ui(estimates_tab)
+
+    def _build_functions_tab(self, funcs_tab: ttk.Frame) -> None:
+        """Fill the custom functions tab"""
+        # Set up the custom functions UI with expanded scrollbox; setup_ui
+        # gives the tab's column 0 and list row their grid weights
+        if not self._require_manager(
+            self.custom_function_manager,
+            "custom_function_manager",
+            "config_error_custom_func",
+        ):
+            return
+        assert self.custom_function_manager is not None
+
+        self.custom_function_manager.setup_ui(funcs_tab, maximize_scrollbox=True)
 
     def _update_popup_colors(self) -> None:
-        """Update popup colors when theme changes"""
+        """Schedule a popup recolor when the theme changes
+
+        Bursts of theme notifications collapse into one recolor after
+        THEME_UPDATE_DELAY_MS.
+        """
+        import tkinter as tk
+
         try:
-            if (
-                hasattr(self, "popup_window")
-                and self.popup_window is not None
-                and self.popup_window.winfo_exists()
-            ):
-                theme_manager = lazy_import(
-                    "app_files.utils.theme_manager", "theme_manager"
+            if self.popup_window is not None and self.popup_window.winfo_exists():
+                if self._theme_after_id is not None:
+                    self.popup_window.after_cancel(self._theme_after_id)
+                self._theme_after_id = self.popup_window.after(
+                    THEME_UPDATE_DELAY_MS, self._apply_popup_colors
                 )
-                bg_color = theme_manager.get_adaptive_color("background")
+        except tk.TclError as e:
+            logging.warning("Failed to schedule advanced config dialog colors: %s", e)
+
+    def _apply_popup_colors(self) -> None:
+        """Recolor the popup for the current theme"""
+        self._theme_after_id = None
+        try:
+            if self.popup_window is not None and self.popup_window.winfo_exists():
+                bg_color = self._get_theme_manager().get_adaptive_color("background")
                 self.popup_window.configure(bg=bg_color)
                 logging.debug("Advanced config dialog colors updated for theme change")
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -241,81 +383,41 @@ class AdvancedConfigDialog:
     def switch_language(self, language: str) -> None:
         """Update language for the dialog. If the popup is open, update its texts."""
         self.language = language
+        popup = self.popup_window
+        if popup is None or language == self._ui_language:
+            return
+
         try:
-            if (
-                hasattr(self, "popup_window")
-                and self.popup_window is not None
-                and self.popup_window.winfo_exists()
+            if not popup.winfo_exists():
+                return
+            popup.title(
+                _tr(
+                    "ajuste_curva",
+                    "advanced_config",
+                    self.language,
+                    fallback="Configuração avançada",
+                )
+            )
+
+            # Widgets created by show_dialog; the buttons may not exist yet
+            # if the deferred build hasn't run
+            if self._notebook is not None:
+                for idx, (_, key) in enumerate(self._tabs):
+                    self._notebook.tab(idx, text=_tr("ajuste_curva", key, self.language))
+            if self._numba_check is not None:
+                self._numba_check.config(text=_tr("ajuste_curva", "use_numba", self.language))
+            if self._close_button is not None:
+                self._close_button.config(text=_tr("ajuste_curva", "close", self.language))
+
+            # Propagate to managers inside the dialog if they implement switch_language
+            for manager in (
+                self.adjustment_points_manager,
+                self.parameter_estimates_manager,
+                self.custom_function_manager,
             ):
-                popup = self.popup_window
-                # Update title
-                try:
-                    popup.title(
-                        get_string(
-                            "ajuste_curva",
-                            "advanced_config",
-                            self.language,
-                            fallback="Configuração avançada",
-                        )
-                    )
-                except Exception:
-                    pass
-
-                # Update notebook tab labels (if any)
-                try:
-                    for child in popup.winfo_children():
-                        if isinstance(child, ttk.Notebook):
-                            notebook = child
-                            for idx in range(notebook.index("end")):
-                                tab_text = notebook.tab(idx, option="text")
-                                # Map known tabs
-                                if tab_text in [
-                                    get_string("ajuste_curva", "adjustment_points", "pt"),
-                                    get_string("ajuste_curva", "adjustment_points", "en"),
-                                ]:
-                                    notebook.tab(idx, text=get_string("ajuste_curva", "adjustment_points", self.language))
-                                elif tab_text in [
-                                    get_string("ajuste_curva", "initial_estimates", "pt"),
-                                    get_string("ajuste_curva", "initial_estimates", "en"),
-                                ]:
-                                    notebook.tab(idx, text=get_string("ajuste_curva", "initial_estimates", self.language))
-                                elif tab_text in [
-                                    get_string("ajuste_curva", "custom_functions", "pt"),
-                                    get_string("ajuste_curva", "custom_functions", "en"),
-                                ]:
-                                    notebook.tab(idx, text=get_string("ajuste_curva", "custom_functions", self.language))
-                except Exception:
-                    pass
-
-                # Update close button text if present
-                try:
-                    for child in popup.winfo_children():
-                        for sub in child.winfo_children():
-                            if isinstance(sub, ttk.Button):
-                                # Update the close button specifically by checking its current text
-                                if sub.cget("text") in [
-                                    get_string("ajuste_curva", "close", "pt"),
-                                    get_string("ajuste_curva", "close", "en"),
-                                ]:
-                                    sub.config(text=get_string("ajuste_curva", "close", self.language))
-                except Exception:
-                    pass
-
-                # Propagate to managers inside the dialog if they implement switch_language
-                try:
-                    if self.adjustment_points_manager and hasattr(self.adjustment_points_manager, "switch_language"):
-                        self.adjustment_points_manager.switch_language(self.language)
-                except Exception:
-                    pass
-                try:
-                    if self.parameter_estimates_manager and hasattr(self.parameter_estimates_manager, "switch_language"):
-                        self.parameter_estimates_manager.switch_language(self.language)
-                except Exception:
-                    pass
-                try:
-                    if self.custom_function_manager and hasattr(self.custom_function_manager, "switch_language"):
-                        self.custom_function_manager.switch_language(self.language)
-                except Exception:
-                    pass
-        except Exception:
+                if manager is not None and hasattr(manager, "switch_language"):
+                    manager.switch_language(self.language)
+            self._ui_language = language
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Justification: a language switch should never crash the app
             logging.exception("Failed to switch language on AdvancedConfigDialog")
@@ -1,24 +1,102 @@
 """Custom function management for curve fitting"""
 
+import re
 import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox
 from typing import List, Optional, Tuple, TYPE_CHECKING, Any
-from app_files.utils.lazy_loader import lazy_import
 from app_files.utils import error_handler
-from app_files.utils.translations.api import get_string
+from app_files.utils.translations.api import get_string_cached as _tr
 from .models import CustomFunction
 
-theme_manager = lazy_import("app_files.utils.theme_manager", "theme_manager")
+# Full "#rrggbb" color, the only form the preview is updated from
+_HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+# Plain decimal number, the accepted form of an interval bound
+_FLOAT_RE = re.compile(r"^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$")
+
+# Delay before the color preview follows edits in the color entry
+COLOR_PREVIEW_DELAY_MS = 50
+
+# Formatter of the interval bounds shown in the function list
+_FMT_BOUND = "{:.1f}".format
+
+# Checkbox character and row tags of a tree item, indexed by func.enabled
+_CHECKBOX = ("☐", "☑")
+_ROW_TAGS = (("disabled",), ("enabled",))
 
 if TYPE_CHECKING:
     from app_files.gui.ajuste_curva.main_gui import AjusteCurvaFrame
     from app_files.gui.ajuste_curva.plot_manager import PlotManager
     from app_files.utils.user_preferences import UserPreferencesManager
+    from app_files.utils.theme_manager import ThemeManager
+
+
+def _parse_opt_float(text: str) -> Optional[float]:
+    """Parse an optional interval bound
+
+    Args:
+        text: Stripped entry text
+
+    Returns:
+        None for an empty bound, otherwise its value
+
+    Raises:
+        ValueError: If the text is not a plain decimal number
+    """
+    if not text:
+        return None
+    if _FLOAT_RE.match(text) is None:
+        raise ValueError(text)
+    return float(text)
+
+
+class _Widgets:
+    """Widgets of the custom function tab, None until setup_ui builds them"""
+
+    __slots__ = (
+        "function_entry",
+        "color_button",
+        "color_entry",
+        "color_preview",
+        "add_button",
+        "functions_tree",
+        "remove_button",
+        "clear_button",
+        "plot_button",
+        "x_min_entry",
+        "x_max_entry",
+        "instruction_label",
+        "y_equals_label",
+        "from_label",
+        "to_label",
+    )
+
+    def __init__(self) -> None:
+        self.function_entry: Optional[ttk.Entry] = None
+        self.color_button: Optional[ttk.Button] = None
+        self.color_entry: Optional[ttk.Entry] = None
+        self.color_preview: Optional[tk.Label] = None
+        self.add_button: Optional[ttk.Button] = None
+        self.functions_tree: Optional[ttk.Treeview] = (
+            None  # Tree view with checkboxes
+        )
+        self.remove_button: Optional[ttk.Button] = None
+        self.clear_button: Optional[ttk.Button] = None
+        self.plot_button: Optional[ttk.Button] = None
+        self.x_min_entry: Optional[ttk.Entry] = None
+        self.x_max_entry: Optional[ttk.Entry] = None
+        self.instruction_label: Optional[ttk.Label] = None
+        self.y_equals_label: Optional[ttk.Label] = None
+        self.from_label: Optional[ttk.Label] = None
+        self.to_label: Optional[ttk.Label] = None
 
 
 class CustomFunctionManager:
     """Manages custom functions added to the plot"""
 
+    # Theme manager, imported on first use by _tm
+    _tm_cached: Optional["ThemeManager"] = None
+
     def __init__(
         self,
         parent: "AjusteCurvaFrame",
@@ -38,30 +116,44 @@ class CustomFunctionManager:
         self.user_preferences = user_preferences
         self.language = self.user_preferences.get_language()
 
-        self.function_entry: Optional[ttk.Entry] = None
-        self.color_button: Optional[ttk.Button] = None
-        self.color_entry: Optional[ttk.Entry] = None
-        self.add_button: Optional[ttk.Button] = None
-        self.functions_listbox: Optional[tk.Listbox] = (
-            None  # Keep for backward compatibility
-        )
-        self.functions_tree: Optional[ttk.Treeview] = (
-            None  # New tree view with checkboxes
-        )
-        self.remove_button: Optional[ttk.Button] = None
-        self.clear_button: Optional[ttk.Button] = None
-        self.plot_button: Optional[ttk.Button] = None
-        self.x_min_entry: Optional[ttk.Entry] = None
-        self.x_max_entry: Optional[ttk.Entry] = None
-
-        self.instruction_label: Optional[ttk.Label] = None
-        self.y_equals_label: Optional[ttk.Label] = None
-        self.from_label: Optional[ttk.Label] = None
-        self.to_label: Optional[ttk.Label] = None
+        # Widgets built by setup_ui
+        self.w = _Widgets()
+        # (enabled, disabled) tag colors set on the current tree, None if unset
+        self._tag_colors: Optional[Tuple[str, str]] = None
+        # Holds the Add button; the Help button is added to it after idle
+        self._buttons_frame: Optional[ttk.Frame] = None
 
         self.functions: List[CustomFunction] = []
+        # Tree item id of each function, in list order. Ids come from a counter
+        # and never change, so removing a row doesn't touch the rows after it
+        self._tree_iids: List[str] = []
+        self._next_iid = 0
+        # (text, color, x_min, x_max) of each function drawn by the last update_plot
+        self._last_plot_signature: Optional[
+            Tuple[Tuple[str, str, Optional[float], Optional[float]], ...]
+        ] = None
         self.selected_color: str = "#000000"
-        self.color_preview: Optional[tk.Label] = None
+        # Text of the color entry and the pending preview update, if any
+        self._color_var: Optional[tk.StringVar] = None
+        self._color_update_after: Optional[str] = None
+        # Help window kept hidden between uses, and the language it was built in
+        self._help_window: Optional[tk.Toplevel] = None
+        self._help_language: Optional[str] = None
+
+    @property
+    def functions_tree(self) -> Optional[ttk.Treeview]:
+        """The function list tree, None before setup_ui"""
+        return self.w.functions_tree
+
+    @classmethod
+    def _tm(cls) -> "ThemeManager":
+        """Return the theme manager, importing it the first time it is needed"""
+        tm = cls._tm_cached
+        if tm is None:
+            from app_files.utils.theme_manager import theme_manager as tm
+
+            cls._tm_cached = tm
+        return tm
 
     def setup_ui(self, parent: ttk.Frame, maximize_scrollbox: bool = False) -> None:
         """Configura a interface gráfica para o gerenciador de funções personalizadas.
@@ -70,6 +162,19 @@ class CustomFunctionManager:
             parent: The parent frame where UI elements will be placed
             maximize_scrollbox: Whether to maximize the scrollbox height for better visibility
         """
+        self._setup_ui_critical(parent, maximize_scrollbox)
+        # Tree styles, bindings, the Help button and the function list are not
+        # needed for the first paint; finish them once the event loop is idle
+        parent.after_idle(self._setup_ui_deferred)
+
+    def _setup_ui_critical(self, parent: ttk.Frame, maximize_scrollbox: bool) -> None:
+        """Build the widgets visible when the tab first appears
+
+        Args:
+            parent: The parent frame where UI elements will be placed
+            maximize_scrollbox: Whether to maximize the scrollbox height
+        """
+        w = self.w
         # Configure parent to allow expansion
         parent.columnconfigure(0, weight=1)
         parent.rowconfigure(1, weight=1)  # Make the functions list expandable
@@ -77,18 +182,18 @@ class CustomFunctionManager:
         # Header section with instruction
         header_frame = ttk.LabelFrame(
             parent,
-            text=get_string("custom_function", "custom_functions", self.language),
+            text=_tr("custom_function", "custom_functions", self.language),
             padding=10,
         )
         header_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
         header_frame.columnconfigure(0, weight=1)
 
-        self.instruction_label = ttk.Label(
+        w.instruction_label = ttk.Label(
             header_frame,
-            text=get_string("custom_function", "custom_funcs_desc", self.language),
+            text=_tr("custom_function", "custom_funcs_desc", self.language),
             font=("TkDefaultFont", 9),
         )
-        self.instruction_label.grid(row=0, column=0, sticky="w")
+        w.instruction_label.grid(row=0, column=0, sticky="w")
 
         # Main content area with two columns
         main_frame = ttk.Frame(parent)
@@ -99,7 +204,7 @@ class CustomFunctionManager:
         # Left panel - Functions list
         list_frame = ttk.LabelFrame(
             main_frame,
-            text=get_string("custom_function", "function_list", self.language),
+            text=_tr("custom_function", "function_list", self.language),
             padding=5,
         )
         list_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 5))
@@ -113,7 +218,9 @@ class CustomFunctionManager:
         list_container.rowconfigure(0, weight=1)
         # Create Treeview for functions with checkboxes
         columns = ("enabled", "function", "range", "color")
-        self.functions_tree = ttk.Treeview(
+        self._tag_colors = None  # A new tree has no tag styles yet
+        self._tree_iids = []  # ...and none of the old tree's rows
+        w.functions_tree = ttk.Treeview(
             list_container,
             columns=columns,
             show="tree headings",
@@ -121,43 +228,41 @@ class CustomFunctionManager:
             selectmode=tk.BROWSE,
         )
         # Configure columns
-        self.functions_tree.heading("#0", text="", anchor=tk.W)
-        self.functions_tree.heading(
+        w.functions_tree.heading("#0", text="", anchor=tk.W)
+        w.functions_tree.heading(
             "enabled",
-            text=get_string("custom_function", "enabled_column", self.language),
+            text=_tr("custom_function", "enabled_column", self.language),
             anchor=tk.CENTER,
         )
-        self.functions_tree.heading(
+        w.functions_tree.heading(
             "function",
-            text=get_string("custom_function", "function_column", self.language),
+            text=_tr("custom_function", "function_column", self.language),
             anchor=tk.W,
         )
-        self.functions_tree.heading(
+        w.functions_tree.heading(
             "range",
-            text=get_string("custom_function", "range_column", self.language),
+            text=_tr("custom_function", "range_column", self.language),
             anchor=tk.CENTER,
         )
-        self.functions_tree.heading(
+        w.functions_tree.heading(
             "color",
-            text=get_string("custom_function", "color_column", self.language),
+            text=_tr("custom_function", "color_column", self.language),
             anchor=tk.CENTER,
         )
         # Set column widths
-        self.functions_tree.column("#0", width=0, stretch=False)  # Hide tree column
-        self.functions_tree.column("enabled", width=30, stretch=False)
-        self.functions_tree.column("function", width=120, stretch=False)
-        self.functions_tree.column("range", width=70, stretch=False)
-        self.functions_tree.column("color", width=60, stretch=True)
+        w.functions_tree.column("#0", width=0, stretch=False)  # Hide tree column
+        w.functions_tree.column("enabled", width=30, stretch=False)
+        w.functions_tree.column("function", width=120, stretch=False)
+        w.functions_tree.column("range", width=70, stretch=False)
+        w.functions_tree.column("color", width=60, stretch=True)
 
-        self.functions_tree.grid(row=0, column=0, sticky="nsew")
+        w.functions_tree.grid(row=0, column=0, sticky="nsew")
         # Add scrollbar
         tree_scrollbar = ttk.Scrollbar(
-            list_container, orient="vertical", command=self.functions_tree.yview
+            list_container, orient="vertical", command=w.functions_tree.yview
         )
         tree_scrollbar.grid(row=0, column=1, sticky="ns")
-        self.functions_tree.config(yscrollcommand=tree_scrollbar.set)
-        # Bind events for checkbox handling
-        self.functions_tree.bind("<Button-1>", self._on_tree_click)
+        w.functions_tree.config(yscrollcommand=tree_scrollbar.set)
         # List management buttons
         list_buttons_frame = ttk.Frame(list_frame)
         list_buttons_frame.grid(row=1, column=0, sticky="ew", pady=(5, 0))
@@ -165,34 +270,34 @@ class CustomFunctionManager:
         list_buttons_frame.columnconfigure(1, weight=1)
         list_buttons_frame.columnconfigure(2, weight=1)
 
-        self.remove_button = ttk.Button(
+        w.remove_button = ttk.Button(
             list_buttons_frame,
-            text=get_string("custom_function", "remove_selected", self.language),
+            text=_tr("custom_function", "remove_selected", self.language),
             command=self.remove_selected_function,
             width=12,
         )
-        self.remove_button.grid(row=0, column=0, padx=(0, 2), sticky="ew")
+        w.remove_button.grid(row=0, column=0, padx=(0, 2), sticky="ew")
 
-        self.clear_button = ttk.Button(
+        w.clear_button = ttk.Button(
             list_buttons_frame,
-            text=get_string("custom_function", "clear_all", self.language),
+            text=_tr("custom_function", "clear_all", self.language),
             command=self.clear_all_functions,
             width=12,
         )
-        self.clear_button.grid(row=0, column=1, padx=2, sticky="ew")
+        w.clear_button.grid(row=0, column=1, padx=2, sticky="ew")
 
-        self.plot_button = ttk.Button(
+        w.plot_button = ttk.Button(
             list_buttons_frame,
-            text=get_string("custom_function", "plot_all", self.language),
-            command=self.update_plot,
+            text=_tr("custom_function", "plot_all", self.language),
+            command=self.replot,
             width=12,
         )
-        self.plot_button.grid(row=0, column=2, padx=(2, 0), sticky="ew")
+        w.plot_button.grid(row=0, column=2, padx=(2, 0), sticky="ew")
 
         # Right panel - Function input
         input_frame = ttk.LabelFrame(
             main_frame,
-            text=get_string("custom_function", "add_function", self.language),
+            text=_tr("custom_function", "add_function", self.language),
             padding=10,
         )
         input_frame.grid(row=0, column=1, sticky="nsew")
@@ -203,47 +308,48 @@ class CustomFunctionManager:
         expr_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 10))
         expr_frame.columnconfigure(1, weight=1)
 
-        self.y_equals_label = ttk.Label(
+        w.y_equals_label = ttk.Label(
             expr_frame,
-            text=get_string("custom_function", "y_equals", self.language),
+            text=_tr("custom_function", "y_equals", self.language),
             font=("TkDefaultFont", 10, "bold"),
         )
-        self.y_equals_label.grid(row=0, column=0, padx=(0, 5), sticky="w")
+        w.y_equals_label.grid(row=0, column=0, padx=(0, 5), sticky="w")
 
-        self.function_entry = ttk.Entry(expr_frame, font=("Consolas", 10))
-        self.function_entry.grid(row=0, column=1, sticky="ew")
-        self.function_entry.bind("<Return>", lambda e: self.add_function())
+        w.function_entry = ttk.Entry(expr_frame, font=("Consolas", 10))
+        w.function_entry.grid(row=0, column=1, sticky="ew")
         example_label = ttk.Label(
             input_frame,
-            text=get_string("custom_function", "function_example", self.language),
+            text=_tr("custom_function", "function_example", self.language),
             font=("TkDefaultFont", 8),
-            foreground=theme_manager.get_adaptive_color("text_info"),
+            foreground=self._tm().get_adaptive_color("text_info"),
         )
         example_label.grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 10))
 
         # Color selection section
         color_frame = ttk.LabelFrame(
             input_frame,
-            text=get_string("custom_function", "color", self.language),
+            text=_tr("custom_function", "color", self.language),
             padding=5,
         )
         color_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(0, 10))
         color_frame.columnconfigure(1, weight=1)
 
-        self.color_button = ttk.Button(
+        w.color_button = ttk.Button(
             color_frame,
-            text=get_string("custom_function", "choose_color", self.language),
+            text=_tr("custom_function", "choose_color", self.language),
             command=self._choose_color,
             width=10,
         )
-        self.color_button.grid(row=0, column=0, padx=(0, 5))
+        w.color_button.grid(row=0, column=0, padx=(0, 5))
 
-        self.color_entry = ttk.Entry(color_frame, width=15, font=("Consolas", 9))
-        self.color_entry.grid(row=0, column=1, sticky="ew", padx=(0, 5))
-        self.color_entry.insert(0, self.selected_color)
+        self._color_var = tk.StringVar(color_frame, value=self.selected_color)
+        w.color_entry = ttk.Entry(
+            color_frame, width=15, font=("Consolas", 9), textvariable=self._color_var
+        )
+        w.color_entry.grid(row=0, column=1, sticky="ew", padx=(0, 5))
 
         # Color preview - made slightly larger
-        self.color_preview = tk.Label(
+        w.color_preview = tk.Label(
             color_frame,
             width=4,
             height=1,
@@ -251,15 +357,12 @@ class CustomFunctionManager:
             relief="solid",
             borderwidth=1,
         )
-        self.color_preview.grid(row=0, column=2, padx=(5, 0))
-
-        # Bind color entry changes to update preview
-        self.color_entry.bind("<KeyRelease>", self._update_color_preview)
+        w.color_preview.grid(row=0, column=2, padx=(5, 0))
 
         # Interval section
         interval_frame = ttk.LabelFrame(
             input_frame,
-            text=get_string("custom_function", "interval", self.language),
+            text=_tr("custom_function", "interval", self.language),
             padding=5,
         )
         interval_frame.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(0, 10))
@@ -268,23 +371,23 @@ class CustomFunctionManager:
         from_frame = ttk.Frame(interval_frame)
         from_frame.grid(row=0, column=0, sticky="ew", padx=(0, 10))
 
-        self.from_label = ttk.Label(
-            from_frame, text=get_string("custom_function", "from", self.language)
+        w.from_label = ttk.Label(
+            from_frame, text=_tr("custom_function", "from", self.language)
         )
-        self.from_label.grid(row=0, column=0, sticky="w")
-        self.x_min_entry = ttk.Entry(from_frame, width=12)
-        self.x_min_entry.grid(row=1, column=0, sticky="ew")
+        w.from_label.grid(row=0, column=0, sticky="w")
+        w.x_min_entry = ttk.Entry(from_frame, width=12)
+        w.x_min_entry.grid(row=1, column=0, sticky="ew")
 
         # To input
         to_frame = ttk.Frame(interval_frame)
         to_frame.grid(row=0, column=1, sticky="ew")
 
-        self.to_label = ttk.Label(
-            to_frame, text=get_string("custom_function", "to", self.language)
+        w.to_label = ttk.Label(
+            to_frame, text=_tr("custom_function", "to", self.language)
         )
-        self.to_label.grid(row=0, column=0, sticky="w")
-        self.x_max_entry = ttk.Entry(to_frame, width=12)
-        self.x_max_entry.grid(row=1, column=0, sticky="ew")
+        w.to_label.grid(row=0, column=0, sticky="w")
+        w.x_max_entry = ttk.Entry(to_frame, width=12)
+        w.x_max_entry.grid(row=1, column=0, sticky="ew")
         # Buttons frame for Add and Help
         buttons_frame = ttk.Frame(input_frame)
         buttons_frame.grid(row=4, column=0, columnspan=2, sticky="ew", pady=(10, 0))
@@ -292,81 +395,137 @@ class CustomFunctionManager:
         buttons_frame.columnconfigure(1, weight=0)
 
         # Add button (prominent)
-        self.add_button = ttk.Button(
+        w.add_button = ttk.Button(
             buttons_frame,
-            text=get_string("custom_function", "add_function", self.language),
+            text=_tr("custom_function", "add_function", self.language),
             command=self.add_function,
             style="Accent.TButton",
         )
-        self.add_button.grid(row=0, column=0, sticky="ew", padx=(0, 5))
+        w.add_button.grid(row=0, column=0, sticky="ew", padx=(0, 5))
+        self._buttons_frame = buttons_frame
+
+    def _setup_ui_deferred(self) -> None:
+        """Finish the UI started by _setup_ui_critical"""
+        w = self.w
+        tree = w.functions_tree
+        buttons_frame = self._buttons_frame
+        # The dialog may have been closed before the event loop went idle
+        if tree is None or buttons_frame is None or not tree.winfo_exists():
+            return
+
+        # Bind events for checkbox handling and entry shortcuts
+        tree.bind("<Button-1>", self._on_tree_click)
+        if w.function_entry:
+            w.function_entry.bind("<Return>", lambda e: self.add_function())
+        if self._color_var is not None:
+            self._color_var.trace_add("write", self._schedule_color_preview)
 
         # Help button for custom functions
         help_button = ttk.Button(
             buttons_frame,
-            text=get_string("custom_function", "help", self.language),
+            text=_tr("custom_function", "help", self.language),
             command=lambda: self.show_custom_function_help(
-                input_frame.winfo_toplevel()
+                buttons_frame.winfo_toplevel()
             ),
             width=8,
         )
         help_button.grid(row=0, column=1, sticky="e")
+        self.configure_tree_tags()
+
         # Load existing functions
         self.load_functions()
+        # A new tree starts empty; show the functions already added
+        self._rebuild_tree_view()
 
-        # Configure tree view styles for enabled/disabled items
-        self.functions_tree.tag_configure(
-            "enabled", foreground=theme_manager.get_adaptive_color("foreground")
+    def configure_tree_tags(self) -> None:
+        """Color the enabled/disabled rows from the current theme
+
+        Does nothing when the tree already has these colors, so theme
+        updates that don't change them cost no Tk calls.
+        """
+        tree = self.w.functions_tree
+        if tree is None:
+            return
+        tm = self._tm()
+        colors = (
+            tm.get_adaptive_color("foreground"),
+            tm.get_adaptive_color("text_muted"),
         )
-        self.functions_tree.tag_configure(
-            "disabled", foreground=theme_manager.get_adaptive_color("text_muted")
+        if colors == self._tag_colors:
+            return
+        try:
+            tree.tag_configure("enabled", foreground=colors[0])
+            tree.tag_configure("disabled", foreground=colors[1])
+        except tk.TclError:
+            return  # Tree already destroyed
+        self._tag_colors = colors
+
+    def _schedule_color_preview(self, *_args: Any) -> None:
+        """Coalesce edits of the color entry into one preview update"""
+        entry = self.w.color_entry
+        if entry is None:
+            return
+        if self._color_update_after is not None:
+            entry.after_cancel(self._color_update_after)
+        self._color_update_after = entry.after(
+            COLOR_PREVIEW_DELAY_MS, self._run_color_preview
         )
 
+    def _run_color_preview(self) -> None:
+        """Apply the preview update scheduled by _schedule_color_preview"""
+        self._color_update_after = None
+        entry = self.w.color_entry
+        if entry is not None and entry.winfo_exists():
+            self._update_color_preview()
+
     def _update_color_preview(self, _event: Any = None) -> None:
         """Update the color preview based on the color entry value."""
-        try:
-            if self.color_entry:
-                color = self.color_entry.get().strip()
-                if color and hasattr(self, "color_preview") and self.color_preview:
-                    # Validate color format (basic validation)
-                    if color.startswith("#") and len(color) == 7:
-                        self.color_preview.config(bg=color)
-                        self.selected_color = color
-        except (tk.TclError, AttributeError):
-            # Invalid color, keep the current color
-            pass
+        w = self.w
+        entry = w.color_entry
+        preview = w.color_preview
+        if entry is None or preview is None:
+            return
+        color = entry.get().strip()
+        # Most keystrokes leave an incomplete or unchanged color; skip Tk then
+        if color == self.selected_color or not _HEX_COLOR_RE.match(color):
+            return
+        preview.config(bg=color)
+        self.selected_color = color
 
     def _choose_color(self) -> None:
         """Abre o seletor de cores e atualiza a cor selecionada."""
-        title = get_string(
+        title = _tr(
             "custom_function", "choose_color", self.language, fallback="Choose Color"
         )
         color = colorchooser.askcolor(initialcolor=self.selected_color, title=title)
         if color and color[1]:
             self.selected_color = color[1]
-            if self.color_entry:
-                self.color_entry.delete(0, tk.END)
-                self.color_entry.insert(0, self.selected_color)
-            if hasattr(self, "color_preview") and self.color_preview:
-                self.color_preview.config(bg=self.selected_color)
+            if self._color_var is not None:
+                self._color_var.set(self.selected_color)
+            preview = self.w.color_preview
+            if preview:
+                preview.config(bg=self.selected_color)
 
     def add_function(self) -> None:
         """Adds a custom function to the list of functions to be plotted"""
+        w = self.w
         if (
-            not self.function_entry
-            or not self.color_entry
-            or not self.x_min_entry
-            or not self.x_max_entry
+            not w.function_entry
+            or not w.color_entry
+            or not w.x_min_entry
+            or not w.x_max_entry
         ):
             return
 
-        func_text = self.function_entry.get().strip()
-        color = self.color_entry.get().strip()
-        x_min_str = self.x_min_entry.get().strip()
-        x_max_str = self.x_max_entry.get().strip()
+        func_text = w.function_entry.get().strip()
+        color = w.color_entry.get().strip()
+        x_min_str = w.x_min_entry.get().strip()
+        x_max_str = w.x_max_entry.get().strip()
+        error_title = _tr("custom_function", "error", self.language, fallback="Error")
         if not func_text:
             error_handler.handle_error(
-                get_string("custom_function", "error", self.language, fallback="Error"),
-                get_string(
+                error_title,
+                _tr(
                     "custom_function",
                     "function_cannot_be_empty",
                     self.language,
@@ -375,12 +534,12 @@ class CustomFunctionManager:
             )
             return
         try:
-            x_min = float(x_min_str) if x_min_str else None
-            x_max = float(x_max_str) if x_max_str else None
+            x_min = _parse_opt_float(x_min_str)
+            x_max = _parse_opt_float(x_max_str)
         except ValueError:
             error_handler.handle_error(
-                get_string("custom_function", "error", self.language, fallback="Error"),
-                get_string(
+                error_title,
+                _tr(
                     "custom_function",
                     "invalid_interval",
                     self.language,
@@ -392,39 +551,29 @@ class CustomFunctionManager:
             func_text=func_text, color=color, x_min=x_min, x_max=x_max, enabled=True
         )
         self.functions.append(new_function)
-        if self.functions_listbox:
-            self.functions_listbox.insert(tk.END, f"{func_text} (Color: {color})")
-        if self.functions_tree:
-            item_id = str(len(self.functions) - 1)
-            checkbox = "☑"
-            range_text = self._format_function_range(self.functions[-1])
-            self.functions_tree.insert(
-                "", "end", iid=item_id, values=(checkbox, func_text, range_text, color)
+        if w.functions_tree:
+            item_id = self._new_iid()
+            self._tree_iids.append(item_id)
+            w.functions_tree.insert(
+                "",
+                "end",
+                iid=item_id,
+                values=self._tree_values(new_function),
+                tags=_ROW_TAGS[True],
             )
-            self.functions_tree.item(item_id, tags=("enabled",))
         self._save_functions()
         self.update_plot()
 
     def remove_selected_function(self) -> None:
         """Remove the selected function from the list."""
-        selected_index = -1
-        if self.functions_tree:
-            selection = self.functions_tree.selection()
-            if selection:
-                try:
-                    selected_index = int(selection[0])
-                except ValueError:
-                    pass
-        if selected_index == -1 and self.functions_listbox:
-            selected_indices: Tuple[int, ...] = self.functions_listbox.curselection()
-            if selected_indices:
-                selected_index = int(selected_indices[0])
-        if selected_index == -1:
+        tree = self.w.functions_tree
+        selection = tree.selection() if tree else ()
+        if not tree or not selection or selection[0] not in self._tree_iids:
             error_handler.handle_error(
-                get_string(
+                _tr(
                     "custom_function", "warning", self.language, fallback="Warning"
                 ),
-                get_string(
+                _tr(
                     "custom_function",
                     "no_function_selected",
                     self.language,
@@ -432,27 +581,21 @@ class CustomFunctionManager:
                 ),
             )
             return
-        try:
-            del self.functions[selected_index]
-            if self.functions_listbox:
-                self.functions_listbox.delete(selected_index)
-            if self.functions_tree:
-                self._rebuild_tree_view()
-            self._save_functions()
-            self.update_plot()
-        except (ValueError, IndexError):
-            return
+        selected_index = self._tree_iids.index(selection[0])
+        del self.functions[selected_index]
+        # Only the removed row changes; later rows keep their ids
+        tree.delete(self._tree_iids.pop(selected_index))
+        self._save_functions()
+        self.update_plot()
 
     def clear_all_functions(self) -> None:
         """Clear all custom functions."""
-        if not self.functions_listbox and not self.functions_tree:
-            return
-        if not self.functions:
+        if not self.w.functions_tree or not self.functions:
             return
 
         confirm = messagebox.askyesno(    # Pylance: tkinter dynamic type
-            get_string("custom_function", "confirm", self.language, fallback="Confirm"),
-            get_string(
+            _tr("custom_function", "confirm", self.language, fallback="Confirm"),
+            _tr(
                 "custom_function",
                 "clear_all_confirm",
                 self.language,
@@ -460,20 +603,42 @@ class CustomFunctionManager:
             ),
         )
         if confirm:
-            if self.functions_listbox:
-                self.functions_listbox.delete(0, tk.END)
-            if self.functions_tree:
-                for item in self.functions_tree.get_children():
-                    self.functions_tree.delete(item)
+            # _tree_iids holds every row, so no get_children round trip
+            if self._tree_iids:
+                self.w.functions_tree.delete(*self._tree_iids)
+                self._tree_iids.clear()
             self.functions.clear()
             self._save_functions()
             self.update_plot()
 
     def update_plot(self) -> None:
-        """Update the plot with custom functions."""
+        """Update the plot with custom functions.
+
+        Does nothing when the enabled functions are the ones already drawn.
+        """
         # Only plot enabled functions
         enabled_functions = [func for func in self.functions if func.enabled]
+        signature = tuple(
+            (func.func_text, func.color, func.x_min, func.x_max)
+            for func in enabled_functions
+        )
+        if signature == self._last_plot_signature:
+            return
         self.plot_manager.plot_custom_functions(enabled_functions)
+        self._last_plot_signature = signature
+
+    def invalidate_plot(self) -> None:
+        """Make the next update_plot redraw even if the functions are unchanged.
+
+        Call it after the custom function lines were removed from the axes
+        elsewhere, e.g. by a full replot.
+        """
+        self._last_plot_signature = None
+
+    def replot(self) -> None:
+        """Redraw the enabled custom functions unconditionally."""
+        self.invalidate_plot()
+        self.update_plot()
 
     def _save_functions(self) -> None:
         """Save functions to session."""
@@ -496,7 +661,7 @@ class CustomFunctionManager:
         Returns:
             Formatted help text describing all supported functions
         """
-        return get_string(
+        return _tr(
             "custom_function_help",
             "help_custom_functions_content",
             self.language,
@@ -506,12 +671,33 @@ class CustomFunctionManager:
     def show_custom_function_help(self, parent_window: "tk.Tk | tk.Toplevel") -> None:
         """Show help dialog for custom functions
 
+        The window is built once per parent and language; closing it only
+        hides it, so reopening is just a deiconify.
+
         Args:
             parent_window: Parent window for the dialog
         """
+        help_window = self._help_window
+        if (
+            help_window is not None
+            and help_window.winfo_exists()
+            and self._help_language == self.language
+            and help_window.master is parent_window
+        ):
+            help_window.deiconify()
+            help_window.lift()
+            help_window.grab_set()
+            help_window.focus_set()
+            return
+        if help_window is not None and help_window.winfo_exists():
+            help_window.destroy()
+
+        tm = self._tm()
+        background = tm.get_adaptive_color("background")
+        foreground = tm.get_adaptive_color("foreground")
         help_window = tk.Toplevel(parent_window)
         help_window.title(
-            get_string(
+            _tr(
                 "custom_function",
                 "help_custom_functions_title",
                 self.language,
@@ -520,7 +706,7 @@ class CustomFunctionManager:
         )
         help_window.geometry("700x600")
         help_window.resizable(True, True)
-        help_window.configure(bg=theme_manager.get_adaptive_color("background"))
+        help_window.configure(bg=background)
         help_window.transient(parent_window)
         help_window.grab_set()
         frame = ttk.Frame(help_window)
@@ -529,8 +715,8 @@ class CustomFunctionManager:
             frame,
             wrap=tk.WORD,
             font=("Consolas", 10),
-            bg=theme_manager.get_adaptive_color("background"),
-            fg=theme_manager.get_adaptive_color("foreground"),
+            bg=background,
+            fg=foreground,
         )
         scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=text_widget.yview)
         text_widget.configure(yscrollcommand=scrollbar.set)
@@ -543,111 +729,126 @@ class CustomFunctionManager:
         button_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
         close_button = ttk.Button(
             button_frame,
-            text=get_string(
+            text=_tr(
                 "custom_function", "close", self.language, fallback="Close"
             ),
-            command=help_window.destroy,
+            command=self._hide_custom_function_help,
         )
         close_button.pack(side=tk.RIGHT)
+        help_window.protocol("WM_DELETE_WINDOW", self._hide_custom_function_help)
+        self._help_window = help_window
+        self._help_language = self.language
         help_window.update_idletasks()
         x = (help_window.winfo_screenwidth() // 2) - (help_window.winfo_width() // 2)
         y = (help_window.winfo_screenheight() // 2) - (help_window.winfo_height() // 2)
         help_window.geometry(f"+{x}+{y}")
         help_window.focus_set()
 
+    def _hide_custom_function_help(self) -> None:
+        """Hide the help window, keeping it for the next time it is opened"""
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.grab_release()
+            self._help_window.withdraw()
+
     def _on_tree_click(self, event: tk.Event) -> None:
         """Handle click events on the tree view to toggle checkboxes"""
-        if not self.functions_tree:
+        tree = self.w.functions_tree
+        if not tree:
             return
 
-        # Get the clicked region
-        region = self.functions_tree.identify_region(event.x, event.y)
-
-        if region == "cell":
-            column = self.functions_tree.identify_column(event.x)
-            item = self.functions_tree.identify_row(event.y)
-            # If clicked on the enabled column (checkbox)
-            if column == "#1" and item:  # #1 is the "enabled" column
-                self._toggle_function_enabled(item)
+        # identify_row is "" below the last row and on the headings, which
+        # covers every click that isn't on a cell
+        item = tree.identify_row(event.y)
+        if not item:
+            return
+        # If clicked on the enabled column (checkbox)
+        if tree.identify_column(event.x) == "#1":  # #1 is the "enabled" column
+            self._toggle_function_enabled(item)
 
     def _toggle_function_enabled(self, item: str) -> None:
         """Toggle the enabled state of a function"""
-        try:
-            item_index = int(item)  # Tree items use 0-indexed IDs
-            if 0 <= item_index < len(self.functions):
-                # Toggle the enabled state
-                self.functions[item_index].enabled = not self.functions[
-                    item_index
-                ].enabled
-
-                # Update the tree view display
-                self._update_tree_item(item, item_index)
-
-                # Save and update plot
-                self._save_functions()
-                self.update_plot()
-        except ValueError:
-            pass
+        if item not in self._tree_iids:
+            return
+        item_index = self._tree_iids.index(item)
+        if item_index < len(self.functions):
+            # Toggle the enabled state
+            self.functions[item_index].enabled = not self.functions[
+                item_index
+            ].enabled
+
+            # Update the tree view display
+            self._update_tree_item(item, item_index)
+
+            # Save and update plot
+            self._save_functions()
+            self.update_plot()
 
     def _update_tree_item(self, item: str, index: int) -> None:
         """Update a single tree view item"""
-        if not self.functions_tree or index >= len(self.functions):
+        if not self.w.functions_tree or index >= len(self.functions):
             return
 
         func = self.functions[index]
-        checkbox = "☑" if func.enabled else "☐"
-        range_text = self._format_function_range(func)
 
-        # Update the tree item
-        self.functions_tree.item(
-            item, values=(checkbox, func.func_text, range_text, func.color)
+        # Update the tree item and its style in one call
+        self.w.functions_tree.item(
+            item, values=self._tree_values(func), tags=_ROW_TAGS[func.enabled]
         )
-        # Apply style based on enabled state
-        if func.enabled:
-            self.functions_tree.item(item, tags=("enabled",))
-        else:
-            self.functions_tree.item(item, tags=("disabled",))
 
     def _rebuild_tree_view(self) -> None:
-        """Rebuild the tree view to maintain proper indexing after changes"""
-        if not self.functions_tree:
+        """Rebuild the tree view from the function list"""
+        if not self.w.functions_tree:
             return
-            # Clear existing items
-        for item in self.functions_tree.get_children():
-            self.functions_tree.delete(item)
-            # Add all functions back
-        for i, func in enumerate(self.functions):
-            item_id = str(i)  # Use 0-indexed function index
-            checkbox = "☑" if func.enabled else "☐"
-            range_text = self._format_function_range(func)
-
-            self.functions_tree.insert(
-                "",
-                "end",
-                iid=item_id,
-                values=(checkbox, func.func_text, range_text, func.color),
-            )
-
-            # Apply appropriate style
-            if func.enabled:
-                self.functions_tree.item(item_id, tags=("enabled",))
-            else:
-                self.functions_tree.item(item_id, tags=("disabled",))
-        # Configure tag styles if not already done
-        try:
-            self.functions_tree.tag_configure("enabled", foreground="black")
-            self.functions_tree.tag_configure("disabled", foreground="gray")
-        except tk.TclError:
-            pass  # Tags might already be configured
+        tree = self.w.functions_tree
+        # Clear existing items in one call; _tree_iids lists all of them
+        if self._tree_iids:
+            tree.delete(*self._tree_iids)
+        # Add all functions back, each row with its values and style tag in
+        # a single insert; tag colors are set by configure_tree_tags
+        self._tree_iids = [self._new_iid() for _ in self.functions]
+        rows = [
+            (item_id, self._tree_values(func), _ROW_TAGS[func.enabled])
+            for item_id, func in zip(self._tree_iids, self.functions)
+        ]
+        for item_id, values, tags in rows:
+            tree.insert("", "end", iid=item_id, values=values, tags=tags)
+
+    def _tree_values(self, func: "CustomFunction") -> Tuple[str, str, str, str]:
+        """Return the (checkbox, function, range, color) values of a tree row
+
+        The tuple is kept on func and reused while its checkbox and range
+        text still match.
+        """
+        checkbox = _CHECKBOX[func.enabled]
+        range_text = self._format_function_range(func)
+        cached = func._tree_values  # pylint: disable=protected-access
+        if cached is not None and cached[0] == checkbox and cached[2] == range_text:
+            return cached
+        values = (checkbox, func.func_text, range_text, func.color)
+        func._tree_values = values  # pylint: disable=protected-access
+        return values
+
+    def _new_iid(self) -> str:
+        """Return a tree item id that has not been used before"""
+        item_id = str(self._next_iid)
+        self._next_iid += 1
+        return item_id
 
     def _format_function_range(self, func: "CustomFunction") -> str:
         """Format the range of a function for display in the tree"""
+        cached = func._display_range  # pylint: disable=protected-access
+        if cached is not None:
+            return cached
         if func.x_min is not None and func.x_max is not None:
-            return f"[{func.x_min:.1f}, {func.x_max:.1f}]"
-        if func.x_min is not None:
-            return f"[{func.x_min:.1f}, ∞)"
-        if func.x_max is not None:
-            return f"(-∞, {func.x_max:.1f}]"
-        return get_string(
+            cached = "[" + _FMT_BOUND(func.x_min) + ", " + _FMT_BOUND(func.x_max) + "]"
+        elif func.x_min is not None:
+            cached = "[" + _FMT_BOUND(func.x_min) + ", ∞)"
+        elif func.x_max is not None:
+            cached = "(-∞, " + _FMT_BOUND(func.x_max) + "]"
+        if cached is not None:
+            func._display_range = cached  # pylint: disable=protected-access
+            return cached
+        # The "Auto" text follows the language, so it is not stored on func
+        return _tr(
             "custom_function", "auto_range", self.language, fallback="Auto"
         )  # Default range determined by plot
@@ -1,93 +1,159 @@
 """Data handling module for curve fitting GUI"""
 
+import base64
+import functools
+import io
 import os
 import json
+import logging
+import mmap
+import re
+import threading
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
 from tkinter import messagebox
-from typing import Tuple, cast, Optional
+from typing import Any, Callable, Dict, List, TextIO, Tuple, cast, Optional
 from numpy.typing import NDArray
 from app_files.utils.translations.api import get_string
 
+try:
+    import orjson  # Optional faster JSON decoder
+except ImportError:
+    orjson = None
 
-def detect_3column_format(file_name: str, delimiter: Optional[str] = None) -> str:
-    """Detect the format of a 3-column data file by checking the header
+try:
+    import numba  # Optional JIT compiler for the large text file parser
+except ImportError:
+    numba = None
 
-    Args:
-        file_name: Path to the data file
-        delimiter: Delimiter character (None for whitespace)
+# x, sigma_x, y, sigma_y - columns past this are never used
+MAX_DATA_COLUMNS = 4
+# Column names of the preview DataFrame returned by read_file
+PREVIEW_COLUMNS = ("x", "sigma_x", "y", "sigma_y")
 
-    Returns:
-        Either 'x_y_sigmay' or 'x_sigmax_y' based on header detection
-    """
+# Any supported field separator, used to pull the first field off a line
+_FIRST_FIELD_SPLIT_RE = re.compile(r"[;,\s]+")
+
+# A number written with a comma or dot decimal mark, e.g. "1,5" or "-2.3e4"
+_DECIMAL_FIELD_RE = re.compile(r"^[+-]?(\d+([.,]\d+)?|\d*[.,]\d+)([eE][+-]?\d+)?$")
+
+# Column names of an x or y uncertainty, e.g. "sigma_x", "errx", "dy"
+_SIGMAX_RE = re.compile(r"sigma_?x|unc_?x|inc_?x|err_?x|dx")
+_SIGMAY_RE = re.compile(r"sigma_?y|unc_?y|inc_?y|err_?y|dy")
+# Any uncertainty-like column name
+_SIGMA_NAME_RE = re.compile(r"sigma|unc|inc|err|delta")
+
+# Byte table turning comma decimal marks into dots
+_COMMA_TO_DOT = bytes.maketrans(b",", b".")
+
+# Text files are parsed from disk in chunks of this many rows
+LARGE_FILE_CHUNK_ROWS = 100_000
+
+# Number of parsed files kept by read_file, most recently used last
+FILE_CACHE_SIZE = 4
+_FILE_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[Any, ...]]" = OrderedDict()
+_FILE_CACHE_LOCK = threading.Lock()
+
+# Text files larger than this are parsed by the numba kernel when installed
+NUMBA_PARSE_MIN_BYTES = 10 * 1024 * 1024
+
+# Powers of ten exactly representable as float64, and the largest integer
+# mantissa that is; within both a number converts with a single rounding
+_EXACT_POW10 = np.array([float(10**k) for k in range(23)])
+_MAX_EXACT_MANTISSA = 2**53
+
+
+def _first_content_line(file_name: str) -> Optional[str]:
+    """Return the first non-comment, non-empty line of a file, stripped"""
     try:
         with open(file_name, "r", encoding="utf-8") as f:
-            # Read first non-comment, non-empty line
             for line in f:
                 stripped = line.strip()
                 if stripped and not stripped.startswith("#"):
-                    # Check if this looks like a header (contains letters)
-                    if delimiter is None:
-                        parts = stripped.split()
-                    else:
-                        parts = stripped.split(delimiter)
-
-                    if len(parts) == 3:
-                        # Check for common patterns in header
-                        header_str = " ".join(parts).lower()
-
-                        # Look for sigma_x or uncertainty_x patterns
-                        if any(
-                            pattern in header_str
-                            for pattern in [
-                                "sigma_x",
-                                "unc_x",
-                                "uncx",
-                                "sigmax",
-                                "inc_x",
-                                "incx",
-                                "dx",
-                                "err_x",
-                                "errx",
-                            ]
-                        ):
-                            return "x_sigmax_y"
-
-                        # Look for sigma_y or uncertainty_y patterns (default)
-                        if any(
-                            pattern in header_str
-                            for pattern in [
-                                "sigma_y",
-                                "unc_y",
-                                "uncy",
-                                "sigmay",
-                                "inc_y",
-                                "incy",
-                                "dy",
-                                "err_y",
-                                "erry",
-                            ]
-                        ):
-                            return "x_y_sigmay"
-
-                        # Check if middle column looks like it could be sigma_x based on naming
-                        middle_col = parts[1].lower()
-                        if any(
-                            pattern in middle_col
-                            for pattern in ["sigma", "unc", "inc", "err", "delta"]
-                        ):
-                            if "x" in middle_col:
-                                return "x_sigmax_y"
-
-                    # If we get here, assume default: x, y, sigma_y
-                    break
+                    return stripped
     except Exception:
         pass
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _column_kind(name: str) -> Tuple[bool, bool]:
+    """Whether a lower-cased column name reads as (sigma_x, sigma_y)"""
+    return _SIGMAX_RE.search(name) is not None, _SIGMAY_RE.search(name) is not None
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_3column_from_header(parts: Tuple[str, ...]) -> str:
+    """3-column format from the lower-cased fields of the first line
+
+    Returns:
+        Either 'x_y_sigmay' or 'x_sigmax_y'
+    """
+    if len(parts) == 3:
+        kinds = [_column_kind(part) for part in parts]
+
+        # Look for sigma_x or uncertainty_x patterns
+        if any(is_sigmax for is_sigmax, _ in kinds):
+            return "x_sigmax_y"
+
+        # Look for sigma_y or uncertainty_y patterns (default)
+        if any(is_sigmay for _, is_sigmay in kinds):
+            return "x_y_sigmay"
+
+        # Check if middle column looks like it could be sigma_x based on naming
+        middle_col = parts[1]
+        if _SIGMA_NAME_RE.search(middle_col) is not None:
+            if "x" in middle_col:
+                return "x_sigmax_y"
 
     # Default to x, y, sigma_y format
     return "x_y_sigmay"
 
 
+# 4-column layout by (sigma_x name at position 1, sigma_x name at position 2,
+# sigma_y name at position 3); anything else is x, sigma_x, y, sigma_y
+_4COLUMN_LAYOUTS = {(False, True, True): "x_y_sigmax_sigmay"}
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_4column_from_header(parts: Tuple[str, ...]) -> str:
+    """4-column format from the lower-cased fields of the first line
+
+    Returns:
+        Either 'x_sigmax_y_sigmay' or 'x_y_sigmax_sigmay'
+    """
+    if len(parts) == 4:
+        kinds = [_column_kind(part) for part in parts]
+        return _4COLUMN_LAYOUTS.get(
+            (kinds[1][0], kinds[2][0], kinds[3][1]), "x_sigmax_y_sigmay"
+        )
+
+    # Default to standard x, sigma_x, y, sigma_y format
+    return "x_sigmax_y_sigmay"
+
+
+def _header_key(line: str, delimiter: Optional[str]) -> Tuple[str, ...]:
+    """Lower-cased fields of a header line, the detectors' cache key"""
+    return tuple(part.lower() for part in _split_fields(line, delimiter))
+
+
+def detect_3column_format(file_name: str, delimiter: Optional[str] = None) -> str:
+    """Detect the format of a 3-column data file by checking the header
+
+    Args:
+        file_name: Path to the data file
+        delimiter: Delimiter character (None for whitespace)
+
+    Returns:
+        Either 'x_y_sigmay' or 'x_sigmax_y' based on header detection
+    """
+    line = _first_content_line(file_name)
+    if line is None:
+        return "x_y_sigmay"
+    return _detect_3column_from_header(_header_key(line, delimiter))
+
+
 def detect_4column_format(file_name: str, delimiter: Optional[str] = None) -> str:
     """Detect the format of a 4-column data file by checking the header
 
@@ -98,284 +164,513 @@ def detect_4column_format(file_name: str, delimiter: Optional[str] = None) -> st
     Returns:
         Either 'x_sigmax_y_sigmay' or 'x_y_sigmax_sigmay' based on header detection
     """
+    line = _first_content_line(file_name)
+    if line is None:
+        return "x_sigmax_y_sigmay"
+    return _detect_4column_from_header(_header_key(line, delimiter))
+
+
+def _no_uncertainty(values: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Read-only zeros shaped like values, for a column the file doesn't have
+
+    A zero-stride view of one scalar: it reads like np.zeros_like(values)
+    but allocates nothing, however long the data is.
+    """
+    return np.broadcast_to(np.float64(0.0), values.shape)
+
+
+def _json_column(data: Dict[str, Any], name: str) -> NDArray[np.float64]:
+    """A column of a JSON data file as a float64 array
+
+    Besides a list of numbers under name, a column may be stored under
+    "<name>_b64" as base64 of little-endian float64 values, which is
+    decoded without parsing any numbers.
+    """
+    encoded = data.get(name + "_b64")
+    if encoded is not None:
+        return np.frombuffer(base64.b64decode(encoded), dtype="<f8").astype(
+            np.float64, copy=False
+        )
+    return np.array(data[name], dtype=np.float64)
+
+
+def _preview(
+    x: NDArray[np.float64],
+    sigma_x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    sigma_y: NDArray[np.float64],
+    build_preview: bool,
+) -> Optional[pd.DataFrame]:
+    """The preview DataFrame of the loaded columns, or None if not wanted"""
+    if not build_preview:
+        return None
+    return pd.DataFrame(
+        dict(zip(PREVIEW_COLUMNS, (x, sigma_x, y, sigma_y))), copy=False
+    )
+
+
+def _split_fields(line: str, delimiter: Optional[str]) -> List[str]:
+    """Split a data line on the delimiter, or on any whitespace when it is None"""
+    if delimiter is None:
+        return line.strip().split()
+    return line.strip().split(delimiter)
+
+
+def _find_inconsistent_line(
+    lines: List[str], delimiter: Optional[str], num_columns: int
+) -> Optional[Tuple[int, int]]:
+    """Return (index, field count) of the first line whose field count differs"""
+    if delimiter is not None and len(delimiter) == 1:
+        # Count separators on every line at once over the encoded bytes
+        # instead of splitting each line in Python
+        raw = np.frombuffer(
+            "\n".join(line.strip() for line in lines).encode("utf-8"), dtype=np.uint8
+        )
+        line_of_byte = np.cumsum(raw == ord("\n"))
+        found_counts = (
+            np.bincount(
+                line_of_byte[raw == ord(delimiter)], minlength=len(lines)
+            )
+            + 1
+        )
+        bad = np.flatnonzero(found_counts != num_columns)
+        if bad.size == 0:
+            return None
+        return int(bad[0]), int(found_counts[bad[0]])
+    for i, line in enumerate(lines):
+        found = len(_split_fields(line, delimiter))
+        if found != num_columns:
+            return i, found
+    return None
+
+
+def _read_head(f: TextIO) -> List[str]:
+    """Read lines up to and including the second non-comment, non-blank line
+
+    That is enough to skip a header and detect the delimiter and column
+    count from the first data line, without reading the rest of the file.
+    """
+    head: List[str] = []
+    found = 0
+    for line in f:
+        head.append(line)
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            found += 1
+            if found == 2:
+                break
+    return head
+
+
+def _is_header_field(field: str) -> bool:
+    """Whether the first field of a line is text (a header) rather than a number"""
+    # Of the fields starting with a letter only inf, infinity and nan are
+    # numbers, so typical header names are decided without raising
+    first = field[:1]
+    if first.isalpha() and first not in "iInN":
+        return True
     try:
-        with open(file_name, "r", encoding="utf-8") as f:
-            # Read first non-comment, non-empty line
-            for line in f:
-                stripped = line.strip()
-                if stripped and not stripped.startswith("#"):
-                    # Check if this looks like a header (contains letters)
-                    if delimiter is None:
-                        parts = stripped.split()
-                    else:
-                        parts = stripped.split(delimiter)
-
-                    if len(parts) == 4:
-                        # Convert to lowercase for comparison
-                        parts_lower = [p.lower() for p in parts]
-
-                        # Check for x, sigma_x, y, sigma_y pattern (standard)
-                        # Position 1 should have sigma_x pattern, position 3 should have sigma_y pattern
-                        has_sigmax_at_pos1 = any(
-                            pattern in parts_lower[1]
-                            for pattern in [
-                                "sigma_x",
-                                "unc_x",
-                                "uncx",
-                                "sigmax",
-                                "inc_x",
-                                "incx",
-                                "dx",
-                                "err_x",
-                                "errx",
-                            ]
-                        )
-                        has_sigmay_at_pos3 = any(
-                            pattern in parts_lower[3]
-                            for pattern in [
-                                "sigma_y",
-                                "unc_y",
-                                "uncy",
-                                "sigmay",
-                                "inc_y",
-                                "incy",
-                                "dy",
-                                "err_y",
-                                "erry",
-                            ]
-                        )
+        # Try to convert first element to float - if it fails, it's likely a header
+        float(field)
+    except ValueError:
+        return True
+    return False
 
-                        if has_sigmax_at_pos1 and has_sigmay_at_pos3:
-                            return "x_sigmax_y_sigmay"
-
-                        # Check for x, y, sigma_x, sigma_y pattern (alternative)
-                        # Position 2 should have sigma_x pattern, position 3 should have sigma_y pattern
-                        has_sigmax_at_pos2 = any(
-                            pattern in parts_lower[2]
-                            for pattern in [
-                                "sigma_x",
-                                "unc_x",
-                                "uncx",
-                                "sigmax",
-                                "inc_x",
-                                "incx",
-                                "dx",
-                                "err_x",
-                                "errx",
-                            ]
-                        )
-                        has_sigmay_at_pos3_alt = any(
-                            pattern in parts_lower[3]
-                            for pattern in [
-                                "sigma_y",
-                                "unc_y",
-                                "uncy",
-                                "sigmay",
-                                "inc_y",
-                                "incy",
-                                "dy",
-                                "err_y",
-                                "erry",
-                            ]
-                        )
 
-                        if has_sigmax_at_pos2 and has_sigmay_at_pos3_alt:
-                            return "x_y_sigmax_sigmay"
+def _filter_data_lines(all_lines: List[str]) -> Tuple[List[str], Optional[int]]:
+    """Drop comments and blank lines, and a leading header if there is one
 
-                    # If we get here, assume default: x, sigma_x, y, sigma_y
-                    break
-    except Exception:
-        pass
+    Returns:
+        The data lines and the index in all_lines of the skipped header (or None)
+    """
+    # Skip comment lines (lines starting with #) and empty lines
+    lines = []
+    first_index: Optional[int] = None
+    for index, line in enumerate(all_lines):
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            if first_index is None:
+                first_index = index
+            lines.append(line)
+
+    # If first remaining line looks like a header (contains non-numeric text), skip it
+    if lines and lines[0].strip():
+        # Split on every candidate delimiter: the rows are parsed from these
+        # lines, so a data row misread as a header would be lost
+        first_data_line = _FIRST_FIELD_SPLIT_RE.split(lines[0].strip(), maxsplit=1)
+        if _is_header_field(first_data_line[0]):
+            # First line is a header, skip it
+            return lines[1:], first_index
+    return lines, None
+
+
+def _is_whitespace_separated(line: str) -> bool:
+    """Whether a line holds whitespace-separated numbers, e.g. "1,5\t2,3"
+
+    Commas in such a line are decimal marks, not field separators.
+    """
+    fields = line.split()
+    return len(fields) >= 2 and all(_DECIMAL_FIELD_RE.match(f) for f in fields)
 
-    # Default to standard x, sigma_x, y, sigma_y format
-    return "x_sigmax_y_sigmay"
 
+def _parse_text_block(
+    text: str, delimiter: Optional[str], decimal: str
+) -> NDArray[np.float64]:
+    """Parse filtered data lines into a float array with pandas' C parser
 
-def read_file(file_name: str, language: str = "pt") -> Tuple[
-    NDArray[np.float64],
-    NDArray[np.float64],
-    NDArray[np.float64],
-    NDArray[np.float64],
-    pd.DataFrame,
-]:
-    """Read data from file
+    Args:
+        text: Data lines joined into one string
+        delimiter: Field separator, None for whitespace
+        decimal: Decimal mark used by the numbers
+
+    Raises:
+        pd.errors.ParserError: A line has more fields than the first
+        ValueError: A field is not a number in the given notation
+    """
+    return pd.read_csv(
+        io.StringIO(text),
+        sep=delimiter if delimiter is not None else r"\s+",
+        header=None,
+        comment="#",
+        decimal=decimal,
+        dtype=np.float64,
+        engine="c",
+    ).to_numpy()
+
+
+def _parse_floats(
+    buf: NDArray[np.uint8],
+    delim: int,
+    ncols: int,
+    skip_line: int,
+    out: NDArray[np.float64],
+) -> int:
+    """Parse the rows of a numeric text file from its raw bytes into out
+
+    Compiled with numba as _parse_floats_njit. Comma decimal marks are read
+    as dots unless the comma is the separator, and "#" starts a comment.
 
     Args:
-        file_name (str): Path to the data file
-        language (str, optional): UI language. Defaults to 'pt'.
+        buf: File contents
+        delim: Separator byte, or -1 for runs of spaces and tabs
+        ncols: Number of fields on every data line
+        skip_line: Index of a header line to skip, or -1
+        out: Rows are written here; needs a row per line of the file
 
     Returns:
-        Tuple containing x, sigma_x, y, sigma_y arrays and a DataFrame for preview
+        Number of rows written, or -1 when the file needs the pandas parser:
+        a malformed line, or a number that cannot be converted exactly here
     """
-
-    if not os.path.isfile(file_name):
-        messagebox.showerror(
-            get_string("data_handler", "error", language),
-            get_string("data_handler", "file_not_found", language).format(
-                file=file_name
-            ),
-        )
-        raise FileNotFoundError(
-            get_string("data_handler", "file_not_found", language).format(
-                file=file_name
+    n = buf.size
+    pos = 0
+    line = 0
+    row = 0
+    while pos < n:
+        if line == skip_line:
+            while pos < n and buf[pos] != 10:
+                pos += 1
+            pos += 1
+            line += 1
+            continue
+        while pos < n and (buf[pos] == 32 or buf[pos] == 9 or buf[pos] == 13):
+            pos += 1
+        if pos < n and buf[pos] == 35:  # comment line
+            while pos < n and buf[pos] != 10:
+                pos += 1
+        if pos >= n or buf[pos] == 10:  # blank line
+            pos += 1
+            line += 1
+            continue
+        if row >= out.shape[0]:
+            return -1
+
+        for col in range(ncols):
+            if col > 0:
+                start = pos
+                while pos < n and (buf[pos] == 32 or buf[pos] == 9):
+                    pos += 1
+                if delim >= 0:
+                    if pos >= n or buf[pos] != delim:
+                        return -1
+                    pos += 1
+                    while pos < n and (buf[pos] == 32 or buf[pos] == 9):
+                        pos += 1
+                elif pos == start:
+                    return -1
+
+            negative = False
+            if pos < n and (buf[pos] == 43 or buf[pos] == 45):
+                negative = buf[pos] == 45
+                pos += 1
+            mantissa = 0
+            scale = 0
+            has_digits = False
+            while pos < n and 48 <= buf[pos] <= 57:
+                mantissa = mantissa * 10 + (int(buf[pos]) - 48)
+                if mantissa > _MAX_EXACT_MANTISSA:
+                    return -1
+                has_digits = True
+                pos += 1
+            if pos < n and (buf[pos] == 46 or (buf[pos] == 44 and delim != 44)):
+                pos += 1
+                while pos < n and 48 <= buf[pos] <= 57:
+                    mantissa = mantissa * 10 + (int(buf[pos]) - 48)
+                    if mantissa > _MAX_EXACT_MANTISSA:
+                        return -1
+                    scale -= 1
+                    has_digits = True
+                    pos += 1
+            if not has_digits:
+                return -1
+            if pos < n and (buf[pos] == 101 or buf[pos] == 69):
+                pos += 1
+                exp_negative = False
+                if pos < n and (buf[pos] == 43 or buf[pos] == 45):
+                    exp_negative = buf[pos] == 45
+                    pos += 1
+                if pos >= n or not 48 <= buf[pos] <= 57:
+                    return -1
+                exponent = 0
+                while pos < n and 48 <= buf[pos] <= 57:
+                    if exponent < 10000:
+                        exponent = exponent * 10 + (int(buf[pos]) - 48)
+                    pos += 1
+                scale += -exponent if exp_negative else exponent
+
+            if mantissa == 0:
+                value = 0.0
+            elif 0 <= scale <= 22:
+                value = float(mantissa) * _EXACT_POW10[scale]
+            elif -22 <= scale < 0:
+                value = float(mantissa) / _EXACT_POW10[-scale]
+            else:
+                return -1
+            out[row, col] = -value if negative else value
+
+        while pos < n and (buf[pos] == 32 or buf[pos] == 9 or buf[pos] == 13):
+            pos += 1
+        if pos < n and buf[pos] == 35:
+            while pos < n and buf[pos] != 10:
+                pos += 1
+        if pos < n and buf[pos] != 10:
+            return -1
+        pos += 1
+        line += 1
+        row += 1
+    return row
+
+
+_parse_floats_njit = numba.njit(cache=True)(_parse_floats) if numba is not None else None
+
+
+def _parse_text_file_njit(
+    file_name: str,
+    delimiter: Optional[str],
+    header_index: Optional[int],
+    num_columns: int,
+) -> Optional[NDArray[np.float64]]:
+    """Parse a text file with the numba kernel, or None if it cannot"""
+    if _parse_floats_njit is None:
+        return None
+    # The kernel reads the mapped pages directly; no copy of the file is made
+    with open(file_name, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        buf = np.frombuffer(mm, dtype=np.uint8)
+        try:
+            out = np.empty((np.count_nonzero(buf == 10) + 1, num_columns))
+            rows = _parse_floats_njit(
+                buf,
+                ord(delimiter) if delimiter is not None else -1,
+                num_columns,
+                header_index if header_index is not None else -1,
+                out,
             )
-        )
+        finally:
+            # The map cannot be closed while an array still views it
+            del buf
+    if rows <= 0:
+        return None
+    return out[:rows]
+
+
+def _parse_text_file(
+    file_name: str,
+    delimiter: Optional[str],
+    header_index: Optional[int],
+    first_line: str,
+    num_columns: int,
+) -> Optional[NDArray[np.float64]]:
+    """Parse a text file straight from disk with pandas' C parser
+
+    Files over NUMBA_PARSE_MIN_BYTES go through the numba kernel first when
+    it is installed; otherwise large files are read in chunks. Only clean files take this path: comma
+    decimals are assumed throughout if the first data line uses them, and
+    None is returned on any parse problem so the caller can fall back to the
+    line-by-line reader, which reports where the file is wrong.
+    """
 
+    def read_chunks(source: "str | io.BytesIO", decimal: str) -> List[NDArray[np.float64]]:
+        with pd.read_csv(
+            source,
+            sep=delimiter if delimiter is not None else r"\s+",
+            header=None,
+            skiprows=[header_index] if header_index is not None else None,
+            comment="#",
+            decimal=decimal,
+            dtype=np.float64,
+            engine="c",
+            encoding="utf-8",
+            memory_map=isinstance(source, str),
+            chunksize=LARGE_FILE_CHUNK_ROWS,
+        ) as reader:
+            return [chunk.to_numpy() for chunk in reader]
+
+    if os.path.getsize(file_name) > NUMBA_PARSE_MIN_BYTES:
+        try:
+            dados = _parse_text_file_njit(file_name, delimiter, header_index, num_columns)
+        except Exception as e:  # numba typing/lowering errors, unmappable files
+            logging.debug("Numba parser failed, using pandas: %s", e)
+            dados = None
+        if dados is not None:
+            return dados
+
+    decimal = "," if delimiter != "," and "," in first_line else "."
+    try:
+        chunks = read_chunks(file_name, decimal)
+    except pd.errors.ParserError:
+        return None
+    except ValueError:
+        if delimiter == ",":
+            return None
+        # Likely a mix of comma and dot decimals: turn every comma into a dot
+        # in one pass over the raw bytes and parse again
+        try:
+            with open(file_name, "rb") as f:
+                raw = f.read().translate(_COMMA_TO_DOT)
+            chunks = read_chunks(io.BytesIO(raw), ".")
+        except ValueError:  # ParserError included
+            return None
+
+    if not chunks:
+        return None
+    dados = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+    if dados.shape[1] != num_columns or np.isnan(dados).any():
+        return None
+    return dados
+
+
+def _read_file_arrays(
+    file_name: str, language: str, show_error: Callable[[str, str], None]
+) -> Tuple[
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    Optional[NDArray[np.float64]],
+]:
+    """Parse a data file into x, sigma_x, y, sigma_y and the data block"""
     try:
         # Check file extension and read accordingly
         _, ext = os.path.splitext(file_name)
         ext = ext.lower()
 
         if ext in [".xlsx", ".xls"]:
-            # Excel file support
-            df: pd.DataFrame = pd.read_excel(file_name)
+            # Excel file support - peek at the header and parse only the
+            # leading columns that can hold data, skipping any extra ones
+            with pd.ExcelFile(file_name) as excel_file:
+                total_cols = len(excel_file.parse(nrows=0).columns)
+                df: pd.DataFrame = excel_file.parse(
+                    usecols=list(range(min(total_cols, MAX_DATA_COLUMNS))),
+                    dtype=np.float64,
+                )
             num_cols = len(df.columns)
+            # One float64 block; its columns are contiguous views
+            data = cast(NDArray[np.float64], df.to_numpy())
 
             if num_cols == 2:
                 # 2 columns: x, y (no uncertainties)
-                x = cast(NDArray[np.float64], df.iloc[:, 0].to_numpy(dtype=float))
-                sigma_x = np.zeros_like(x)
-                y = cast(NDArray[np.float64], df.iloc[:, 1].to_numpy(dtype=float))
-                sigma_y = np.zeros_like(y)
+                x = data[:, 0]
+                sigma_x = _no_uncertainty(x)
+                y = data[:, 1]
+                sigma_y = _no_uncertainty(y)
             elif num_cols == 3:
                 # 3 columns: detect format from column names
                 col_names = [str(col).lower() for col in df.columns]
 
                 # Check if middle column name suggests it's sigma_x
-                if any(
-                    pattern in col_names[1]
-                    for pattern in [
-                        "sigma_x",
-                        "unc_x",
-                        "uncx",
-                        "sigmax",
-                        "inc_x",
-                        "incx",
-                        "dx",
-                        "err_x",
-                        "errx",
-                    ]
-                ):
+                if _column_kind(col_names[1])[0]:
                     # Format: x, sigma_x, y
-                    x = cast(NDArray[np.float64], df.iloc[:, 0].to_numpy(dtype=float))
-                    sigma_x = cast(NDArray[np.float64], df.iloc[:, 1].to_numpy(dtype=float))
-                    y = cast(NDArray[np.float64], df.iloc[:, 2].to_numpy(dtype=float))
-                    sigma_y = np.zeros_like(y)
+                    x = data[:, 0]
+                    sigma_x = data[:, 1]
+                    y = data[:, 2]
+                    sigma_y = _no_uncertainty(y)
                 else:
                     # Format: x, y, sigma_y (default)
-                    x = cast(NDArray[np.float64], df.iloc[:, 0].to_numpy(dtype=float))
-                    sigma_x = np.zeros_like(x)
-                    y = cast(NDArray[np.float64], df.iloc[:, 1].to_numpy(dtype=float))
-                    sigma_y = cast(NDArray[np.float64], df.iloc[:, 2].to_numpy(dtype=float))
+                    x = data[:, 0]
+                    sigma_x = _no_uncertainty(x)
+                    y = data[:, 1]
+                    sigma_y = data[:, 2]
             elif num_cols >= 4:
                 # 4+ columns: detect format from column names
                 # Could be: x, sigma_x, y, sigma_y OR x, y, sigma_x, sigma_y
                 col_names = [str(col).lower() for col in df.columns]
 
                 # Check column positions for sigma_x and sigma_y patterns
-                has_sigmax_at_pos1 = any(
-                    pattern in col_names[1]
-                    for pattern in [
-                        "sigma_x",
-                        "unc_x",
-                        "uncx",
-                        "sigmax",
-                        "inc_x",
-                        "incx",
-                        "dx",
-                        "err_x",
-                        "errx",
-                    ]
-                )
-                has_sigmay_at_pos3 = any(
-                    pattern in col_names[3]
-                    for pattern in [
-                        "sigma_y",
-                        "unc_y",
-                        "uncy",
-                        "sigmay",
-                        "inc_y",
-                        "incy",
-                        "dy",
-                        "err_y",
-                        "erry",
-                    ]
-                )
-
-                has_sigmax_at_pos2 = any(
-                    pattern in col_names[2]
-                    for pattern in [
-                        "sigma_x",
-                        "unc_x",
-                        "uncx",
-                        "sigmax",
-                        "inc_x",
-                        "incx",
-                        "dx",
-                        "err_x",
-                        "errx",
-                    ]
-                )
+                has_sigmax_at_pos1 = _column_kind(col_names[1])[0]
+                has_sigmax_at_pos2 = _column_kind(col_names[2])[0]
 
                 if has_sigmax_at_pos2 and not has_sigmax_at_pos1:
                     # Format: x, y, sigma_x, sigma_y (alternative ordering)
-                    x = cast(NDArray[np.float64], df.iloc[:, 0].to_numpy(dtype=float))
-                    y = cast(NDArray[np.float64], df.iloc[:, 1].to_numpy(dtype=float))
-                    sigma_x = cast(NDArray[np.float64], df.iloc[:, 2].to_numpy(dtype=float))
-                    sigma_y = cast(NDArray[np.float64], df.iloc[:, 3].to_numpy(dtype=float))
+                    x = data[:, 0]
+                    y = data[:, 1]
+                    sigma_x = data[:, 2]
+                    sigma_y = data[:, 3]
                 else:
                     # Format: x, sigma_x, y, sigma_y (standard ordering) - DEFAULT
-                    x = cast(NDArray[np.float64], df.iloc[:, 0].to_numpy(dtype=float))
-                    sigma_x = cast(NDArray[np.float64], df.iloc[:, 1].to_numpy(dtype=float))
-                    y = cast(NDArray[np.float64], df.iloc[:, 2].to_numpy(dtype=float))
-                    sigma_y = cast(NDArray[np.float64], df.iloc[:, 3].to_numpy(dtype=float))
+                    x = data[:, 0]
+                    sigma_x = data[:, 1]
+                    y = data[:, 2]
+                    sigma_y = data[:, 3]
             else:
                 raise ValueError(
                     get_string("data_handler", "file_insufficient_columns", language)
                 )
 
-            preview_data = pd.DataFrame(
-                {"x": x, "sigma_x": sigma_x, "y": y, "sigma_y": sigma_y}
+            return (
+                x,
+                sigma_x,
+                y,
+                sigma_y,
+                data,
             )
-            return x, sigma_x, y, sigma_y, preview_data
 
         elif ext == ".json":
             # JSON file support
-            with open(file_name, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            x = np.array(data["x"], dtype=np.float64)
-            sigma_x = np.array(data["sigma_x"], dtype=np.float64)
-            y = np.array(data["y"], dtype=np.float64)
-            sigma_y = np.array(data["sigma_y"], dtype=np.float64)
-            preview_data = pd.DataFrame(
-                {"x": x, "sigma_x": sigma_x, "y": y, "sigma_y": sigma_y}
+            with open(file_name, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            x = _json_column(data, "x")
+            sigma_x = _json_column(data, "sigma_x")
+            y = _json_column(data, "y")
+            sigma_y = _json_column(data, "sigma_y")
+            return (
+                x,
+                sigma_x,
+                y,
+                sigma_y,
+                None,
             )
-            return x, sigma_x, y, sigma_y, preview_data
 
         else:
-            # Text/CSV file processing with auto-delimiter detection
+            # Text/CSV file processing with auto-delimiter detection. Only the
+            # head is read here; the data is parsed from disk below
             with open(file_name, "r", encoding="utf-8") as f:
-                all_lines = f.readlines()
-
-            # Skip comment lines (lines starting with #) and empty lines
-            lines = []
-            for line in all_lines:
-                stripped = line.strip()
-                if stripped and not stripped.startswith("#"):
-                    lines.append(line)
-
-            # If first remaining line looks like a header (contains non-numeric text), skip it
-            if lines and lines[0].strip():
-                first_data_line = lines[0].strip().split()
-                try:
-                    # Try to convert first element to float - if it fails, it's likely a header
-                    float(first_data_line[0].replace(",", "."))
-                except (ValueError, IndexError):
-                    # First line is a header, skip it
-                    lines = lines[1:]
+                head = _read_head(f)
+            lines, header_index = _filter_data_lines(head)
 
             if len(lines) == 0:
-                messagebox.showerror(get_string("data_handler", "file_read_error", language), get_string("data_handler", "file_empty_error", language))
+                show_error(get_string("data_handler", "file_read_error", language), get_string("data_handler", "file_empty_error", language))
                 raise ValueError(
                     get_string("data_handler", "file_empty_error", language)
                 )
@@ -385,153 +680,254 @@ def read_file(file_name: str, language: str = "pt") -> Tuple[
             first_line = lines[0].strip()
             if ";" in first_line and first_line.count(";") >= 1:
                 delimiter = ";"
-            elif "," in first_line and first_line.count(",") >= 1:
+            elif "," in first_line and not _is_whitespace_separated(first_line):
                 delimiter = ","
             else:
                 # For space/tab delimited, we'll use split() without arguments
                 # which handles multiple spaces/tabs
                 delimiter = None  # Will use split() for whitespace
-                # Check number of columns - support 2, 3, and 4 column formats
-            num_columns = None
-            for i, line in enumerate(lines):
-                if delimiter is None:
-                    # Use split() for whitespace (handles multiple spaces/tabs)
-                    parts = line.strip().split()
-                else:
-                    parts = line.strip().split(delimiter)
-                if num_columns is None:
-                    num_columns = len(parts)
-                    if num_columns == 1:
-                        # Single column - provide helpful guidance
-                        messagebox.showerror(
-                            get_string("data_handler", "file_read_error", language),
-                            f"{get_string('data_handler', 'file_single_column_error', language)}\n\n"
-                            + f"{get_string('data_handler', 'file_format_guidance', language)}",
-                        )
-                        raise ValueError(
-                            get_string(
-                                "data_handler", "file_single_column_error", language
-                            )
-                        )
-                    elif num_columns >= 5:
-                        # Too many columns - provide fallback suggestion
-                        messagebox.showerror(
-                            get_string("data_handler", "file_read_error", language),
-                            f"{get_string('data_handler', 'file_too_many_columns_error', language).format(cols=num_columns)}\n\n"
-                            + f"{get_string('data_handler', 'file_format_guidance', language)}",
-                        )
-                        raise ValueError(
-                            get_string(
-                                "data_handler", "file_too_many_columns_error", language
-                            ).format(cols=num_columns)
+            # Check number of columns on the first data line - support 2, 3, and 4 column formats
+            num_columns = len(_split_fields(lines[0], delimiter))
+            if num_columns == 1:
+                # Single column - provide helpful guidance
+                show_error(
+                    get_string("data_handler", "file_read_error", language),
+                    f"{get_string('data_handler', 'file_single_column_error', language)}\n\n"
+                    + f"{get_string('data_handler', 'file_format_guidance', language)}",
+                )
+                raise ValueError(
+                    get_string("data_handler", "file_single_column_error", language)
+                )
+            elif num_columns >= 5:
+                # Too many columns - provide fallback suggestion
+                show_error(
+                    get_string("data_handler", "file_read_error", language),
+                    f"{get_string('data_handler', 'file_too_many_columns_error', language).format(cols=num_columns)}\n\n"
+                    + f"{get_string('data_handler', 'file_format_guidance', language)}",
+                )
+                raise ValueError(
+                    get_string(
+                        "data_handler", "file_too_many_columns_error", language
+                    ).format(cols=num_columns)
+                )
+            elif num_columns not in [2, 3, 4]:
+                # Unexpected number of columns
+                show_error(
+                    get_string("data_handler", "file_read_error", language),
+                    get_string(
+                        "data_handler", "file_columns_error_2_3_4", language
+                    ).format(delimiter=delimiter, line=2, cols=num_columns),
+                )
+                raise ValueError(
+                    get_string(
+                        "data_handler", "file_columns_error_2_3_4", language
+                    ).format(delimiter=delimiter, line=2, cols=num_columns)
+                )
+
+            # Clean files are parsed straight from disk, without building
+            # the data text in memory
+            dados_direct = _parse_text_file(
+                file_name, delimiter, header_index, lines[0], num_columns
+            )
+            if dados_direct is None:
+                # Not a clean file; read it whole so the error can be located
+                with open(file_name, "r", encoding="utf-8") as f:
+                    lines, _ = _filter_data_lines(f.readlines())
+
+            if dados_direct is not None:
+                dados = dados_direct
+            else:
+                # Parse the filtered lines with pandas' C parser. Unless the comma is
+                # the field separator, comma decimals (detected on the first line) are
+                # converted by the parser itself; only files mixing both notations
+                # fall back to rewriting the text with dots
+                text = "".join(lines)
+                decimal = "," if delimiter != "," and "," in lines[0] else "."
+                try:
+                    try:
+                        dados: NDArray[np.float64] = _parse_text_block(
+                            text, delimiter, decimal
                         )
-                    elif num_columns not in [2, 3, 4]:
-                        # Unexpected number of columns
-                        messagebox.showerror(
+                    except ValueError:
+                        if delimiter == "," or "," not in text:
+                            raise
+                        dados = _parse_text_block(text.replace(",", "."), delimiter, ".")
+                    parse_error: Optional[Exception] = None
+                except pd.errors.ParserError as e:
+                    # A line with extra fields; locate it below for the error message
+                    dados = np.empty((0, 0))
+                    parse_error = e
+
+                # Short lines come back NaN-padded, long ones fail to parse; only then
+                # is it worth scanning line by line to report where
+                if (
+                    parse_error is not None
+                    or dados.shape[1] != num_columns
+                    or np.isnan(dados).any()
+                ):
+                    inconsistent = _find_inconsistent_line(lines, delimiter, num_columns)
+                    if inconsistent is not None:
+                        line_index, found = inconsistent
+                        show_error(
                             get_string("data_handler", "file_read_error", language),
                             get_string(
-                                "data_handler", "file_columns_error_2_3_4", language
-                            ).format(delimiter=delimiter, line=i + 2, cols=num_columns),
+                                "data_handler", "file_columns_inconsistent", language
+                            ).format(
+                                delimiter=delimiter if delimiter else "whitespace",
+                                line=line_index + 2,
+                                expected=num_columns,
+                                found=found,
+                            ),
                         )
                         raise ValueError(
                             get_string(
-                                "data_handler", "file_columns_error_2_3_4", language
-                            ).format(delimiter=delimiter, line=i + 2, cols=num_columns)
-                        )
-                elif len(parts) != num_columns:
-                    messagebox.showerror(
-                        get_string("data_handler", "file_read_error", language),
-                        get_string(
-                            "data_handler", "file_columns_inconsistent", language
-                        ).format(
-                            delimiter=delimiter if delimiter else "whitespace",
-                            line=i + 2,
-                            expected=num_columns,
-                            found=len(parts),
-                        ),
-                    )
-                    raise ValueError(
-                        get_string(
-                            "data_handler", "file_columns_inconsistent", language
-                        ).format(
-                            delimiter=delimiter if delimiter else "whitespace",
-                            line=i + 2,
-                            expected=num_columns,
-                            found=len(parts),
+                                "data_handler", "file_columns_inconsistent", language
+                            ).format(
+                                delimiter=delimiter if delimiter else "whitespace",
+                                line=line_index + 2,
+                                expected=num_columns,
+                                found=found,
+                            )
                         )
-                    )
+                    if parse_error is not None:
+                        raise parse_error
 
-            # Load data using numpy with proper comment and delimiter handling
-            if delimiter is None:
-                # For whitespace-delimited files, use None as delimiter (handles any whitespace)
-                dados: NDArray[np.str_] = np.genfromtxt(file_name, delimiter=None, comments="#", dtype=str, encoding="utf-8")
-            else:
-                dados = np.genfromtxt(file_name, delimiter=delimiter, comments="#", dtype=str, encoding="utf-8")
-            dados = np.char.replace(dados, ",", ".")
+            # The format detectors look at the first line, header or not
+            first_content_line = (
+                head[header_index] if header_index is not None else lines[0]
+            )
+
+            # Column-major so every x/sigma/y slice below is a contiguous array
+            dados = np.asfortranarray(dados)
 
             if num_columns == 2:
                 # 2 columns: x, y (no uncertainties)
-                x: NDArray[np.float64] = dados[:, 0].astype(np.float64)
-                sigma_x: NDArray[np.float64] = np.zeros_like(x)  # No uncertainty in x
-                y: NDArray[np.float64] = dados[:, 1].astype(np.float64)
-                sigma_y: NDArray[np.float64] = np.zeros_like(y)  # No uncertainty in y
-                preview_data = pd.DataFrame(
-                    {"x": x, "sigma_x": sigma_x, "y": y, "sigma_y": sigma_y}
-                )
+                x: NDArray[np.float64] = dados[:, 0]
+                sigma_x: NDArray[np.float64] = _no_uncertainty(x)  # No uncertainty in x
+                y: NDArray[np.float64] = dados[:, 1]
+                sigma_y: NDArray[np.float64] = _no_uncertainty(y)  # No uncertainty in y
             elif num_columns == 3:
                 # 3 columns: Auto-detect format based on header
                 # Could be: x, y, sigma_y OR x, sigma_x, y
-                format_type = detect_3column_format(file_name, delimiter)
+                format_type = _detect_3column_from_header(
+                    _header_key(first_content_line, delimiter)
+                )
 
                 if format_type == "x_sigmax_y":
                     # Format: x, sigma_x, y (uncertainty only in X)
-                    x = dados[:, 0].astype(np.float64)
-                    sigma_x = dados[:, 1].astype(np.float64)
-                    y = dados[:, 2].astype(np.float64)
-                    sigma_y = np.zeros_like(y)  # No uncertainty in y
-                    preview_data = pd.DataFrame(
-                        {"x": x, "sigma_x": sigma_x, "y": y, "sigma_y": sigma_y}
-                    )
+                    x = dados[:, 0]
+                    sigma_x = dados[:, 1]
+                    y = dados[:, 2]
+                    sigma_y = _no_uncertainty(y)  # No uncertainty in y
                 else:
                     # Format: x, y, sigma_y (uncertainty only in Y) - DEFAULT
-                    x = dados[:, 0].astype(np.float64)
-                    sigma_x = np.zeros_like(x)  # No uncertainty in x
-                    y = dados[:, 1].astype(np.float64)
-                    sigma_y = dados[:, 2].astype(np.float64)
-                    preview_data = pd.DataFrame(
-                        {"x": x, "sigma_x": sigma_x, "y": y, "sigma_y": sigma_y}
-                    )
+                    x = dados[:, 0]
+                    sigma_x = _no_uncertainty(x)  # No uncertainty in x
+                    y = dados[:, 1]
+                    sigma_y = dados[:, 2]
             else:
                 # 4 columns: Auto-detect format based on header
                 # Could be: x, sigma_x, y, sigma_y OR x, y, sigma_x, sigma_y
-                format_type = detect_4column_format(file_name, delimiter)
+                format_type = _detect_4column_from_header(
+                    _header_key(first_content_line, delimiter)
+                )
 
                 if format_type == "x_y_sigmax_sigmay":
                     # Format: x, y, sigma_x, sigma_y (alternative ordering)
-                    x = dados[:, 0].astype(np.float64)
-                    y = dados[:, 1].astype(np.float64)
-                    sigma_x = dados[:, 2].astype(np.float64)
-                    sigma_y = dados[:, 3].astype(np.float64)
-                    preview_data = pd.DataFrame(
-                        {"x": x, "sigma_x": sigma_x, "y": y, "sigma_y": sigma_y}
-                    )
+                    x = dados[:, 0]
+                    y = dados[:, 1]
+                    sigma_x = dados[:, 2]
+                    sigma_y = dados[:, 3]
                 else:
                     # Format: x, sigma_x, y, sigma_y (standard ordering) - DEFAULT
-                    x = dados[:, 0].astype(np.float64)
-                    sigma_x = dados[:, 1].astype(np.float64)
-                    y = dados[:, 2].astype(np.float64)
-                    sigma_y = dados[:, 3].astype(np.float64)
-                    preview_data = pd.DataFrame(
-                        {"x": x, "sigma_x": sigma_x, "y": y, "sigma_y": sigma_y}
-                    )
-
-            return x, sigma_x, y, sigma_y, preview_data
+                    x = dados[:, 0]
+                    sigma_x = dados[:, 1]
+                    y = dados[:, 2]
+                    sigma_y = dados[:, 3]
+
+            return (
+                x,
+                sigma_x,
+                y,
+                sigma_y,
+                dados,
+            )
 
     except Exception as e:
-        messagebox.showerror(
+        show_error(
             get_string("data_handler", "error", language),
             get_string("data_handler", "file_processing_error", language).format(
                 error=str(e)
             ),
         )
         raise
+
+
+def read_file(
+    file_name: str,
+    language: str = "pt",
+    error_callback: Optional[Callable[[str, str], None]] = None,
+    build_preview: bool = False,
+) -> Tuple[
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    Optional[pd.DataFrame],
+    Optional[NDArray[np.float64]],
+]:
+    """Read data from file
+
+    Args:
+        file_name (str): Path to the data file
+        language (str, optional): UI language. Defaults to 'pt'.
+        error_callback (callable, optional): Receives (title, message) for each
+            error instead of messagebox.showerror; pass one when calling from a
+            worker thread. Defaults to None.
+        build_preview (bool, optional): Build the preview DataFrame; without it
+            None is returned in its place. Defaults to False.
+
+    Parsed files are cached by path, modification time and size, so reopening
+    an unchanged file does not parse it again. The returned arrays are
+    read-only.
+
+    Returns:
+        Tuple containing x, sigma_x, y, sigma_y arrays, a DataFrame for preview
+        and the parsed data block: one column-major (rows, columns) float64
+        array in file column order, of which the returned columns are views
+        (None for JSON files)
+    """
+    show_error = error_callback or messagebox.showerror
+
+    if not os.path.isfile(file_name):
+        show_error(
+            get_string("data_handler", "error", language),
+            get_string("data_handler", "file_not_found", language).format(
+                file=file_name
+            ),
+        )
+        raise FileNotFoundError(
+            get_string("data_handler", "file_not_found", language).format(
+                file=file_name
+            )
+        )
+
+    stat = os.stat(file_name)
+    key = (os.path.realpath(file_name), stat.st_mtime_ns, stat.st_size)
+    with _FILE_CACHE_LOCK:
+        arrays = _FILE_CACHE.get(key)
+        if arrays is not None:
+            _FILE_CACHE.move_to_end(key)
+    if arrays is None:
+        arrays = _read_file_arrays(file_name, language, show_error)
+        # Cached arrays are shared between callers, so none may write to them
+        for array in arrays:
+            if array is not None:
+                array.setflags(write=False)
+        with _FILE_CACHE_LOCK:
+            _FILE_CACHE[key] = arrays
+            while len(_FILE_CACHE) > FILE_CACHE_SIZE:
+                _FILE_CACHE.popitem(last=False)
+
+    x, sigma_x, y, sigma_y, block = arrays
+    return x, sigma_x, y, sigma_y, _preview(x, sigma_x, y, sigma_y, build_preview), block
@@ -1,14 +1,18 @@
 """Graph export manager for curve fitting"""
 
+import io
 import logging
-import matplotlib.pyplot as plt
+import os
 from tkinter import filedialog, messagebox
-from typing import TYPE_CHECKING, List, Tuple, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Optional, cast
 import numpy as np
 from numpy.typing import NDArray
 from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.axes import Axes
 from matplotlib.legend import Legend as MplLegend
+from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
 
 from app_files.utils.translations.api import get_string
 
@@ -26,6 +30,93 @@ if TYPE_CHECKING:
     # save_graph_option: StringVar
 
 
+# Export formats drawn as vectors; every other format is rasterized at 300 dpi
+_VECTOR_EXTENSIONS = frozenset({".pdf", ".svg", ".svgz", ".eps", ".ps"})
+
+# Above this many points uncertainties are exported as one band and one line
+# collection instead of errorbar's per-point bars and caps
+ERRORBAR_MAX_POINTS = 500
+
+
+def _plot_uncertainties(
+    ax: Axes,
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    sigma_x: Optional[NDArray[np.float64]],
+    sigma_y: Optional[NDArray[np.float64]],
+    color: Optional[str] = None,
+) -> None:
+    """Draw many uncertainties cheaply: a y band and horizontal x whiskers
+
+    Args:
+        ax: Axes to draw on
+        x, y: Data points
+        sigma_x, sigma_y: Uncertainties, None or all zero when missing
+        color: Color of the band and whiskers, the next cycle color if None
+    """
+    if color is None:
+        color = ax._get_lines.get_next_color()  # pylint: disable=protected-access
+    if sigma_y is not None and np.any(sigma_y):
+        order = np.argsort(x, kind="stable")
+        y_sorted = y[order]
+        sigma_sorted = sigma_y[order]
+        ax.fill_between(
+            x[order],
+            y_sorted - sigma_sorted,
+            y_sorted + sigma_sorted,
+            color=color,
+            alpha=0.2,
+            linewidth=0,
+        )
+    if sigma_x is not None and np.any(sigma_x):
+        # (N, 2, 2) segment endpoints: (x - sigma_x, y) to (x + sigma_x, y)
+        segments = np.empty((len(x), 2, 2))
+        np.subtract(x, sigma_x, out=segments[:, 0, 0])
+        np.add(x, sigma_x, out=segments[:, 1, 0])
+        segments[:, 0, 1] = y
+        segments[:, 1, 1] = y
+        ax.add_collection(LineCollection(segments, colors=color, linewidths=0.8))
+        ax.autoscale_view()
+
+
+def _write_figure(fig: Figure, filepath: str, ext: str, save_kwargs: Dict[str, Any]) -> None:
+    """Render a figure in memory, then write the file with a single write
+
+    The backends emit many small writes; collecting them first also means a
+    failed render leaves no half-written file behind.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=ext[1:] or None, **save_kwargs)
+    with open(filepath, "wb") as f:
+        f.write(buffer.getbuffer())
+
+
+def _copy_axis_props(src: Axes, dst: Axes) -> None:
+    """Copy title, axis labels and scales from one axes to another"""
+    dst.set_title(src.get_title())
+    dst.set_xlabel(src.get_xlabel())
+    dst.set_ylabel(src.get_ylabel())
+    dst.set_xscale(src.get_xscale())
+    dst.set_yscale(src.get_yscale())
+
+
+def _copy_line(dst: Axes, line: Line2D, **kwargs: Any) -> None:
+    """Plot a line's data on dst with its color and line style
+
+    Args:
+        dst: Axes to draw on
+        line: Line to copy
+        **kwargs: Extra properties for the copy, e.g. marker or label
+    """
+    dst.plot(
+        line.get_xdata(),
+        line.get_ydata(),
+        color=line.get_color(),
+        linestyle=line.get_linestyle(),
+        **kwargs,
+    )
+
+
 class GraphExportManager:
     """Handles exporting and saving graphs for curve fitting"""
 
@@ -42,6 +133,74 @@ class GraphExportManager:
         self.parent = parent
         self.language = language
 
+    @staticmethod
+    def _new_export_figure(fig_size_inches: Tuple[float, float]) -> Figure:
+        """Figure for export only, drawn by Agg without pyplot or the GUI backend
+
+        It is not registered with pyplot, so it needs no plt.close and is
+        freed once the last reference to it goes.
+        """
+        # Constrained layout fits labels as the figure is drawn, without the
+        # extra render pass of tight_layout or bbox_inches="tight"
+        fig = Figure(figsize=fig_size_inches, constrained_layout=True)
+        FigureCanvasAgg(fig)
+        return fig
+
+    def _draw_data(self, ax: Axes, fmt: str, label: Optional[str]) -> None:
+        """Draw the data uncertainties (and markers unless fmt is "none")"""
+        # Data from parent, assuming types are set on AjusteCurvaFrame
+        x_data: NDArray[np.float64] = self.parent.x
+        y_data: NDArray[np.float64] = self.parent.y
+        sigma_x_data: Optional[NDArray[np.float64]] = self.parent.sigma_x
+        sigma_y_data: Optional[NDArray[np.float64]] = self.parent.sigma_y
+        if len(x_data) <= ERRORBAR_MAX_POINTS:
+            ax.errorbar(x_data, y_data, xerr=sigma_x_data, yerr=sigma_y_data, fmt=fmt, label=label)
+            return
+        color = None
+        if fmt != "none":
+            points = ax.scatter(x_data, y_data, s=9, label=label)
+            color = points.get_facecolor()[0]
+        _plot_uncertainties(ax, x_data, y_data, sigma_x_data, sigma_y_data, color=color)
+
+    def _draw_fit_and_data(self, ax: Axes) -> None:
+        """Copy every line of the main plot, with the data uncertainties"""
+        parent_ax: Axes = self.parent.ax
+        for line in parent_ax.lines:
+            _copy_line(ax, line, marker=line.get_marker(), label=line.get_label())
+        for container in parent_ax.containers:
+            if hasattr(container, "has_xerr") or hasattr(container, "has_yerr"):
+                self._draw_data(ax, "none", None)
+                break
+        _copy_axis_props(parent_ax, ax)
+        parent_legend: Optional[MplLegend] = parent_ax.legend_
+        if parent_legend:
+            ax.legend()
+
+    def _draw_only_data(self, ax: Axes) -> None:
+        """Data points with their uncertainties"""
+        self._draw_data(ax, "o", get_string("graph_export", "data_label", self.language))
+        _copy_axis_props(self.parent.ax, ax)
+        ax.legend()
+
+    def _draw_only_fit(self, ax: Axes) -> None:
+        """The marker-less (fitted curve) lines of the main plot"""
+        parent_ax: Axes = self.parent.ax
+        fit_label = get_string("graph_export", "fit_label", self.language)
+        for line in parent_ax.lines:
+            if line.get_marker() == "" or line.get_marker() is None:
+                _copy_line(ax, line, label=fit_label)
+        _copy_axis_props(parent_ax, ax)
+        ax.legend()
+
+    def _draw_only_residuals(self, ax: Axes) -> None:
+        """The residuals plot"""
+        parent_ax_res: Axes = self.parent.ax_res
+        for line in parent_ax_res.lines:
+            _copy_line(ax, line, marker=line.get_marker())
+        _copy_axis_props(parent_ax_res, ax)
+        ax.set_title(get_string("graph_export", "residuals_title", self.language))
+        ax.grid(True, linestyle="--", alpha=0.7)
+
     def save_graph(self) -> None:
         """Save graph to file"""
         try:
@@ -74,100 +233,26 @@ class GraphExportManager:
                 return
             selected: str = str(selected_option.get())  # Corrected assignment
 
+            # dpi only matters to raster output
+            ext = os.path.splitext(filepath)[1].lower()
+            save_kwargs: Dict[str, Any] = {} if ext in _VECTOR_EXTENSIONS else {"dpi": 300}
+
+            # Each option but "full" draws into a fresh figure of the same size
+            builders: Dict[str, Callable[[Axes], None]] = {
+                "fit_and_data": self._draw_fit_and_data,
+                "only_data": self._draw_only_data,
+                "only_fit": self._draw_only_fit,
+                "only_residuals": self._draw_only_residuals,
+            }
+            builder = builders.get(selected)
+            if builder is None:
+                _write_figure(self.parent.fig, filepath, ext, save_kwargs)
+                return
+
             fig_size_inches: Tuple[float, float] = cast(Tuple[float, float], tuple(self.parent.fig.get_size_inches()))
-            fig_to_save: Figure = plt.figure(figsize=fig_size_inches)
-            parent_ax: Axes = self.parent.ax
-            parent_ax_res: Axes = self.parent.ax_res
-
-            # Data from parent, assuming types are set on AjusteCurvaFrame
-            x_data: NDArray[np.float64] = self.parent.x
-            y_data: NDArray[np.float64] = self.parent.y
-            sigma_x_data: Optional[NDArray[np.float64]] = self.parent.sigma_x
-            sigma_y_data: Optional[NDArray[np.float64]] = self.parent.sigma_y
-
-            if selected == "full":
-                self.parent.fig.savefig(filepath, dpi=300, bbox_inches="tight")
-            elif selected == "fit_and_data":
-                ax: Axes = fig_to_save.add_subplot(111)
-                for line in parent_ax.lines:  # Removed # type: Line2D
-                    ax.plot(
-                        line.get_xdata(),
-                        line.get_ydata(),
-                        color=line.get_color(),
-                        linestyle=line.get_linestyle(),
-                        marker=line.get_marker(),
-                        label=line.get_label(),
-                    )
-                for container in parent_ax.containers:  # Removed # type: Container
-                    if hasattr(container, "has_xerr") or hasattr(container, "has_yerr"):
-                        ax.errorbar(x_data, y_data, xerr=sigma_x_data, yerr=sigma_y_data, fmt="none")
-                        break
-                ax.set_title(parent_ax.get_title())
-                ax.set_xlabel(parent_ax.get_xlabel())
-                ax.set_ylabel(parent_ax.get_ylabel())
-                ax.set_xscale(parent_ax.get_xscale())
-                ax.set_yscale(parent_ax.get_yscale())
-                parent_legend: Optional[MplLegend] = parent_ax.legend_
-                if parent_legend:
-                    ax.legend()
-                fig_to_save.tight_layout()
-                fig_to_save.savefig(filepath, dpi=300, bbox_inches="tight")
-                plt.close(fig_to_save)
-            elif selected == "only_data":
-                ax: Axes = fig_to_save.add_subplot(111)
-                ax.errorbar(x_data, y_data, xerr=sigma_x_data, yerr=sigma_y_data, fmt="o", label=get_string("graph_export", "data_label", self.language))
-                ax.set_title(parent_ax.get_title())
-                ax.set_xlabel(parent_ax.get_xlabel())
-                ax.set_ylabel(parent_ax.get_ylabel())
-                ax.set_xscale(parent_ax.get_xscale())
-                ax.set_yscale(parent_ax.get_yscale())
-                ax.legend()
-                fig_to_save.tight_layout()
-                fig_to_save.savefig(filepath, dpi=300, bbox_inches="tight")
-                plt.close(fig_to_save)
-            elif selected == "only_fit":
-                ax: Axes = fig_to_save.add_subplot(111)
-                for line in parent_ax.lines:  # Removed # type: Line2D
-                    # Added type ignore for the comparison if Pylance flags it
-                    if line.get_marker() == "" or line.get_marker() is None:
-                        ax.plot(
-                            line.get_xdata(),
-                            line.get_ydata(),
-                            color=line.get_color(),
-                            linestyle=line.get_linestyle(),
-                            label=get_string(
-                                "graph_export", "fit_label", self.language
-                            ),
-                        )
-                ax.set_title(parent_ax.get_title())
-                ax.set_xlabel(parent_ax.get_xlabel())
-                ax.set_ylabel(parent_ax.get_ylabel())
-                ax.set_xscale(parent_ax.get_xscale())
-                ax.set_yscale(parent_ax.get_yscale())
-                ax.legend()
-                fig_to_save.tight_layout()
-                fig_to_save.savefig(filepath, dpi=300, bbox_inches="tight")
-                plt.close(fig_to_save)
-            elif selected == "only_residuals":
-                ax: Axes = fig_to_save.add_subplot(111)
-                for line in parent_ax_res.lines:  # Removed # type: Line2D
-                    ax.plot(
-                        line.get_xdata(),
-                        line.get_ydata(),
-                        color=line.get_color(),
-                        linestyle=line.get_linestyle(),
-                        marker=line.get_marker(),
-                    )
-                ax.set_title(get_string("graph_export", "residuals_title", self.language))
-                ax.set_xlabel(parent_ax_res.get_xlabel())
-                ax.set_ylabel(parent_ax_res.get_ylabel())
-                ax.set_xscale(parent_ax_res.get_xscale())
-                ax.grid(True, linestyle="--", alpha=0.7)
-                fig_to_save.tight_layout()
-                fig_to_save.savefig(filepath, dpi=300, bbox_inches="tight")
-                plt.close(fig_to_save)
-            else:
-                self.parent.fig.savefig(filepath, dpi=300, bbox_inches="tight")
+            fig_to_save = self._new_export_figure(fig_size_inches)
+            builder(fig_to_save.add_subplot(111))
+            _write_figure(fig_to_save, filepath, ext, save_kwargs)
         except Exception as e:
             logging.error(f"Error in save_graph: {str(e)}")
             messagebox.showerror(
@@ -1,5 +1,9 @@
 """Main GUI class for curve fitting"""
 
+import ast
+import io
+import queue
+import re
 import threading
 import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
@@ -25,9 +29,13 @@ import logging
 from app_files.utils.translations.api import get_string
 from app_files.utils.theme_manager import theme_manager
 
-from app_files.gui.ajuste_curva.data_handler import read_file
+from app_files.gui.ajuste_curva.data_handler import PREVIEW_COLUMNS, read_file
 
-from app_files.gui.ajuste_curva.model_manager import ModelManager
+from app_files.gui.ajuste_curva.model_manager import (
+    ModelManager,
+    SUPPORTED_SYMPY_OBJECTS,
+    preprocess_implicit_multiplication,
+)
 from app_files.gui.ajuste_curva.plot_manager import PlotManager, BetaArray
 from app_files.gui.ajuste_curva.adjustment_points_manager import AdjustmentPointsManager
 from app_files.gui.ajuste_curva.custom_function_manager import (
@@ -45,11 +53,22 @@ from app_files.utils.user_preferences import UserPreferencesManager
 FloatArray = npt.NDArray[np.float64]
 # Adjusted ModelFunction to match ModelCallable from model_manager.py
 ModelFunction = Callable[[Sequence[float], FloatArray], FloatArray]
-DerivFunction = Callable[
-    [Sequence[float], FloatArray], FloatArray
-]  # Adjusted to match ModelCallable style
-# Corrected CreateModelReturnType: List[DerivFunction] is not Optional
-CreateModelReturnType = Tuple[Optional[ModelFunction], List[DerivFunction]]
+# Single callable returning every partial derivative (see ModelManager.create_model)
+JacobianFunction = Callable[[Sequence[float], FloatArray], List[Any]]
+CreateModelReturnType = Tuple[Optional[ModelFunction], Optional[JacobianFunction]]
+
+# Interval (ms) at which the Tk thread drains fit progress from the worker
+PROGRESS_POLL_MS = 50
+
+# Maximum number of rows rendered in the data preview text widget
+PREVIEW_MAX_ROWS = 1000
+PREVIEW_COLUMN_WIDTH = 12
+
+# Delay after the last keystroke before the equation entry is re-validated
+EQUATION_VALIDATION_DELAY_MS = 150
+
+# Characters an equation may contain; anything else is rejected before parsing
+_EQUATION_CHARS_RE = re.compile(r"^[\w\s.+\-*/()^=,<>]+$")
 
 
 class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
@@ -92,6 +111,19 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             False  # Flag to track if custom column assignment is active
         )
 
+        # Pending after() id for the debounced equation validation
+        self._equation_validation_after_id: Optional[str] = None
+        # Last validated equation text and its result, so keys that don't
+        # change the text (arrows, Shift, Ctrl) skip sympify
+        self._last_validated_equation: Optional[str] = None
+        self._last_validation_result: bool = False
+        # Right-hand side that last passed validation and its parsed form,
+        # handed to create_model so a fit doesn't sympify it again
+        self._validated_rhs: Optional[str] = None
+        self._validated_expr: Optional[sp.Expr] = None
+        # File whose background load should be applied; older loads are dropped
+        self._pending_load_file: Optional[str] = None
+
         # Initialize managers that UIBuilder's setup_ui() might depend on
         self.user_preferences = UserPreferencesManager()
         self.model_manager = ModelManager(language)
@@ -130,7 +162,11 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
         self.last_result: Any = None
         self.last_chi2: float = 0.0
         self.last_r2: float = 0.0  # Additional attributes to avoid pylint warnings
+        # Fit-curve resolution, taken from the entry when a fit starts
+        self.num_points: int = 1000
         self.custom_functions: List[CustomFunction] = []
+        # Numba JIT for the fit model, toggled from the advanced dialog
+        self.use_numba = tk.BooleanVar(value=False)
         self.adjustment_points_selection_mode: str = get_string(
             "curve_fitting", "all_points_value", self.language
         )
@@ -266,10 +302,31 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
         return self._get_ui_attr("save_graph_option")
 
     def update_data_preview(self, data: pd.DataFrame) -> None:
-        """Update data preview text widget - showing all data"""
+        """Update data preview text widget - showing up to PREVIEW_MAX_ROWS rows"""
         if self.data_text:
             self.data_text.delete(1.0, tk.END)
-            preview_str = data.to_string(index=False, float_format="%.4f")
+            # Only the visible head is formatted; large files would otherwise
+            # stall the UI while pandas stringifies every row
+            total_rows = len(data)
+            preview_rows = data.head(PREVIEW_MAX_ROWS)
+            # Format the whole block with one fixed-width row template instead of
+            # pandas' per-cell to_string formatter
+            buffer = io.StringIO()
+            np.savetxt(
+                buffer,
+                preview_rows.to_numpy(dtype=np.float64),
+                fmt=f"%{PREVIEW_COLUMN_WIDTH}.4f",
+                delimiter=" ",
+                header=" ".join(
+                    f"{name:>{PREVIEW_COLUMN_WIDTH}}" for name in preview_rows.columns
+                ),
+                comments="",
+            )
+            preview_str = buffer.getvalue().rstrip("\n")
+            if total_rows > PREVIEW_MAX_ROWS:
+                preview_str += "\n" + get_string(
+                    "curve_fitting", "preview_truncated", self.language
+                ).format(shown=PREVIEW_MAX_ROWS, total=total_rows)
             self.data_text.insert(1.0, preview_str)  # Update plot with data immediately
             self.plot_data_only()
 
@@ -306,7 +363,10 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             )
 
             logging.info(
-                f"Plotting data: {len(self.x)} points, x_scale={x_scale}, y_scale={y_scale}"
+                "Plotting data: %d points, x_scale=%s, y_scale=%s",
+                len(self.x),
+                x_scale,
+                y_scale,
             )
 
             self.plot_manager.plot_data_only(
@@ -321,19 +381,20 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 y_scale=y_scale,
             )
 
-            # Force canvas redraw
+            # The axes were cleared, so the custom functions must be drawn again
+            self.custom_function_manager.replot()
+
+            # plot_data_only already scheduled the redraw
             if hasattr(self.plot_manager, "canvas") and self.plot_manager.canvas:
-                self.plot_manager.canvas.draw_idle()
-                self.plot_manager.canvas.draw()
                 logging.info("plot_data_only completed successfully")
             else:
                 logging.error("Canvas not available for plot_data_only")
 
         except Exception as e:
-            logging.error(f"Error in plot_data_only: {e}")
+            logging.error("Error in plot_data_only: %s", e)
             import traceback
 
-            logging.error(f"plot_data_only traceback: {traceback.format_exc()}")
+            logging.error("plot_data_only traceback: %s", traceback.format_exc())
 
     def browse_file(self):
         """Open file dialog to select data file"""
@@ -360,43 +421,99 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
         if filename and self.file_entry:
             self.file_entry.delete(0, tk.END)
             self.file_entry.insert(0, filename)
-            # Automatically load data when file is selected
-            try:
-                data_tuple = read_file(filename, self.language)
-                # No cast needed if read_file has proper return type annotation and Pylance infers it
-                self.x, self.sigma_x, self.y, self.sigma_y, df = data_tuple
-
-                # Store file path and detect format for override feature
-                self.current_file_path = filename
-                self._detect_and_store_format(
-                    filename, self.x, self.sigma_x, self.y, self.sigma_y
+            # Automatically load data when file is selected; parsing runs on a
+            # worker thread so large files don't freeze the window
+            self._pending_load_file = filename
+            if self.data_text:
+                self.data_text.delete(1.0, tk.END)
+                self.data_text.insert(
+                    1.0, f"{get_string('curve_fitting', 'loading', self.language)}..."
                 )
+            threading.Thread(
+                target=self._load_file_in_background, args=(filename,), daemon=True
+            ).start()
 
-                # Reset custom assignment flag when loading a new file
-                self.using_custom_assignment = False
+    def _load_file_in_background(self, filename: str) -> None:
+        """Read a data file on a worker thread and hand the result to the Tk thread
 
-                self.update_data_preview(df)
-                with open(filename, "r", encoding="utf-8") as f:
-                    try:
-                        self.cabecalho = f.readline().strip().split("\t")
-                    except (UnicodeDecodeError, AttributeError, ValueError):
-                        self.cabecalho = [
-                            "x",
-                            "sigma_x",
-                            "y",
-                            "sigma_y",
-                        ]  # Plotar dados imediatamente após carregar
-                self.parent.after(100, self.plot_data_only)
-
-            except (
-                FileNotFoundError,
-                PermissionError,
-                IOError,
-                ValueError,
-                TypeError,
-            ) as e:  # Log the error for debugging while maintaining user experience
-                logging.debug(f"Error loading file: {e}")
-                # Error handling is already done in read_file method
+        Args:
+            filename: Path to the data file
+        """
+        errors: List[Tuple[str, str]] = []
+        try:
+            data_tuple = read_file(
+                filename,
+                self.language,
+                error_callback=lambda title, message: errors.append((title, message)),
+                build_preview=True,
+            )
+        except Exception as e:  # Log the error for debugging while maintaining user experience
+            logging.debug("Error loading file: %s", e)
+            self.after(0, self._on_file_load_failed, filename, errors)
+            return
+
+        # Column reassignment offers every column of a sheet, while read_file
+        # keeps only the leading data columns. Read them here too so the Tk
+        # thread never parses the workbook
+        if filename.lower().endswith((".xlsx", ".xls")):
+            try:
+                raw_data = pd.read_excel(filename).to_numpy(dtype=float)
+            except Exception as e:
+                logging.debug("Error reading raw Excel data: %s", e)
+                raw_data = None
+            data_tuple = data_tuple[:5] + (raw_data,)
+
+        # read_file names the columns itself, so use those names as the header
+        # instead of opening the file again
+        cabecalho = list(PREVIEW_COLUMNS)
+        self.after(0, self._on_file_loaded, filename, data_tuple, cabecalho)
+
+    def _on_file_loaded(
+        self,
+        filename: str,
+        data_tuple: Tuple[
+            npt.NDArray[np.float64],
+            npt.NDArray[np.float64],
+            npt.NDArray[np.float64],
+            npt.NDArray[np.float64],
+            Optional[pd.DataFrame],
+            Optional[npt.NDArray[np.float64]],
+        ],
+        cabecalho: List[str],
+    ) -> None:
+        """Apply a file loaded by _load_file_in_background (runs on the Tk thread)"""
+        if filename != self._pending_load_file:
+            return
+        self._pending_load_file = None
+
+        self.x, self.sigma_x, self.y, self.sigma_y, df, raw_data = data_tuple
+
+        # Store file path and detect format for override feature
+        self.current_file_path = filename
+        self._detect_and_store_format(
+            filename, self.x, self.sigma_x, self.y, self.sigma_y, raw_data
+        )
+
+        # Reset custom assignment flag when loading a new file
+        self.using_custom_assignment = False
+
+        if df is not None:
+            self.update_data_preview(df)
+        self.cabecalho = cabecalho  # Plotar dados imediatamente após carregar
+        self.parent.after(100, self.plot_data_only)
+
+    def _on_file_load_failed(
+        self, filename: str, errors: List[Tuple[str, str]]
+    ) -> None:
+        """Show the errors collected by _load_file_in_background (runs on the Tk thread)"""
+        if filename != self._pending_load_file:
+            return
+        self._pending_load_file = None
+
+        if self.data_text:
+            self.data_text.delete(1.0, tk.END)
+        for title, message in errors:
+            messagebox.showerror(title, message)
 
     def show_format_override_dialog(self):
         """Show dialog to override automatic column format detection with full flexibility"""
@@ -461,29 +578,31 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             options[4]: "ignore",
         }
 
-        for i in range(self.current_num_columns):
-            row_frame = ttk.Frame(assign_frame)
-            row_frame.pack(fill="x", pady=2)
+        # Uncertainty presence doesn't change per column, so test it once
+        has_sigma_x = not np.allclose(self.sigma_x, 0)
+        has_sigma_y = not np.allclose(self.sigma_y, 0)
 
+        for i in range(self.current_num_columns):
+            # Label and dropdown share one grid instead of a frame per row
             col_label = ttk.Label(
-                row_frame,
+                assign_frame,
                 text=f"Col {i+1}:",
                 width=7,
                 anchor="w",
                 font=("", 9),
             )
-            col_label.pack(side="left", padx=(0, 5))
+            col_label.grid(row=i, column=0, sticky="w", padx=(0, 5), pady=2)
 
             var = tk.StringVar()
             dropdown = ttk.Combobox(
-                row_frame,
+                assign_frame,
                 textvariable=var,
                 values=options,
                 state="readonly",
                 width=20,
                 font=("", 9),
             )
-            dropdown.pack(side="left", padx=0)
+            dropdown.grid(row=i, column=1, sticky="w", pady=2)
             column_vars.append(var)
 
             # Set default based on current interpretation using displayed option strings
@@ -493,14 +612,14 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 var.set(options[1])
             elif self.current_num_columns == 3:
                 # Try to detect current format
-                if not np.allclose(self.sigma_x, 0) and i == 1:
+                if has_sigma_x and i == 1:
                     var.set(options[2])
-                elif not np.allclose(self.sigma_y, 0) and i == 2:
+                elif has_sigma_y and i == 2:
                     var.set(options[3])
-                elif i == 1 and np.allclose(self.sigma_x, 0):
+                elif i == 1 and not has_sigma_x:
                     var.set(options[1])
                 elif i == 2:
-                    var.set(options[3] if np.allclose(self.sigma_x, 0) else options[1])
+                    var.set(options[1] if has_sigma_x else options[3])
             elif self.current_num_columns >= 4:
                 defaults = [options[0], options[2], options[1], options[3]]
                 if i < len(defaults):
@@ -654,12 +773,14 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
         sigma_x: npt.NDArray[np.float64],
         y: npt.NDArray[np.float64],
         sigma_y: npt.NDArray[np.float64],
+        raw_data: Optional[npt.NDArray[np.float64]] = None,
     ) -> None:
         """Detect data format and store raw data for potential re-interpretation
 
         Args:
             filename: Path to the loaded file
             x, sigma_x, y, sigma_y: The loaded data arrays
+            raw_data: Every data column of the file, parsed on the loader thread
         """
         import os
 
@@ -668,12 +789,10 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
         ext = ext.lower()
 
         try:
-            if ext in [".txt", ".csv"]:
-                # Skip comments and read raw numeric data
-                self.current_raw_data = np.genfromtxt(filename, comments="#")
-            elif ext in [".xlsx", ".xls"]:
-                df_raw = pd.read_excel(filename)
-                self.current_raw_data = df_raw.to_numpy(dtype=float)
+            if ext in [".txt", ".csv", ".xlsx", ".xls"]:
+                # Already parsed on the loader thread; never parse the file
+                # again on the Tk thread
+                self.current_raw_data = raw_data
             else:
                 # JSON or other format - can't easily re-interpret
                 self.current_raw_data = None
@@ -740,7 +859,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                     self.ui_builder.reinterpret_btn.config(state="disabled")
 
         except Exception as e:
-            logging.debug(f"Error detecting format: {e}")
+            logging.debug("Error detecting format: %s", e)
             self.current_raw_data = None
             self.current_num_columns = 0
             self.current_format = "Unknown"
@@ -778,8 +897,18 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             and hasattr(self, "modelo")
             and self.modelo is not None
         ):
-            # Replot with fit results to preserve the fit
+            # Resample just the fit curve when it is already plotted, otherwise
+            # replot with fit results to preserve the fit
             modelo_not_none = cast(ModelFunction, self.modelo)
+            if self.plot_manager.rescale_fit_results(
+                x=self.x,
+                model_func=modelo_not_none,
+                result=self.last_result,
+                num_points=self.num_points,
+                x_scale=x_scale,
+                y_scale=y_scale,
+            ):
+                return
             self.plot_manager.plot_fit_results(
                 x=self.x,
                 y=self.y,
@@ -791,12 +920,17 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 r2=self.last_r2,
                 equation=self.equacao,
                 parameters=self.parametros,
+                num_points=self.num_points,
                 x_label=x_label,
                 y_label=y_label,
                 title=title,
                 x_scale=x_scale,
                 y_scale=y_scale,
             )
+            self.custom_function_manager.replot()
+        elif self.plot_manager.ax.has_data():
+            # Data is already on the axes, only the scales need to change
+            self.plot_manager.set_scales(x_scale=x_scale, y_scale=y_scale)
         else:
             # No fit exists, just plot data
             self.plot_manager.plot_data_only(
@@ -810,6 +944,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 x_scale=x_scale,
                 y_scale=y_scale,
             )
+            self.custom_function_manager.replot()
 
     def update_graph_labels(self):
         """Update graph title and axis labels without redrawing data/fits"""
@@ -874,6 +1009,23 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             self.equation_entry.insert(0, equation)
             self.update_estimates_frame()
 
+    def schedule_equation_validation(self, _event: Optional[Any] = None) -> None:
+        """Debounce equation validation so it runs once typing pauses
+
+        Args:
+            _event: Event parameter required by tkinter binding but not used
+        """
+        if self._equation_validation_after_id is not None:
+            self.after_cancel(self._equation_validation_after_id)
+        self._equation_validation_after_id = self.after(
+            EQUATION_VALIDATION_DELAY_MS, self._run_scheduled_equation_validation
+        )
+
+    def _run_scheduled_equation_validation(self) -> None:
+        """Run the validation queued by schedule_equation_validation"""
+        self._equation_validation_after_id = None
+        self.validate_equation()
+
     def validate_equation(
         self, _event: Optional[Any] = None
     ) -> bool:  # Changed _event type hint
@@ -889,19 +1041,40 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             return False
 
         equation = self.equation_entry.get().replace("^", "**")
-        try:
-            if "=" in equation:
-                equation = equation.split("=")[1].strip()
-                # Use the comprehensive supported functions from model_manager
-                sp.sympify(equation, locals=self.model_manager.SUPPORTED_SYMPY_OBJECTS)
+        if equation != self._last_validated_equation:
+            self._last_validation_result = self._is_valid_equation(equation)
+            self._last_validated_equation = equation
+
+        if self._last_validation_result:
             # Use theme-appropriate color for valid equation
             valid_color = theme_manager.get_adaptive_color("text_valid")
             self.equation_entry.configure(foreground=valid_color)
-            return True
-        except (ValueError, TypeError, SyntaxError):
+        else:
             # Use theme-appropriate color for error
             error_color = theme_manager.get_adaptive_color("text_error")
             self.equation_entry.configure(foreground=error_color)
+        return self._last_validation_result
+
+    def _is_valid_equation(self, equation: str) -> bool:
+        """Check whether the right-hand side of an equation parses
+
+        Cheap checks (allowed characters, then Python's own parser) reject
+        typos before paying for sympify.
+        """
+        if "=" in equation:
+            equation = equation.split("=")[1].strip()
+        if not _EQUATION_CHARS_RE.match(equation):
+            return False
+        rhs = equation
+        equation = preprocess_implicit_multiplication(equation)
+        try:
+            ast.parse(equation, mode="eval")
+            # Use the comprehensive supported functions from model_manager
+            expr = sp.sympify(equation, locals=SUPPORTED_SYMPY_OBJECTS)
+            self._validated_rhs = rhs
+            self._validated_expr = cast(sp.Expr, expr)
+            return True
+        except (ValueError, TypeError, SyntaxError):
             return False
 
     def update_estimates_frame(self):
@@ -934,6 +1107,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 raise ValueError(
                     get_string("curve_fitting", "positive_points", self.language)
                 )
+            self.num_points = num_points
         except ValueError:
             messagebox.showerror(get_string("curve_fitting", "error", self.language), get_string("curve_fitting", "invalid_points", self.language))
             return
@@ -946,7 +1120,6 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 self.status_label.config(
                     text=get_string("curve_fitting", "starting_fit", self.language)
                 )
-            self.parent.update()
 
             # Clear previous results
             if self.results_text:
@@ -992,9 +1165,10 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             # Load data only if we're not using custom column assignments
             # If custom assignments are active, data is already loaded in self.x, self.y, etc.
             if not self.using_custom_assignment:
+                # Only the arrays are needed here, so no preview DataFrame
                 data_tuple = read_file(caminho, self.language)
-                # No cast needed if read_file has proper return type annotation
-                self.x, self.sigma_x, self.y, self.sigma_y, _ = data_tuple
+                self.x, self.sigma_x, self.y, self.sigma_y, _, _ = data_tuple
+                self.cabecalho = list(PREVIEW_COLUMNS)
 
             # Validate loaded data
             if len(self.x) == 0 or len(self.y) == 0:
@@ -1011,11 +1185,13 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 )
                 return
 
-            with open(caminho, "r", encoding="utf-8") as f:
-                self.cabecalho = f.readline().strip().split("\\\\t")
-
             # Create model
-            model_result_tuple = self.model_manager.create_model(equacao, self.parametros)
+            self.model_manager.use_numba = self.use_numba.get()
+            model_result_tuple = self.model_manager.create_model(
+                equacao,
+                self.parametros,
+                expr=self._validated_expr if equacao == self._validated_rhs else None,
+            )
             # Cast is appropriate here if Pylance cannot infer the precise tuple structure from create_model
             typed_model_result = cast(CreateModelReturnType, model_result_tuple)
             self.modelo, derivadas = typed_model_result
@@ -1088,6 +1264,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                             derivs=derivadas,
                             initial_params=chute,
                             max_iter=max_iter,
+                            progress_callback=progress_queue.put_nowait,
                         )  # Store results
                     self.last_result = resultado
                     self.last_chi2 = float(
@@ -1106,7 +1283,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                             self.mostrar_resultados(resultado)
                         except Exception as e:
                             logging.error(
-                                f"Error updating results display: {e}"
+                                "Error updating results display: %s", e
                             )  # Update plot with fitted results - improved approach
 
                     def update_plot_after_fit():
@@ -1182,41 +1359,18 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                                     r2=r2,
                                     equation=self.equacao,
                                     parameters=self.parametros,
+                                    num_points=self.num_points,
                                     x_label=x_label,
                                     y_label=y_label,
                                     title=title,
                                     x_scale=x_scale,
                                     y_scale=y_scale,
                                 )
+                                self.custom_function_manager.replot()
                                 logging.info("Plot update completed successfully")
 
-                                # Force multiple canvas refreshes to ensure plot is displayed
-                                try:
-                                    # Schedule multiple redraws to ensure the plot appears
-                                    self.plot_manager.canvas.draw_idle()  # Idle draw first
-                                    self.parent.update_idletasks()  # Process pending events
-                                    self.plot_manager.canvas.draw()  # Force immediate draw
-                                    self.plot_manager.canvas.flush_events()  # Flush any pending events
-                                    logging.info("Canvas draw and flush completed")
-
-                                    # Schedule an additional redraw after a short delay
-                                    def final_refresh():
-                                        try:
-                                            self.plot_manager.canvas.draw()
-                                            logging.info(
-                                                "Final canvas refresh completed"
-                                            )
-                                        except Exception as final_error:
-                                            logging.warning(
-                                                f"Final canvas refresh failed: {final_error}"
-                                            )
-
-                                    self.parent.after(50, final_refresh)
-
-                                except Exception as refresh_error:
-                                    logging.warning(
-                                        f"Could not force canvas refresh: {refresh_error}"
-                                    )
+                                # plot_fit_results schedules a draw_idle(); one
+                                # coalesced redraw is enough to show the fit
                             else:
                                 # Fallback: just redraw the canvas
                                 logging.warning(
@@ -1226,19 +1380,19 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                                     hasattr(self.plot_manager, "canvas")
                                     and self.plot_manager.canvas
                                 ):
-                                    self.plot_manager.canvas.draw()
+                                    self.plot_manager.canvas.draw_idle()
 
                         except Exception as e:
-                            logging.error(f"Error updating plot: {e}")
+                            logging.error("Error updating plot: %s", e)
                             import traceback
 
                             logging.error(
-                                f"Plot update traceback: {traceback.format_exc()}"
+                                "Plot update traceback: %s", traceback.format_exc()
                             )  # Fallback: try to just refresh the canvas
                             try:
                                 if hasattr(self, "canvas") and self.canvas:
                                     logging.info("Attempting canvas fallback refresh")
-                                    self.canvas.draw()
+                                    self.canvas.draw_idle()
                                 elif (
                                     hasattr(self, "plot_manager")
                                     and hasattr(self.plot_manager, "canvas")
@@ -1247,7 +1401,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                                     logging.info(
                                         "Attempting plot_manager canvas fallback refresh"
                                     )
-                                    self.plot_manager.canvas.draw()
+                                    self.plot_manager.canvas.draw_idle()
                                 elif hasattr(self, "plot_manager") and hasattr(
                                     self.plot_manager, "force_refresh"
                                 ):
@@ -1261,15 +1415,10 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                                     )
                             except Exception as canvas_error:
                                 logging.error(
-                                    f"Canvas refresh also failed: {canvas_error}"
+                                    "Canvas refresh also failed: %s", canvas_error
                                 )
 
                     # Schedule UI updates with improved timing
-                    def stop_progress():
-                        nonlocal progress_active
-                        progress_active = False
-
-                    self.parent.after(5, stop_progress)  # Stop progress first
                     self.parent.after(10, update_ui_after_fit)  # Update results display
                     self.parent.after(
                         200, update_plot_after_fit
@@ -1288,7 +1437,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                                     )
                                 )
                             except Exception as e:
-                                logging.error(f"Error updating status: {e}")
+                                logging.error("Error updating status: %s", e)
 
                         self.parent.after(100, update_status)
 
@@ -1323,46 +1472,41 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                             ),
                         )  # Progress update function with improved error handling
 
-            progress_active = True
+            def run_fitting_with_progress():
+                try:
+                    run_fitting()
+                finally:
+                    progress_queue.put_nowait(None)  # Fit finished
 
             def update_progress():
-                nonlocal progress_active
-                if not progress_active:
-                    return
-
+                """Drain iterations posted by the fitting thread (Tk thread only)"""
+                current_iter: Optional[int] = None
+                finished = False
                 try:
-                    if (
-                        hasattr(self, "odr")
-                        and self.odr is not None
-                        and hasattr(self.odr, "iwork")
-                        and self.odr.iwork is not None
-                    ):
-                        try:
-                            current_iter = self.odr.iwork[0]
-                            if self.progress_var:
-                                self.progress_var.set(min(100, current_iter * 10))
-                            if self.status_label:
-                                status_label = (
-                                    self.status_label
-                                )  # Local reference for thread safety
-                                status_label.config(text=f"Iteração: {current_iter}")
-                            if current_iter < max_iter and progress_active:
-                                self.parent.after(100, update_progress)
-                            else:
-                                progress_active = False
-                        except (AttributeError, IndexError, TypeError):
-                            if progress_active:
-                                self.parent.after(100, update_progress)
-                    else:
-                        # No ODR object, stop progress updates
-                        progress_active = False
-                except Exception as e:
-                    logging.debug(f"Progress update error: {e}")
-                    progress_active = False
+                    while True:
+                        item = progress_queue.get_nowait()
+                        if item is None:
+                            finished = True
+                        else:
+                            current_iter = item
+                except queue.Empty:
+                    pass
+
+                # Only touch the widgets when a new iteration arrived
+                if current_iter is not None:
+                    new_progress = min(100, current_iter * 10)
+                    if self.progress_var and self.progress_var.get() != new_progress:
+                        self.progress_var.set(new_progress)
+                    if self.status_label:
+                        self.status_label.config(text=f"Iteração: {current_iter}")
 
-            # Start progress updates
-            self.parent.after(100, update_progress)  # Start fitting in separate thread
-            threading.Thread(target=run_fitting, daemon=True).start()
+                if not finished:
+                    self.parent.after(PROGRESS_POLL_MS, update_progress)
+
+            # The fitting thread reports ODR iterations through this queue
+            progress_queue: "queue.Queue[Optional[int]]" = queue.Queue()
+            self.parent.after(PROGRESS_POLL_MS, update_progress)
+            threading.Thread(target=run_fitting_with_progress, daemon=True).start()
 
         except (
             FileNotFoundError,
@@ -1489,6 +1633,9 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
         if not self.results_text:
             return
 
+        # Collect the whole report and insert it in one go; every
+        # Text.insert pays Tk's index and tag bookkeeping
+        lines: List[str] = []
         try:
             # Clear previous results
             self.results_text.delete(1.0, tk.END)
@@ -1497,23 +1644,21 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             results_header = get_string(
                 "curve_fitting", "fit_results_header", self.language
             )
-            self.results_text.insert(tk.END, f"{results_header}\n{'='*50}\n\n")
+            lines.append(f"{results_header}\n{'='*50}\n\n")
 
             # Display equation
             if hasattr(self, "equacao") and self.equacao:
                 equation_label = get_string(
                     "curve_fitting", "equation_label", self.language
                 )
-                self.results_text.insert(
-                    tk.END, f"{equation_label}: {self.equacao}\n\n"
-                )
+                lines.append(f"{equation_label}: {self.equacao}\n\n")
 
             # Display parameter values and uncertainties
             if hasattr(resultado, "beta") and hasattr(resultado, "sd_beta"):
                 params_header = get_string(
                     "curve_fitting", "parameters_header", self.language
                 )
-                self.results_text.insert(tk.END, f"{params_header}:\n")
+                lines.append(f"{params_header}:\n")
 
                 beta_values = resultado.beta
                 sd_beta_values = getattr(resultado, "sd_beta", None)
@@ -1524,26 +1669,19 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                             param_value = beta_values[i]
                             if sd_beta_values is not None and i < len(sd_beta_values):
                                 param_error = sd_beta_values[i]
-                                self.results_text.insert(
-                                    tk.END,
-                                    f"  {param} = {param_value:.6f} ± {param_error:.6f}\n",
-                                )
+                                lines.append(f"  {param} = {param_value:.6f} ± {param_error:.6f}\n")
                             else:
-                                self.results_text.insert(
-                                    tk.END, f"  {param} = {param_value:.6f}\n"
-                                )
+                                lines.append(f"  {param} = {param_value:.6f}\n")
                 else:
                     # Fallback if parameters list is not available
                     for i, value in enumerate(beta_values):
                         if sd_beta_values is not None and i < len(sd_beta_values):
                             error = sd_beta_values[i]
-                            self.results_text.insert(
-                                tk.END, f"  p{i} = {value:.6f} ± {error:.6f}\n"
-                            )
+                            lines.append(f"  p{i} = {value:.6f} ± {error:.6f}\n")
                         else:
-                            self.results_text.insert(tk.END, f"  p{i} = {value:.6f}\n")
+                            lines.append(f"  p{i} = {value:.6f}\n")
 
-                self.results_text.insert(tk.END, "\n")
+                lines.append("\n")
 
             # Display covariance matrix if available
             if hasattr(resultado, "cov_beta") and resultado.cov_beta is not None:
@@ -1556,7 +1694,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                         self.language,
                         fallback="Covariance Matrix",
                     )
-                    self.results_text.insert(tk.END, f"{covariance_header}:\n")
+                    lines.append(f"{covariance_header}:\n")
 
                     # Display covariance matrix in a formatted way
                     n_params = cov_beta.shape[0]
@@ -1571,7 +1709,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                     else:
                         for i in range(n_params):
                             header_row += f"{'p'+str(i):>12s} "
-                    self.results_text.insert(tk.END, header_row + "\n")
+                    lines.append(header_row + "\n")
 
                     # Matrix rows
                     for i in range(n_params):
@@ -1589,20 +1727,18 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                         row_text = f"{row_label:>5s} "
                         for j in range(n_params):
                             row_text += f"{cov_beta[i, j]:>12.6e} "
-                        self.results_text.insert(tk.END, row_text + "\n")
+                        lines.append(row_text + "\n")
 
-                    self.results_text.insert(tk.END, "\n")
+                    lines.append("\n")
             # Display goodness of fit statistics
             statistics_header = get_string(
                 "curve_fitting", "statistics_header", self.language
             )
-            self.results_text.insert(tk.END, f"{statistics_header}:\n")
+            lines.append(f"{statistics_header}:\n")
 
             if hasattr(self, "last_chi2"):
                 chi2_label = get_string("curve_fitting", "chi_squared", self.language)
-                self.results_text.insert(
-                    tk.END, f"  {chi2_label}: {self.last_chi2:.4f}\n"
-                )
+                lines.append(f"  {chi2_label}: {self.last_chi2:.4f}\n")
 
                 # Reduced chi-squared if we have degrees of freedom info
                 if (
@@ -1616,13 +1752,11 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                         reduced_chi2_label = get_string(
                             "curve_fitting", "reduced_chi_squared", self.language
                         )
-                        self.results_text.insert(
-                            tk.END, f"  {reduced_chi2_label}: {reduced_chi2:.4f}\n"
-                        )
+                        lines.append(f"  {reduced_chi2_label}: {reduced_chi2:.4f}\n")
 
             if hasattr(self, "last_r2"):
                 r2_label = get_string("curve_fitting", "r_squared", self.language)
-                self.results_text.insert(tk.END, f"  {r2_label}: {self.last_r2:.4f}\n")
+                lines.append(f"  {r2_label}: {self.last_r2:.4f}\n")
 
             # Display fitting method used
             fitting_method = self.get_selected_fitting_method()
@@ -1640,12 +1774,14 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             }
             method_key = method_key_map.get(fitting_method, "odr_method")
             method_name = get_string("curve_fitting", method_key, self.language)
-            self.results_text.insert(tk.END, f"  {method_label}: {method_name}\n")
+            lines.append(f"  {method_label}: {method_name}\n")
+            self.results_text.insert(tk.END, "".join(lines))
 
         except Exception as e:
             # If there's an error displaying results, show a basic error message
             error_msg = get_string("curve_fitting", "display_error", self.language)
-            self.results_text.insert(tk.END, f"{error_msg}: {str(e)}\n")
+            lines.append(f"{error_msg}: {str(e)}\n")
+            self.results_text.insert(tk.END, "".join(lines))
 
     def on_tab_activated(self):
         """Handle tab activation event"""
@@ -1653,7 +1789,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
         # Redraw plots if needed
         if hasattr(self, "plot_manager") and self.plot_manager:
             if hasattr(self.plot_manager, "canvas"):
-                self.plot_manager.canvas.draw()
+                self.plot_manager.canvas.draw_idle()
 
     def show_advanced_config(self):
         """Show the advanced configuration dialog"""
@@ -1717,6 +1853,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
             # Clear plot
         if hasattr(self, "plot_manager") and self.plot_manager:
             self.plot_manager.initialize_empty_plot()
+            self.custom_function_manager.invalidate_plot()
             # Reset fit results
         self.last_result = None
         self.modelo = None
@@ -1733,27 +1870,11 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
 
         # Update custom function manager tree view colors
         if hasattr(self, "custom_function_manager") and self.custom_function_manager:
-            from app_files.utils.theme_manager import theme_manager
-
-            if (
-                hasattr(self.custom_function_manager, "functions_tree")
-                and self.custom_function_manager.functions_tree
-            ):
-                try:
-                    self.custom_function_manager.functions_tree.tag_configure(
-                        "enabled",
-                        foreground=theme_manager.get_adaptive_color("foreground"),
-                    )
-                    self.custom_function_manager.functions_tree.tag_configure(
-                        "disabled",
-                        foreground=theme_manager.get_adaptive_color("text_muted"),
-                    )
-                except tk.TclError:
-                    pass
+            self.custom_function_manager.configure_tree_tags()
 
     def switch_language(self, language: str) -> None:
         """Update language for this component and refresh all UI text elements"""
-        logging.info(f"AjusteCurvaFrame.switch_language called: {language}")
+        logging.info("AjusteCurvaFrame.switch_language called: %s", language)
         self.language = language
 
         # Update window title if parent is a window
@@ -1771,7 +1892,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 "curve_fitting", "controls", self.language, fallback="Controles"
             )
             self.ui_builder.control_frame.config(text=text)
-            logging.debug(f"Updated control_frame: {text}")
+            logging.debug("Updated control_frame: %s", text)
 
         if (
             hasattr(self.ui_builder, "plot_area_frame")
@@ -1781,7 +1902,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 "curve_fitting", "plot", self.language, fallback="Gráfico"
             )
             self.ui_builder.plot_area_frame.config(text=text)
-            logging.debug(f"Updated plot_area_frame: {text}")
+            logging.debug("Updated plot_area_frame: %s", text)
 
         # Update data input frames
         if hasattr(self.ui_builder, "data_frame") and self.ui_builder.data_frame:
@@ -1792,7 +1913,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 fallback="Entrada de dados",
             )
             self.ui_builder.data_frame.config(text=text)
-            logging.debug(f"Updated data_frame: {text}")
+            logging.debug("Updated data_frame: %s", text)
 
         if hasattr(self.ui_builder, "preview_frame") and self.ui_builder.preview_frame:
             text = get_string(
@@ -1802,7 +1923,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 fallback="Dados carregados",
             )
             self.ui_builder.preview_frame.config(text=text)
-            logging.debug(f"Updated preview_frame: {text}")
+            logging.debug("Updated preview_frame: %s", text)
 
         # Update LabelFrame texts
         if hasattr(self.ui_builder, "params_frame") and self.ui_builder.params_frame:
@@ -1813,7 +1934,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 fallback="Parâmetros de ajuste",
             )
             self.ui_builder.params_frame.config(text=text)
-            logging.debug(f"Updated params_frame: {text}")
+            logging.debug("Updated params_frame: %s", text)
         else:
             logging.warning("params_frame not found!")
 
@@ -1828,7 +1949,7 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                 fallback="Configurações do gráfico",
             )
             self.ui_builder.graph_settings_frame.config(text=text)
-            logging.debug(f"Updated graph_settings_frame: {text}")
+            logging.debug("Updated graph_settings_frame: %s", text)
 
         if hasattr(self.ui_builder, "actions_frame") and self.ui_builder.actions_frame:
             self.ui_builder.actions_frame.config(
@@ -1941,11 +2062,11 @@ class AjusteCurvaFrame(tk.Frame):  # Changed to inherit from tk.Frame
                     section, key, self.language, fallback=current_text
                 )
                 label.config(text=new_text)
-                logging.debug(f"Updated label '{current_text}' -> '{new_text}'")
+                logging.debug("Updated label '%s' -> '%s'", current_text, new_text)
                 break
         else:
             # Label didn't match any mapping
-            logging.debug(f"Label text '{current_text}' didn't match any mapping")
+            logging.debug("Label text '%s' didn't match any mapping", current_text)
 
     def _update_buttons(self) -> None:
         """Update all button texts"""
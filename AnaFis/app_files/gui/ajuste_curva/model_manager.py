@@ -20,13 +20,22 @@ from numpy.typing import NDArray
 
 from app_files.utils.translations.api import get_string, get_help
 
+try:
+    import numba  # Optional JIT compiler for the lambdified model
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
 # Type alias for the numerical model functions created by lambdify
 # It takes a sequence of parameter values (beta) and an array of x values,
 # and returns an array of y values.
 ModelCallable = Callable[[Sequence[float], NDArray[np.float64]], NDArray[np.float64]]
 
 from app_files.gui.ajuste_curva.models import (
+    JacobianCallable,
     ODRModelImplementation,
+    calculate_fit_statistics,
     perform_least_squares_fit,
     perform_robust_fit,
     perform_weighted_least_squares_fit,
@@ -106,6 +115,83 @@ SUPPORTED_SYMPY_OBJECTS: Dict[str, Any] = {
     "infinity": sp.oo,
 }
 
+# Implicit multiplication patterns, compiled once at import instead of on every call.
+# Functions are sorted by length (longest first) to handle overlapping names correctly
+_SORTED_FUNCTIONS = sorted(SUPPORTED_SYMPY_OBJECTS.keys(), key=len, reverse=True)
+_FUNCTION_ALTERNATION = "|".join(_SORTED_FUNCTIONS)
+_FUNCTION_PATTERN = r"\b(?:" + _FUNCTION_ALTERNATION + r")\b"
+_NUMBER_FUNCTION_RE = re.compile(rf"(\d)({_FUNCTION_ALTERNATION})\b")
+_NUMBER_VARIABLE_RE = re.compile(rf"(\d)([a-zA-Z])(?!{_FUNCTION_PATTERN})")
+_VARIABLE_PAREN_RE = re.compile(rf"(\b[a-zA-Z]\b)(?!{_FUNCTION_PATTERN})\(")
+_PAREN_PAREN_RE = re.compile(r"\)\(")
+_PAREN_ALNUM_RE = re.compile(r"\)([a-zA-Z0-9])")
+_NUMBER_PAREN_RE = re.compile(r"(\d)\(")
+_PAREN_FUNCTION_RE = re.compile(rf"(\))((?:{_FUNCTION_ALTERNATION})\b)")
+
+# Modules for lambdify: scipy.special covers factorial, gamma, polygamma...
+# which the numpy printer leaves as names that fail on arrays
+LAMBDIFY_MODULES = ["scipy", "numpy"]
+
+# Independent variable shared by every model, created once instead of per call
+X_SYMBOL: sp.Symbol = sp.Symbol("x")
+
+
+def _jit_model(func: ModelCallable) -> ModelCallable:
+    """Compile a lambdified model with numba, falling back to the original.
+
+    Compilation is lazy, so the first call decides: if numba cannot type the
+    expression the plain numpy function is used from then on. The fastmath
+    flags leave out nnan/ninf, since ODR may step where log(x) or a*x**b is
+    NaN or inf.
+    """
+    compiled = numba.njit(fastmath={"nsz", "arcp", "contract", "afn", "reassoc"})(func)
+    state: Dict[str, ModelCallable] = {"func": compiled}
+
+    def model(parameters: Sequence[float], x: NDArray[np.float64]) -> NDArray[np.float64]:
+        if state["func"] is func:
+            return func(parameters, x)
+        try:
+            return state["func"](
+                np.asarray(parameters, dtype=np.float64),
+                np.asarray(x, dtype=np.float64),
+            )
+        except Exception as e:  # numba typing/lowering errors
+            logging.debug("Numba compilation failed, using numpy model: %s", e)
+            state["func"] = func
+            return func(parameters, x)
+
+    return model
+
+
+def _lambdify_jacobian(
+    expr: sp.Expr, parameters: List[sp.Symbol], x_sym: sp.Symbol
+) -> Optional[JacobianCallable]:
+    """Analytic Jacobian [df/dp_1, ..., df/dp_n, df/dx] of a model, if numpy can evaluate it
+
+    Non-smooth functions (abs, floor, sign, heaviside) and special functions
+    such as factorial differentiate into terms numpy cannot print or
+    evaluate. For those None is returned and ODRPACK uses finite differences.
+    """
+    try:
+        derivadas_expr: List[sp.Expr] = [
+            cast(sp.Expr, sp.diff(expr, s)) for s in (*parameters, x_sym)
+        ]
+        # cse=True shares common subexpressions, so all derivatives are
+        # evaluated in one call instead of one lambdified function each
+        jacobian: JacobianCallable = sp.lambdify(
+            (parameters, x_sym), derivadas_expr, LAMBDIFY_MODULES, cse=True
+        )
+        # Undefined names and non-numeric results only show up when called
+        with np.errstate(all="ignore"):
+            for derivative in jacobian(
+                np.ones(len(parameters)), np.array([0.5, 1.0, 1.5])
+            ):
+                np.asarray(derivative, dtype=np.float64)
+    except Exception as e:  # sympy printing errors, NameError, TypeError...
+        logging.debug("No analytic Jacobian, using finite differences: %s", e)
+        return None
+    return jacobian
+
 
 def preprocess_implicit_multiplication(expression: str) -> str:
     """
@@ -134,35 +220,30 @@ def preprocess_implicit_multiplication(expression: str) -> str:
 
     # Step 2: Handle implicit multiplication before function substitution
     # This avoids conflicts with the sp. prefixes
-    math_functions = list(SUPPORTED_SYMPY_OBJECTS.keys())
 
     # Pattern 1: Number followed by function name (e.g., 2sin, 3cos)
-    # Sort functions by length (longest first) to handle overlapping names correctly
-    sorted_functions = sorted(math_functions, key=len, reverse=True)
-    for func in sorted_functions:
-        expr = re.sub(rf"(\d)({func})\b", r"\1*\2", expr)
+    expr = _NUMBER_FUNCTION_RE.sub(r"\1*\2", expr)
 
     # Pattern 2: Number followed by variable (e.g., 3x, 2y)
     # Look for digit followed by single letter that's not a function name
-    function_pattern = r"\b(?:" + "|".join(sorted_functions) + r")\b"
-    expr = re.sub(rf"(\d)([a-zA-Z])(?!" + function_pattern + r")", r"\1*\2", expr)
+    expr = _NUMBER_VARIABLE_RE.sub(r"\1*\2", expr)
 
     # Pattern 3: Single variable followed by opening parenthesis (e.g., x(, y()
     # But not function names - be very specific: single letter variables only
-    expr = re.sub(r"(\b[a-zA-Z]\b)(?!" + function_pattern + r")\(", r"\1*(", expr)
+    expr = _VARIABLE_PAREN_RE.sub(r"\1*(", expr)
 
     # Pattern 4: Closing parenthesis followed by opening parenthesis (e.g., )(
-    expr = re.sub(r"\)\(", r")*(", expr)
+    expr = _PAREN_PAREN_RE.sub(r")*(", expr)
 
     # Pattern 5: Closing parenthesis followed by letter or number (e.g., )x, )2
-    expr = re.sub(r"\)([a-zA-Z0-9])", r")*\1", expr)
+    expr = _PAREN_ALNUM_RE.sub(r")*\1", expr)
 
     # Pattern 6: Number followed by opening parenthesis (e.g., 2(, 3()
-    expr = re.sub(r"(\d)\(", r"\1*(", expr)
+    expr = _NUMBER_PAREN_RE.sub(r"\1*(", expr)
 
     # Pattern 7: Function followed by function (e.g., sin(x)cos(x))
     # This handles cases like sin(x)cos(x) -> sin(x)*cos(x)
-    expr = re.sub(rf"(\))((?:" + "|".join(sorted_functions) + r")\b)", r"\1*\2", expr)
+    expr = _PAREN_FUNCTION_RE.sub(r"\1*\2", expr)
 
     return expr
 
@@ -170,7 +251,7 @@ def preprocess_implicit_multiplication(expression: str) -> str:
 class ModelManager:
     """Manages mathematical models for curve fitting"""
 
-    model_cache: Dict[str, Tuple[ModelCallable, List[ModelCallable]]]
+    model_cache: Dict[str, Tuple[ModelCallable, Optional[JacobianCallable]]]
     preset_models: Dict[str, str]
 
     def __init__(self, language: str = "pt") -> None:
@@ -181,6 +262,9 @@ class ModelManager:
         """
         self.language = language
         self.model_cache = {}
+        # JIT-compile models with numba (only if installed); opt-in from the
+        # advanced dialog, copied here by perform_fit
+        self.use_numba = False
         # Initialize preset models from translations
         import json
 
@@ -208,33 +292,49 @@ class ModelManager:
             self.preset_models = {"Linear: a*x + b": "a*x + b"}  # Simple fallback
 
     def create_model(
-        self, equation: str, parameters: List[sp.Symbol]
-    ) -> Tuple[ModelCallable, List[ModelCallable]]:
+        self,
+        equation: str,
+        parameters: List[sp.Symbol],
+        expr: Optional[sp.Expr] = None,
+    ) -> Tuple[ModelCallable, Optional[JacobianCallable]]:
         """Create numerical model with caching
 
         Args:
             equation (str): The equation to model
             parameters (List[sp.Symbol]): List of parameters
+            expr (Optional[sp.Expr]): The equation already parsed, e.g. during
+                validation; parsed here when not given
 
         Returns:
-            Tuple containing the model function and its derivatives
+            Tuple containing the model function and a single callable
+            returning [df/dp_1, ..., df/dp_n, df/dx], or None when the
+            derivatives cannot be evaluated numerically
         """
         # Check cache first
+        use_numba = self.use_numba and NUMBA_AVAILABLE
         cache_key: str = f"{equation}-{'-'.join(str(p) for p in parameters)}"
+        if use_numba:
+            cache_key += "-jit"
         if cache_key in self.model_cache:
             return self.model_cache[cache_key]
 
-        x_sym: sp.Symbol = sp.Symbol("x")
+        x_sym = X_SYMBOL
 
-        # Preprocess the equation to handle implicit multiplication
-        preprocessed_equation = preprocess_implicit_multiplication(equation)
-        # Use comprehensive function dictionary for parsing
-        expr: sp.Expr = cast(sp.Expr, sp.sympify(preprocessed_equation, locals=SUPPORTED_SYMPY_OBJECTS))
-        derivadas_expr: List[sp.Expr] = [cast(sp.Expr, sp.diff(expr, p)) for p in parameters]
+        if expr is None:
+            # Preprocess the equation to handle implicit multiplication
+            preprocessed_equation = preprocess_implicit_multiplication(equation)
+            # Use comprehensive function dictionary for parsing
+            expr = cast(sp.Expr, sp.sympify(preprocessed_equation, locals=SUPPORTED_SYMPY_OBJECTS))
         # Lambdify expects parameters as the first argument (a sequence), and x as the second.
-        # The 'numpy' module ensures numpy functions are used for operations.
-        modelo_numerico: ModelCallable = sp.lambdify((parameters, x_sym), expr, "numpy")
-        derivadas_numericas: List[ModelCallable] = [sp.lambdify((parameters, x_sym), d, "numpy") for d in derivadas_expr]
+        # numpy functions are used for operations, scipy.special for the
+        # special functions numpy lacks
+        modelo_numerico: ModelCallable = sp.lambdify(
+            (parameters, x_sym), expr, LAMBDIFY_MODULES, cse=True
+        )
+        derivadas_numericas = _lambdify_jacobian(expr, parameters, x_sym)
+        # The Jacobian mixes scalars and arrays, so only the model is compiled
+        if use_numba:
+            modelo_numerico = _jit_model(modelo_numerico)
         # Cache the result
         self.model_cache[cache_key] = (modelo_numerico, derivadas_numericas)
         return modelo_numerico, derivadas_numericas
@@ -258,7 +358,7 @@ class ModelManager:
         else:
             equation_rhs = preprocessed_equation
 
-        x_sym: sp.Symbol = sp.Symbol("x")
+        x_sym = X_SYMBOL
         # Use comprehensive function dictionary for parsing
         expr: sp.Expr = cast(sp.Expr, sp.sympify(equation_rhs, locals=SUPPORTED_SYMPY_OBJECTS))
         # Identify free symbols in the expression
@@ -280,9 +380,10 @@ class ModelManager:
         sigma_x: Optional[NDArray[np.float64]],
         sigma_y: Optional[NDArray[np.float64]],
         model_func: ModelCallable,
-        derivs: List[ModelCallable],
+        derivs: Optional[JacobianCallable],
         initial_params: List[float],
         max_iter: int,
+        progress_callback: Optional[Callable[[int], None]] = None,
     ) -> Tuple[Output, float, float]:
         """Perform ODR fitting
 
@@ -290,18 +391,26 @@ class ModelManager:
             x, y: Data arrays (numpy.ndarray)
             sigma_x, sigma_y: Standard deviations for x and y (numpy.ndarray or None)
             model_func: Model function (callable)
-            derivs: List of derivative functions (list of callables)
+            derivs: Jacobian callable returned by create_model, None to let
+                ODRPACK use finite differences
             initial_params: Initial parameter estimates (list of floats)
             max_iter: Maximum number of iterations (int)
+            progress_callback: Called with the iteration number as ODR
+                progresses (runs on the fitting thread)
 
         Returns:
             Tuple containing (ODR result object, chi-squared, R-squared)
         """
 
-        # Create ODR model using the custom implementation
-        # The type ignore is kept because ODRModelImplementation might have a more generic internal signature
-        # that Pylance tries to match strictly, while ModelCallable is specific to lambdify's output.
-        modelo_odr = Model(ODRModelImplementation(model_func, derivs))
+        # Create ODR model using the custom implementation, with the analytic
+        # Jacobians when there are any so ODRPACK skips finite differences
+        implementacao = ODRModelImplementation(model_func, derivs, progress_callback)
+        if derivs is not None:
+            modelo_odr = Model(
+                implementacao, fjacb=implementacao.fjacb, fjacd=implementacao.fjacd
+            )
+        else:
+            modelo_odr = Model(implementacao)
         # Prepare uncertainties for ODR
         # Handle cases where only Y uncertainties are provided (sigma_x is None or zeros)
         # ODR works fine with only Y uncertainties, but we need to handle sigma_x properly
@@ -321,6 +430,9 @@ class ModelManager:
         dados = RealData(x, y, sx=odr_sigma_x, sy=odr_sigma_y)
         # Initialize and run ODR
         odr = ODR(dados, modelo_odr, beta0=initial_params, maxit=max_iter)
+        if derivs is not None:
+            # User-supplied derivatives; they come from sympy so skip ODRPACK's check
+            odr.set_job(deriv=3)
 
         # Set fitting type to handle the case appropriately
         # For ODR, we don't need to change job parameters as it handles missing uncertainties automatically
@@ -335,41 +447,8 @@ class ModelManager:
             resultado.beta, x
         )
 
-        # Chi-squared calculation - use the actual uncertainties that were used in fitting
-        chi2_total: float = np.nan  # Default to NaN if no uncertainties available
-        if odr_sigma_y is not None:
-            # Check if we have any valid (non-zero) uncertainties
-            valid_mask = odr_sigma_y > 0
-            if np.any(valid_mask):
-                # Use weighted chi-squared only for points with valid uncertainties
-                chi2_total = float(
-                    np.sum(
-                        ((y[valid_mask] - y_pred[valid_mask]) / odr_sigma_y[valid_mask])
-                        ** 2
-                    )
-                )
-            else:
-                # All uncertainties are zero - use unweighted
-                chi2_total = float(np.sum((y - y_pred) ** 2))
-        else:
-            # No Y uncertainties - use unweighted chi-squared (essentially sum of squared residuals)
-            chi2_total = float(np.sum((y - y_pred) ** 2))  # Cast to float
-
-        # R-squared calculation
-        # Avoid division by zero if all y values are the same
-        ss_tot: float = float(np.sum((y - np.mean(y)) ** 2))  # Cast to float
-        ss_res: float = float(np.sum((y - y_pred) ** 2))  # Cast to float
-
-        r2: float = np.nan  # Default to NaN
-        if ss_tot > 0:
-            r2 = 1 - (ss_res / ss_tot)
-        else:
-            if ss_res == 0:  # Perfect fit to a constant
-                r2 = 1.0
-            # else, ss_tot is 0 and ss_res is > 0, which shouldn't happen if y_pred is based on y.
-            # If y is constant and model predicts it perfectly, r2 is 1.
-            # If y is constant and model does not predict it perfectly, ss_tot is 0, r2 is undefined or -inf.
-            # np.nan is a safe bet here.
+        # Use the uncertainties that were actually used in fitting
+        chi2_total, r2 = calculate_fit_statistics(y, y_pred, odr_sigma_y)
 
         return resultado, chi2_total, r2
     def perform_least_squares_fit(
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import os
 from typing import (
     Protocol,
     List,
@@ -25,22 +27,109 @@ FloatArray = npt.NDArray[np.float64]
 
 # Type alias for the numerical model functions
 ModelCallable = Callable[[Sequence[float], NDArray[np.float64]], NDArray[np.float64]]
+# Jacobian produced by create_model: one call returns [df/dp_1, ..., df/dp_n, df/dx]
+JacobianCallable = Callable[[Sequence[float], NDArray[np.float64]], List[Any]]
+
+# Jacobians over at least this many points are evaluated in parallel chunks of x
+PARALLEL_JACOBIAN_MIN_POINTS = 50_000
+
+_JACOBIAN_WORKERS = os.cpu_count() or 1
+_jacobian_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_jacobian_pool() -> Optional[ThreadPoolExecutor]:
+    """Shared worker pool for Jacobian chunks, None on single-core machines"""
+    global _jacobian_pool
+    if _JACOBIAN_WORKERS < 2:
+        return None
+    if _jacobian_pool is None:
+        _jacobian_pool = ThreadPoolExecutor(
+            max_workers=_JACOBIAN_WORKERS, thread_name_prefix="anafis-jacobian"
+        )
+    return _jacobian_pool
 
 
 class ODRModelImplementation:
-    """ODR model implementation"""
+    """ODR model implementation with analytic Jacobians"""
 
     def __init__(
         self,
         function: Callable[[FloatArray, FloatArray], FloatArray],
-        derivatives: List[Callable[[FloatArray, FloatArray], FloatArray]],
+        jacobian: Optional[JacobianCallable],
+        on_iteration: Optional[Callable[[int], None]] = None,
     ) -> None:
         self.function = function
-        self.derivatives = derivatives
+        self.jacobian = jacobian
+        # ODRPACK evaluates the Jacobians once per iteration, so counting
+        # fresh evaluations tracks the fit's progress
+        self.on_iteration = on_iteration
+        self.iterations = 0
+        # (n_params + 1, n) buffer reused across ODR iterations, plus the
+        # arguments it was last filled for so fjacb/fjacd share one evaluation
+        self._jac: Optional[FloatArray] = None
+        self._jac_parameters: Optional[FloatArray] = None
+        self._jac_x: Optional[FloatArray] = None
 
     def __call__(self, parameters: FloatArray, x: FloatArray) -> FloatArray:
         return self.function(parameters, x)
 
+    def _evaluate_jacobian(self, parameters: FloatArray, x: FloatArray) -> FloatArray:
+        """Evaluate all partial derivatives into the preallocated buffer"""
+        x_arr = np.asarray(x, dtype=np.float64)
+        params = np.asarray(parameters, dtype=np.float64)
+        if (
+            self._jac is not None
+            and np.array_equal(params, self._jac_parameters)
+            and np.array_equal(x_arr, self._jac_x)
+        ):
+            return self._jac
+
+        pool = (
+            _get_jacobian_pool()
+            if x_arr.ndim == 1 and x_arr.size >= PARALLEL_JACOBIAN_MIN_POINTS
+            else None
+        )
+        if pool is None:
+            self._fill_jacobian(params, x_arr, 0, x_arr.size)
+        else:
+            # NumPy releases the GIL inside ufuncs, so chunks of x run in
+            # parallel while each chunk keeps the shared subexpressions.
+            # The first chunk runs here so the buffer exists before the rest
+            bounds = np.linspace(0, x_arr.size, _JACOBIAN_WORKERS + 1).astype(int)
+            self._fill_jacobian(params, x_arr, bounds[0], bounds[1])
+            futures = [
+                pool.submit(self._fill_jacobian, params, x_arr, start, stop)
+                for start, stop in zip(bounds[1:-1], bounds[2:])
+            ]
+            for future in futures:
+                future.result()
+        self._jac_parameters = params.copy()
+        self._jac_x = x_arr.copy()
+
+        self.iterations += 1
+        if self.on_iteration is not None:
+            self.on_iteration(self.iterations)
+        return self._jac
+
+    def _fill_jacobian(
+        self, params: FloatArray, x_arr: FloatArray, start: int, stop: int
+    ) -> None:
+        """Write the derivatives for x[start:stop] into the Jacobian buffer"""
+        derivatives = self.jacobian(params, x_arr[start:stop])
+        if self._jac is None or self._jac.shape != (len(derivatives), x_arr.size):
+            self._jac = np.empty((len(derivatives), x_arr.size), dtype=np.float64)
+        # copyto broadcasts derivatives that are constant in x
+        for row, derivative in zip(self._jac, derivatives):
+            np.copyto(row[start:stop], derivative)
+
+    def fjacb(self, parameters: FloatArray, x: FloatArray) -> FloatArray:
+        """Derivatives with respect to the parameters, shape (n_params, n)"""
+        return self._evaluate_jacobian(parameters, x)[:-1]
+
+    def fjacd(self, parameters: FloatArray, x: FloatArray) -> FloatArray:
+        """Derivative with respect to x, shape (n,)"""
+        return self._evaluate_jacobian(parameters, x)[-1]
+
 
 @dataclass
 class CustomFunction:
@@ -51,6 +140,14 @@ class CustomFunction:
     x_min: Optional[float] = None
     x_max: Optional[float] = None
     enabled: bool = True  # New field to control visibility/plotting
+    # Range text shown in the function list, filled on first display
+    _display_range: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Row values last shown in the function list
+    _tree_values: Optional[Tuple[str, str, str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
 # Fitting Algorithm Implementations
@@ -120,6 +217,52 @@ class BootstrapResult:
         self.sd_beta = np.std(param_samples, axis=0)
 
 
+def calculate_fit_statistics(
+    y: NDArray[np.float64],
+    y_pred: NDArray[np.float64],
+    sigma_y: Optional[NDArray[np.float64]],
+) -> Tuple[float, float]:
+    """Chi-squared and R-squared of a fit from a single residual buffer
+
+    Points with zero uncertainty are left out of the weighted chi-squared; if
+    no point has an uncertainty the plain sum of squared residuals is used.
+
+    Args:
+        y: Measured values
+        y_pred: Model values at the same x
+        sigma_y: Standard deviations for y (None for unweighted)
+
+    Returns:
+        Tuple containing (chi-squared, R-squared)
+    """
+    residuals = np.subtract(y, y_pred, dtype=np.float64)
+    ss_res = float(np.dot(residuals, residuals))
+
+    chi2_total = ss_res
+    if sigma_y is not None:
+        valid_mask = sigma_y > 0
+        if np.all(valid_mask):
+            np.divide(residuals, sigma_y, out=residuals)
+            chi2_total = float(np.dot(residuals, residuals))
+        elif np.any(valid_mask):
+            # Use weighted chi-squared only for points with valid uncertainties
+            np.divide(residuals, sigma_y, out=residuals, where=valid_mask)
+            residuals[~valid_mask] = 0.0
+            chi2_total = float(np.dot(residuals, residuals))
+
+    # Reuse the buffer for the deviations from the mean
+    np.subtract(y, np.mean(y), out=residuals)
+    ss_tot = float(np.dot(residuals, residuals))
+
+    r2: float = np.nan
+    if ss_tot > 0:
+        r2 = 1 - (ss_res / ss_tot)
+    elif ss_res == 0:  # Perfect fit to a constant
+        r2 = 1.0
+
+    return chi2_total, r2
+
+
 def perform_least_squares_fit(
     x: NDArray[np.float64],
     y: NDArray[np.float64],
@@ -177,35 +320,7 @@ def perform_least_squares_fit(
 
     # Calculate statistics
     y_pred: NDArray[np.float64] = model_func(popt.tolist(), x)
-    # Chi-squared calculation
-    chi2_total: float = np.nan
-    if sigma_y is not None:
-        # Check if we have any valid (non-zero) uncertainties
-        valid_mask = sigma_y > 0
-        if np.any(valid_mask):
-            # Use weighted chi-squared only for points with valid uncertainties
-            chi2_total = float(
-                np.sum(
-                    ((y[valid_mask] - y_pred[valid_mask]) / sigma_y[valid_mask]) ** 2
-                )
-            )
-        else:
-            # All uncertainties are zero - use unweighted
-            chi2_total = float(np.sum((y - y_pred) ** 2))
-    else:
-        # Unweighted chi-squared (sum of squared residuals)
-        chi2_total = float(np.sum((y - y_pred) ** 2))
-
-    # R-squared calculation
-    ss_tot: float = float(np.sum((y - np.mean(y)) ** 2))
-    ss_res: float = float(np.sum((y - y_pred) ** 2))
-
-    r2: float = np.nan
-    if ss_tot > 0:
-        r2 = 1 - (ss_res / ss_tot)
-    else:
-        if ss_res == 0:  # Perfect fit to a constant
-            r2 = 1.0
+    chi2_total, r2 = calculate_fit_statistics(y, y_pred, sigma_y)
 
     return resultado, chi2_total, r2
 
@@ -515,29 +630,7 @@ def perform_bootstrap_fit(
     resultado = BootstrapResult(popt_original, bootstrap_params_array)
     # Calculate statistics using original fit
     y_pred: NDArray[np.float64] = model_func(popt_original.tolist(), x)
-    # Chi-squared calculation
-    chi2_total: float = np.nan
-    if sigma_y is not None:
-        # Check if we have any valid (non-zero) uncertainties
-        valid_mask = sigma_y > 0
-        if np.any(valid_mask):
-            # Use weighted chi-squared only for points with valid uncertainties
-            chi2_total = float(
-                np.sum(
-                    ((y[valid_mask] - y_pred[valid_mask]) / sigma_y[valid_mask]) ** 2
-                )
-            )
-        else:
-            # All uncertainties are zero - use unweighted
-            chi2_total = float(np.sum((y - y_pred) ** 2))
-    else:
-        chi2_total = float(np.sum((y - y_pred) ** 2))
-
-    # R-squared calculation
-    ss_tot = float(np.sum((y - np.mean(y)) ** 2))
-    ss_res = float(np.sum((y - y_pred) ** 2))
-
-    r2 = 1 - (ss_res / ss_tot) if ss_tot > 0 else (1.0 if ss_res == 0 else np.nan)
+    chi2_total, r2 = calculate_fit_statistics(y, y_pred, sigma_y)
 
     return resultado, chi2_total, r2
 
@@ -662,28 +755,6 @@ def perform_bayesian_fit(
     except Exception:
         # If model function fails, use polynomial prediction
         y_pred = bayesian_ridge.predict(X_poly)
-    # Chi-squared calculation
-    chi2_total: float = np.nan
-    if sigma_y is not None:
-        # Check if we have any valid (non-zero) uncertainties
-        valid_mask = sigma_y > 0
-        if np.any(valid_mask):
-            # Use weighted chi-squared only for points with valid uncertainties
-            chi2_total = float(
-                np.sum(
-                    ((y[valid_mask] - y_pred[valid_mask]) / sigma_y[valid_mask]) ** 2
-                )
-            )
-        else:
-            # All uncertainties are zero - use unweighted
-            chi2_total = float(np.sum((y - y_pred) ** 2))
-    else:
-        chi2_total = float(np.sum((y - y_pred) ** 2))
-
-    # R-squared calculation
-    ss_tot = float(np.sum((y - np.mean(y)) ** 2))
-    ss_res = float(np.sum((y - y_pred) ** 2))
-
-    r2 = 1 - (ss_res / ss_tot) if ss_tot > 0 else (1.0 if ss_res == 0 else np.nan)
+    chi2_total, r2 = calculate_fit_statistics(y, y_pred, sigma_y)
 
     return resultado, chi2_total, r2
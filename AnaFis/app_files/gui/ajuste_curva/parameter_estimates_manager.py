@@ -1,18 +1,35 @@
 """Parameter estimation UI for curve fitting"""
 
+import functools
 import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
 import sympy as sp
-from typing import TYPE_CHECKING, Dict, List, cast
+from typing import TYPE_CHECKING, Dict, List, Tuple, cast
 
-from app_files.utils.translations.api import get_string
+from app_files.utils.translations.api import LANGS, get_string
 
 if TYPE_CHECKING:
     # from tkinter import Event # Keep or change based on usage - We are using tk.Event now
     from app_files.gui.ajuste_curva.main_gui import AjusteCurvaFrame
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_equation(equation: str) -> Tuple[sp.Expr, Tuple[sp.Symbol, ...]]:
+    """Parse an equation once and return it with its parameters sorted by name
+
+    sympify is slow and the same equation is parsed on every focus change,
+    so results are memoised per equation string.
+    """
+    expr: sp.Expr = cast(sp.Expr, sp.sympify(equation))
+    symbols = cast(set[sp.Symbol], expr.free_symbols)
+    # Filter out 'x' which is the independent variable
+    parameters = tuple(
+        sorted((sym for sym in symbols if sym.name != "x"), key=lambda s: s.name)
+    )
+    return expr, parameters
+
+
 class ParameterEstimatesManager:
     """Manages parameter estimates for curve fitting"""
 
@@ -165,17 +182,8 @@ class ParameterEstimatesManager:
             List of symbols representing parameters
         """
         try:
-            # Parse the equation with sympy
-            # Add type ignore for sympify and free_symbols as Pylance struggles with their complex types
-            expr: sp.Expr = cast(sp.Expr, sp.sympify(equation))
-            # Find all symbols in the expression
-            symbols: List[sp.Symbol] = list(cast(set[sp.Symbol], expr.free_symbols))
-            # Filter out 'x' which is the independent variable
-            parameters_out: List[sp.Symbol] = [
-                sym for sym in symbols if sym.name != "x"
-            ]  # Renamed parameters to parameters_out
-
-            return parameters_out
+            _, parameters_out = _parse_equation(equation)
+            return list(parameters_out)
 
         except Exception as e:
             logging.error(f"Error extracting parameters: {str(e)}")
@@ -217,6 +225,9 @@ class ParameterEstimatesManager:
                 except Exception:
                     pass
                 # Update labels inside the estimates frame
+                initial_values_texts = {
+                    get_string("ajuste_curva", "initial_values", lang) for lang in LANGS
+                }
                 for child in self.estimates_frame.winfo_children():
                     if isinstance(child, ttk.Label):
                         # For simplicity, recreate label texts that match parameter names
@@ -226,7 +237,7 @@ class ParameterEstimatesManager:
                         if txt.strip().endswith(":"):
                             continue
                         # Update 'Initial Values' label if present
-                        if txt in [get_string("ajuste_curva", "initial_values", "pt"), get_string("ajuste_curva", "initial_values", "en")]:
+                        if txt in initial_values_texts:
                             child.config(text=get_string("ajuste_curva", "initial_values", self.language))
         except Exception:
             pass
@@ -1,18 +1,25 @@
 """Plot manager for curve fitting"""
 
 import logging
+from collections import OrderedDict
 import numpy as np
 from numpy.typing import NDArray
 import sympy as sp
-from typing import TYPE_CHECKING, Optional, List, Callable, cast, Sequence, Any, Dict
+from typing import TYPE_CHECKING, Optional, List, Callable, cast, Sequence, Any, Dict, Tuple
 import re
 
-from app_files.utils.translations.api import get_string
+from app_files.utils.translations.api import LANGS, get_string
 
 # Type aliases for better type annotation
 BetaArray = NDArray[np.float64]
 FloatArray = NDArray[np.float64]
 
+# Upper bound on major ticks per linear axis; fewer ticks means less text to lay out per draw
+MAX_MAJOR_TICKS = 6
+
+# Model evaluations kept by PlotManager (fit curve and data points of recent fits)
+MODEL_EVAL_CACHE_SIZE = 4
+
 
 SUPPORTED_SYMPY_OBJECTS: Dict[str, Any] = {
     # Basic trigonometric functions
@@ -85,6 +92,22 @@ SUPPORTED_SYMPY_OBJECTS: Dict[str, Any] = {
     "infinity": sp.oo,
 }
 
+# Implicit multiplication patterns, compiled once at import instead of on every call.
+# Functions are sorted by length (longest first) to handle overlapping names correctly
+_SORTED_FUNCTIONS = sorted(SUPPORTED_SYMPY_OBJECTS.keys(), key=len, reverse=True)
+_FUNCTION_ALTERNATION = "|".join(_SORTED_FUNCTIONS)
+_FUNCTION_PATTERN = r"\b(?:" + _FUNCTION_ALTERNATION + r")\b"
+_NUMBER_FUNCTION_RE = re.compile(rf"(\d)({_FUNCTION_ALTERNATION})\b")
+_NUMBER_VARIABLE_RE = re.compile(rf"(\d)([a-zA-Z])(?!{_FUNCTION_PATTERN})")
+_VARIABLE_PAREN_RE = re.compile(rf"(\b[a-zA-Z]\b)(?!{_FUNCTION_PATTERN})\(")
+_PAREN_PAREN_RE = re.compile(r"\)\(")
+_PAREN_ALNUM_RE = re.compile(r"\)([a-zA-Z0-9])")
+_NUMBER_PAREN_RE = re.compile(r"(\d)\(")
+_PAREN_FUNCTION_RE = re.compile(rf"(\))((?:{_FUNCTION_ALTERNATION})\b)")
+
+# Independent variable shared by every model, created once instead of per call
+X_SYMBOL: sp.Symbol = sp.Symbol("x")
+
 
 def preprocess_implicit_multiplication(expression: str) -> str:
     """
@@ -113,33 +136,30 @@ def preprocess_implicit_multiplication(expression: str) -> str:
 
     # Step 2: Handle implicit multiplication before function substitution
     # This avoids conflicts with the sp. prefixes
-    math_functions = list(SUPPORTED_SYMPY_OBJECTS.keys())
 
     # Pattern 1: Number followed by function name (e.g., 2sin, 3cos)
-    # Sort functions by length (longest first) to handle overlapping names correctly
-    sorted_functions = sorted(math_functions, key=len, reverse=True)
-    for func in sorted_functions:
-        expr = re.sub(rf"(\d)({func})\b", r"\1*\2", expr)
+    expr = _NUMBER_FUNCTION_RE.sub(r"\1*\2", expr)
+
     # Pattern 2: Number followed by variable (e.g., 3x, 2y)
     # Look for digit followed by single letter that's not a function name
-    function_pattern = r"\b(?:" + "|".join(sorted_functions) + r")\b"
-    expr = re.sub(rf"(\d)([a-zA-Z])(?!" + function_pattern + r")", r"\1*\2", expr)
+    expr = _NUMBER_VARIABLE_RE.sub(r"\1*\2", expr)
 
     # Pattern 3: Single variable followed by opening parenthesis (e.g., x(, y()
     # But not function names - be very specific: single letter variables only
-    expr = re.sub(r"(\b[a-zA-Z]\b)(?!" + function_pattern + r")\(", r"\1*(", expr)
+    expr = _VARIABLE_PAREN_RE.sub(r"\1*(", expr)
 
     # Pattern 4: Closing parenthesis followed by opening parenthesis (e.g., )(
-    expr = re.sub(r"\)\(", r")*(", expr)
+    expr = _PAREN_PAREN_RE.sub(r")*(", expr)
 
     # Pattern 5: Closing parenthesis followed by letter or number (e.g., )x, )2
-    expr = re.sub(r"\)([a-zA-Z0-9])", r")*\1", expr)
+    expr = _PAREN_ALNUM_RE.sub(r")*\1", expr)
+
     # Pattern 6: Number followed by opening parenthesis (e.g., 2(, 3()
-    expr = re.sub(r"(\d)\(", r"\1*(", expr)
+    expr = _NUMBER_PAREN_RE.sub(r"\1*(", expr)
 
     # Pattern 7: Function followed by function (e.g., sin(x)cos(x))
     # This handles cases like sin(x)cos(x) -> sin(x)*cos(x)
-    expr = re.sub(rf"(\))((?:" + "|".join(sorted_functions) + r")\b)", r"\1*\2", expr)
+    expr = _PAREN_FUNCTION_RE.sub(r"\1*\2", expr)
 
     return expr
 
@@ -192,11 +212,36 @@ class PlotManager:
         self.ax_res = ax_res
         self.canvas = canvas
         self.language = language
+        # Lambdified custom functions keyed by their expression text, so
+        # replotting skips sympy parsing and code generation
+        self.custom_function_cache: Dict[str, Callable[..., Any]] = {}
+        # Last fit-curve grid and the (scale, min, max, points) it was built
+        # for, so replots (e.g. scale toggles) reuse it
+        self._fit_grid_key: Optional[Tuple[str, float, float, int]] = None
+        self._fit_grid: Optional[NDArray[np.float64]] = None
+        # Fit curve artist and the result it was drawn for, so a scale change
+        # can update that one line instead of rebuilding both axes
+        self._fit_line: Optional[Any] = None
+        self._fit_result: Any = None
+        # Recent model evaluations keyed by (beta, x) bytes, with the model
+        # they came from, so replotting a fit doesn't re-evaluate it
+        self._eval_cache: "OrderedDict[Tuple[bytes, bytes], Tuple[Any, NDArray[np.float64]]]" = OrderedDict()
 
     def _get_translation(self, key: str, fallback: str = "") -> str:
         """Get translation for a given key using the correct API signature"""
         return get_string("ajuste_curva", key, self.language, fallback)
 
+    def _configure_ticks(self) -> None:
+        """Cap the number of major ticks on the linear axes
+
+        Must run after clear() and set_*scale(), both of which reset the locators.
+        """
+        from matplotlib.ticker import MaxNLocator
+
+        for axis in (self.ax.xaxis, self.ax.yaxis, self.ax_res.xaxis, self.ax_res.yaxis):
+            if axis.get_scale() == "linear":
+                axis.set_major_locator(MaxNLocator(MAX_MAJOR_TICKS))
+
     def initialize_empty_plot(self) -> None:
         """Initialize an empty plot"""
         self.ax.clear()
@@ -210,9 +255,11 @@ class PlotManager:
         self.ax.set_ylabel("Y")
         self.ax_res.set_xlabel("X")
         self.ax_res.set_ylabel(self._get_translation("residuals", fallback="Residuals"))
+        self._configure_ticks()
         # Ensure tight layout
         self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
     def plot_data_only(
         self,
         x: NDArray[np.float64],
@@ -247,6 +294,7 @@ class PlotManager:
         self.ax.set_xscale(x_scale)
         self.ax.set_yscale(y_scale)
         self.ax_res.set_xscale(x_scale)
+        self._configure_ticks()
         # Set labels
         if x_label:
             self.ax.set_xlabel(x_label)
@@ -264,7 +312,69 @@ class PlotManager:
         self.ax.legend()
         # Ensure tight layout
         self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
+    def _evaluate_model(
+        self, model_func: "ModelCallable", beta: Any, x: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Evaluate model_func(beta, x), reusing one of the last few results
+
+        Args:
+            model_func: Fitted model function
+            beta: Fitted parameter values
+            x: Points to evaluate at
+        """
+        key = (np.asarray(beta, dtype=np.float64).tobytes(), np.asarray(x).tobytes())
+        cached = self._eval_cache.get(key)
+        if cached is not None and cached[0] is model_func:
+            self._eval_cache.move_to_end(key)
+            return cached[1]
+
+        values = model_func(cast(Sequence[float], beta), x)
+        self._eval_cache[key] = (model_func, values)
+        if len(self._eval_cache) > MODEL_EVAL_CACHE_SIZE:
+            self._eval_cache.popitem(last=False)
+        return values
+
+    def _get_fit_grid(
+        self, x: NDArray[np.float64], num_points: int, x_scale: str
+    ) -> NDArray[np.float64]:
+        """Return the x values for the fit curve, reusing the last grid
+
+        Args:
+            x: X data
+            num_points: Number of points for fit curve
+            x_scale: X-axis scale ('linear' or 'log')
+        """
+        x_min_val, x_max_val = float(x.min()), float(x.max())
+        use_log = False
+        if x_scale == "log":
+            # For log scale, use logarithmically spaced points
+            if x_min_val <= 0:
+                positive_x = x[x > 0]
+                if positive_x.size > 0:
+                    x_min_val = float(positive_x.min())  # Smallest positive value
+                else:
+                    logging.warning(
+                        "Log scale requested for non-positive data. Using linear scale for fit curve."
+                    )
+            use_log = x_min_val > 0 and x_max_val > 0
+            if not use_log:
+                x_min_val = float(x.min())
+
+        key = ("log" if use_log else "linear", x_min_val, x_max_val, num_points)
+        if self._fit_grid is None or key != self._fit_grid_key:
+            if use_log:
+                self._fit_grid = np.logspace(
+                    np.log10(x_min_val), np.log10(x_max_val), num_points, dtype=np.float64
+                )
+            else:
+                self._fit_grid = np.linspace(
+                    x_min_val, x_max_val, num_points, dtype=np.float64
+                )
+            self._fit_grid_key = key
+        return self._fit_grid
+
     def plot_fit_results(
         self,
         x: NDArray[np.float64],
@@ -308,51 +418,21 @@ class PlotManager:
         self.ax_res.clear()
 
         # Generate x values for plotting the fit curve
-        x_fit: NDArray[np.float64]
-        if x_scale == "log":
-            # For log scale, use logarithmically spaced points
-            x_min_val, x_max_val = np.min(x), np.max(x)
-            if x_min_val <= 0:
-                positive_x = x[x > 0]
-                if positive_x.size > 0:
-                    x_min_val = np.min(positive_x)  # Find smallest positive value
-                else:  # All values are <=0, log scale is problematic. Fallback or raise error.                    
-                    # Fallback to linear for safety, or handle as error
-                    x_fit = np.linspace(x_min_val, x_max_val, num_points).astype(
-                        np.float64
-                    )
-                    logging.warning(
-                        "Log scale requested for non-positive data. Using linear scale for fit curve."
-                    )
-                    # Alternatively, could raise ValueError("Cannot use log scale with non-positive data.")
-            if (
-                x_min_val > 0 and x_max_val > 0
-            ):  # Ensure min and max are positive for logspace
-                x_fit = np.logspace(
-                    np.log10(x_min_val),
-                    np.log10(x_max_val),
-                    num_points,
-                    dtype=np.float64,
-                )
-            else:  # Fallback if still problematic after trying to find positive min
-                x_fit = np.linspace(np.min(x), np.max(x), num_points).astype(np.float64)
-
-        else:
-            # For linear scale, use linearly spaced points
-            x_fit = np.linspace(np.min(x), np.max(x), num_points).astype(np.float64)
+        x_fit = self._get_fit_grid(x, num_points, x_scale)
         # Calculate y values using the model function
         try:  # Type annotation for beta array from ODR result
             beta_params = cast(BetaArray, result.beta)
             # Use model function to generate fit line
-            y_fit = model_func(cast(Sequence[float], beta_params), x_fit)
-            y_model = model_func(cast(Sequence[float], beta_params), x)
+            y_fit = self._evaluate_model(model_func, beta_params, x_fit)
+            y_model = self._evaluate_model(model_func, beta_params, x)
 
             # Calculate residuals
             residuals = y - y_model
 
             # Plot data with error bars using translated label
             self.ax.errorbar(x, y, xerr=sigma_x, yerr=sigma_y, fmt="o", capsize=3, label=self._get_translation("data_label", fallback="Data"))
-            self.ax.plot(x_fit, y_fit, "-", label=self._get_translation("fit_label", fallback="Fit"))
+            (self._fit_line,) = self.ax.plot(x_fit, y_fit, "-", label=self._get_translation("fit_label", fallback="Fit"))
+            self._fit_result = result
             # Plot residuals
             self.ax_res.errorbar(x, residuals, yerr=sigma_y, fmt="o", capsize=3)
             self.ax_res.axhline(y=0, color="r", linestyle="-", alpha=0.3)
@@ -360,6 +440,7 @@ class PlotManager:
             self.ax.set_xscale(x_scale)
             self.ax.set_yscale(y_scale)
             self.ax_res.set_xscale(x_scale)
+            self._configure_ticks()
             # Set labels
             if x_label:
                 self.ax.set_xlabel(x_label)
@@ -385,14 +466,72 @@ class PlotManager:
             self.ax.legend(title=f"χ²={chi2:.2f}, R²={r2:.4f}")
             # Ensure tight layout
             self.fig.tight_layout()
-            self.canvas.draw()
+            self.canvas.draw_idle()
         except Exception as e:
-            logging.error(f"Error in plot_fit_results: {str(e)}")
+            logging.error("Error in plot_fit_results: %s", e)
             # If fit plotting fails, at least show the data
             self.plot_data_only(
                 x, y, sigma_x, sigma_y, x_label, y_label, title, x_scale, y_scale
             )
 
+    def rescale_fit_results(
+        self,
+        x: NDArray[np.float64],
+        model_func: "ModelCallable",
+        result: "Output",
+        num_points: int = 1000,
+        x_scale: str = "linear",
+        y_scale: str = "linear",
+    ) -> bool:
+        """Change scales on the plotted fit, resampling only the fit curve
+
+        The data, residuals, labels and legend are kept as they are. Returns
+        False when the plot doesn't show this result, so the caller can fall
+        back to plot_fit_results.
+
+        Args:
+            x: X data
+            model_func: Fitted model function
+            result: Fit result object
+            num_points: Number of points for fit curve
+            x_scale: X-axis scale ('linear' or 'log')
+            y_scale: Y-axis scale ('linear' or 'log')
+        """
+        if (
+            self._fit_line is None
+            or self._fit_result is not result
+            or self._fit_line not in self.ax.lines
+        ):
+            return False
+
+        try:
+            x_fit = self._get_fit_grid(x, num_points, x_scale)
+            self._fit_line.set_data(
+                x_fit, self._evaluate_model(model_func, result.beta, x_fit)
+            )
+        except Exception as e:
+            logging.error("Error resampling fit curve: %s", e)
+            return False
+
+        self.set_scales(x_scale=x_scale, y_scale=y_scale)
+        return True
+
+    def set_scales(self, x_scale: str = "linear", y_scale: str = "linear") -> None:
+        """Change the axis scales of the current plot without replotting it
+
+        Args:
+            x_scale: X-axis scale ('linear' or 'log')
+            y_scale: Y-axis scale ('linear' or 'log')
+        """
+        self.ax.set_xscale(x_scale)
+        self.ax.set_yscale(y_scale)
+        self.ax_res.set_xscale(x_scale)
+        self._configure_ticks()
+        self.ax.autoscale_view()
+        self.ax_res.autoscale_view()
+        self.fig.tight_layout()
+        self.canvas.draw_idle()
+
     def update_legend(self) -> None:
         """Updates the legend on the plot."""
         # Get current handles and labels
@@ -420,12 +559,17 @@ class PlotManager:
             try:
                 handles, labels = self.ax.get_legend_handles_labels()
                 # Replace known labels using translations if they match previous languages
+                label_keys = {
+                    get_string("ajuste_curva", key, lang): key
+                    for key in ("data_label", "fit_label")
+                    for lang in LANGS
+                }
+                fallbacks = {"data_label": "Data", "fit_label": "Fit"}
                 new_labels = []
                 for lbl in labels:
-                    if lbl in [get_string("ajuste_curva", "data_label", "pt"), get_string("ajuste_curva", "data_label", "en")]:
-                        new_labels.append(self._get_translation("data_label", fallback="Data"))
-                    elif lbl in [get_string("ajuste_curva", "fit_label", "pt"), get_string("ajuste_curva", "fit_label", "en")]:
-                        new_labels.append(self._get_translation("fit_label", fallback="Fit"))
+                    key = label_keys.get(lbl)
+                    if key is not None:
+                        new_labels.append(self._get_translation(key, fallback=fallbacks[key]))
                     else:
                         new_labels.append(lbl)
                 if new_labels:
@@ -436,7 +580,7 @@ class PlotManager:
             # Redraw
             try:
                 self.fig.tight_layout()
-                self.canvas.draw()
+                self.canvas.draw_idle()
             except Exception:
                 pass
         except Exception:
@@ -449,7 +593,7 @@ class PlotManager:
             self.canvas.draw()
             logging.debug("Force refresh completed successfully")
         except Exception as e:
-            logging.error(f"Force refresh failed: {e}")
+            logging.error("Force refresh failed: %s", e)
 
     def plot_custom_functions(self, custom_functions: List["CustomFunction"]) -> None:
         """Plot custom functions on the graph.
@@ -460,7 +604,7 @@ class PlotManager:
         import logging
 
         logging.debug(
-            f"plot_custom_functions called with {len(custom_functions)} functions"
+            "plot_custom_functions called with %d functions", len(custom_functions)
         )
 
         # Remove existing custom function lines first (regardless of whether we have new functions)
@@ -471,15 +615,16 @@ class PlotManager:
             ):
                 lines_to_remove.append(line)
 
-        logging.debug(f"Removing {len(lines_to_remove)} existing custom function lines")
+        logging.debug(
+            "Removing %d existing custom function lines", len(lines_to_remove)
+        )
         for line in lines_to_remove:
             line.remove()
         # If no functions to plot, just clear and return
         if not custom_functions:
             logging.debug("No custom functions to plot - clearing and updating")
             self.update_legend()
-            self.canvas.draw()
-            # Force immediate redraw instead of draw_idle
+            self.canvas.draw_idle()
             return
 
         # Get current x range for plotting custom functions
@@ -490,7 +635,7 @@ class PlotManager:
             # Default range if no data plotted yet
             x = np.linspace(-10, 10, 1000)
         # Symbol for the independent variable
-        x_sym = sp.Symbol("x")
+        x_sym = X_SYMBOL
 
         for func in custom_functions:
             try:
@@ -520,15 +665,18 @@ class PlotManager:
                     else:
                         x = np.linspace(-10, 10, 1000)  # Default range
 
-                # Preprocess the expression to handle implicit multiplication
-                preprocessed_expression = preprocess_implicit_multiplication(
-                    func.func_text
-                )
-                # Parse the expression with the same comprehensive function dictionary
-                local_dict = SUPPORTED_SYMPY_OBJECTS
-                expr = sp.sympify(preprocessed_expression, locals=local_dict)
-                # Convert to numeric function and evaluate
-                func_lambda = sp.lambdify(x_sym, expr, modules=["numpy"])
+                func_lambda = self.custom_function_cache.get(func.func_text)
+                if func_lambda is None:
+                    # Preprocess the expression to handle implicit multiplication
+                    preprocessed_expression = preprocess_implicit_multiplication(
+                        func.func_text
+                    )
+                    # Parse the expression with the same comprehensive function dictionary
+                    local_dict = SUPPORTED_SYMPY_OBJECTS
+                    expr = sp.sympify(preprocessed_expression, locals=local_dict)
+                    # Convert to numeric function
+                    func_lambda = sp.lambdify(x_sym, expr, modules=["numpy"])
+                    self.custom_function_cache[func.func_text] = func_lambda
                 y = func_lambda(x)
 
                 # Create label with range info if custom range is specified
@@ -543,7 +691,7 @@ class PlotManager:
                 setattr(line, "is_custom_function", True)
             except Exception as e:
                 # Log error but continue with other functions
-                logging.error(f"Error plotting function {func.func_text}: {e}")
+                logging.error("Error plotting function %s: %s", func.func_text, e)
                 continue
 
         # Update legend and redraw canvas
@@ -277,7 +277,9 @@ class UIBuilder:
             left_params_frame, width=30
         )  # Increased width from 20 to 30
         self.equation_entry.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
-        self.equation_entry.bind("<KeyRelease>", self.parent.validate_equation)
+        self.equation_entry.bind(
+            "<KeyRelease>", self.parent.schedule_equation_validation
+        )
         self.equation_entry.bind(
             "<FocusOut>", lambda e: self.parent.update_estimates_frame()
         )
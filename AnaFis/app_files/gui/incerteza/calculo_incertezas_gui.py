@@ -1,17 +1,22 @@
 """GUI module for uncertainty calculations"""
 
 from __future__ import annotations
-from typing import Tuple, Dict, List, Optional, Any, Set
+from typing import Tuple, Dict, List, Optional, Any, Set, Callable, Sequence
+from collections import OrderedDict
 import tkinter as tk
 from tkinter import ttk, Toplevel
 from tkinter import messagebox
 from tkinter.scrolledtext import ScrolledText
 import logging
 import math
+import re
+import numpy as np
 import sympy as sp
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
+from matplotlib.mathtext import MathTextParser
+from matplotlib.text import Text
 
 from app_files.utils.translations.api import get_string, get_help
 
@@ -20,6 +25,87 @@ FONT_FAMILY = "Courier New"
 FONT_SIZE = 10
 ENTRY_WIDTH = {"small": 5, "medium": 10, "large": 30, "formula": 40}
 
+# Known mathematical functions that implicit multiplication must NOT affect
+MATH_FUNCTIONS = frozenset(
+    {
+        "sin",
+        "cos",
+        "tan",
+        "sec",
+        "csc",
+        "cot",
+        "asin",
+        "acos",
+        "atan",
+        "atan2",
+        "asinh",
+        "acosh",
+        "atanh",
+        "sinh",
+        "cosh",
+        "tanh",
+        "exp",
+        "log",
+        "log10",
+        "ln",
+        "sqrt",
+        "abs",
+        "floor",
+        "ceil",
+        "round",
+        "factorial",
+        "gamma",
+    }
+)
+
+# Implicit multiplication patterns, compiled once at import
+_NUMBER_PAREN_RE = re.compile(r"(\d+\.?\d*)\(")
+_NUMBER_NAME_RE = re.compile(r"(\d+\.?\d*)([a-zA-Z_]\w*)")
+_PAREN_PAREN_RE = re.compile(r"\)\(")
+_NAME_PAREN_RE = re.compile(r"([a-zA-Z_]\w*)\(")
+_PAREN_NAME_RE = re.compile(r"\)([a-zA-Z_]\w*)")
+
+# Type aliases for the lambdified formula and gradient: both take the variable
+# values in the order the variables were entered; the gradient returns every
+# partial derivative at once
+ValueCallable = Callable[..., float]
+GradientCallable = Callable[..., Sequence[float]]
+
+# Modules for lambdify: scipy.special covers gamma, factorial, polygamma...
+# which the numpy printer leaves as names that fail at call time
+LAMBDIFY_MODULES = ["scipy", "numpy"]
+
+# Compiled formulas kept per calculator; the least recently used is dropped first
+FORMULA_CACHE_SIZE = 16
+
+
+def _com_fallback_evalf(
+    compilado: Callable[..., Any], exprs: Any, simbolos: List[Any]
+) -> Callable[..., Any]:
+    """Wrap a lambdified callable so it falls back to sympy subs/evalf
+
+    Covers functions neither SciPy nor NumPy can evaluate; floating-point
+    errors are re-raised so 1/x at x = 0 still reaches the error dialog.
+    """
+
+    def avaliar(*valores: float) -> Any:
+        try:
+            return compilado(*valores)
+        except FloatingPointError:
+            raise
+        except Exception as e:
+            logging.debug("Compiled formula failed, using subs/evalf: %s", e)
+            subs = dict(zip(simbolos, (float(v) for v in valores)))
+            if isinstance(exprs, list):
+                return [float(d.subs(subs).evalf()) for d in exprs]
+            return float(exprs.subs(subs).evalf())
+
+    return avaliar
+
+
+# Validates mathtext before it reaches the (deferred) LaTeX canvas draw
+_MATHTEXT_PARSER = MathTextParser("path")
+
 
 class CalculoIncertezasFrame:
     """Frame-based GUI class for uncertainty calculations"""
@@ -46,11 +132,18 @@ class CalculoIncertezasFrame:
         self.vars_entry: Optional[ttk.Entry] = None
         self.var_entries: List[Tuple[ttk.Entry, ttk.Entry, ttk.Entry]] = []
         self.formula_latex: str = ""
+        # Compiled formula and gradient keyed by (formula, variable names),
+        # so repeated "Calculate" clicks skip sympy entirely
+        self.formula_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], Tuple[ValueCallable, GradientCallable]]" = OrderedDict()
         self.num_var: ttk.Entry
         self.formula_entry: ttk.Entry
         self.botao_calcular: ttk.Button
         self.resultados_text: ScrolledText
         self.latex_frame: ttk.Frame
+        # LaTeX display figure, built on first use and reused afterwards
+        self._latex_fig: Optional[Figure] = None
+        self._latex_text: Optional[Text] = None
+        self._latex_canvas: Optional[FigureCanvasTkAgg] = None
 
         # Create main frame
         self.main_frame = ttk.Frame(parent)
@@ -68,6 +161,9 @@ class CalculoIncertezasFrame:
         if hasattr(self, "latex_frame"):
             for widget in self.latex_frame.winfo_children():
                 widget.destroy()
+        self._latex_fig = None
+        self._latex_text = None
+        self._latex_canvas = None
 
     def update_results(self) -> None:
         """Update calculation results"""
@@ -236,17 +332,18 @@ class CalculoIncertezasFrame:
 
             self.var_entries = []  # Reset var_entries list
 
-            # Column headers
-            header_frame = ttk.Frame(self.campos_frame)
-            header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+            # Headers and every variable row share one grid, so the number
+            # of frames no longer grows with the number of variables
+            grid_frame = ttk.Frame(self.campos_frame)
+            grid_frame.grid(row=0, column=0, sticky="ew")
 
-            # Configure column weights for header_frame
-            header_frame.grid_columnconfigure(0, weight=0)  # Spacer column
-            header_frame.grid_columnconfigure(1, weight=1)  # Variable header
-            header_frame.grid_columnconfigure(2, weight=1)  # Value header
-            header_frame.grid_columnconfigure(3, weight=1)  # Uncertainty header
+            # Configure column weights once for all rows
+            grid_frame.grid_columnconfigure(0, weight=0)  # Row number column
+            grid_frame.grid_columnconfigure(1, weight=1)  # Name entry
+            grid_frame.grid_columnconfigure(2, weight=1)  # Value entry
+            grid_frame.grid_columnconfigure(3, weight=1)  # Uncertainty entry
 
-            ttk.Label(header_frame, text="").grid(row=0, column=0, padx=2)  # Spacer
+            ttk.Label(grid_frame, text="").grid(row=0, column=0, padx=2)  # Spacer
 
             header_labels_text = [
                 get_string("uncertainty_calc", "variable", self.language),
@@ -254,32 +351,24 @@ class CalculoIncertezasFrame:
                 get_string("uncertainty_calc", "uncertainty", self.language),
             ]
             for col, text in enumerate(header_labels_text):
-                ttk.Label(header_frame, text=text).grid(
-                    row=0, column=col + 1, padx=2, sticky="ew"
+                ttk.Label(grid_frame, text=text).grid(
+                    row=0, column=col + 1, padx=2, pady=(0, 5), sticky="ew"
                 )
 
             for i in range(num):
-                frame = ttk.Frame(self.campos_frame)
-                frame.grid(row=i + 1, column=0, pady=2, sticky="ew")
-
-                # Configure column weights for individual variable row frame
-                frame.grid_columnconfigure(0, weight=0)  # Row number column
-                frame.grid_columnconfigure(1, weight=1)  # Name entry
-                frame.grid_columnconfigure(2, weight=1)  # Value entry
-                frame.grid_columnconfigure(3, weight=1)  # Uncertainty entry
-
-                ttk.Label(frame, text=f"{i+1}:").grid(
-                    row=0, column=0, padx=2, sticky="w"
+                row = i + 1
+                ttk.Label(grid_frame, text=f"{i+1}:").grid(
+                    row=row, column=0, padx=2, pady=2, sticky="w"
                 )
 
-                nome = ttk.Entry(frame, width=ENTRY_WIDTH["medium"])
-                nome.grid(row=0, column=1, padx=2, sticky="ew")
+                nome = ttk.Entry(grid_frame, width=ENTRY_WIDTH["medium"])
+                nome.grid(row=row, column=1, padx=2, pady=2, sticky="ew")
 
-                valor = ttk.Entry(frame, width=ENTRY_WIDTH["medium"])
-                valor.grid(row=0, column=2, padx=2, sticky="ew")
+                valor = ttk.Entry(grid_frame, width=ENTRY_WIDTH["medium"])
+                valor.grid(row=row, column=2, padx=2, pady=2, sticky="ew")
 
-                incerteza = ttk.Entry(frame, width=ENTRY_WIDTH["medium"])
-                incerteza.grid(row=0, column=3, padx=2, sticky="ew")
+                incerteza = ttk.Entry(grid_frame, width=ENTRY_WIDTH["medium"])
+                incerteza.grid(row=row, column=3, padx=2, pady=2, sticky="ew")
 
                 self.var_entries.append((nome, valor, incerteza))
 
@@ -302,70 +391,37 @@ class CalculoIncertezasFrame:
         Preprocess formula to handle implicit multiplication and other common patterns
         Convert patterns like '3(a+b)' to '3*(a+b)' and '2x' to '2*x'
         """
-        import re
-
         # Remove spaces for easier processing
         formula = formula.replace(" ", "")
 
-        # Known mathematical functions that should NOT be affected
-        math_functions = {
-            "sin",
-            "cos",
-            "tan",
-            "sec",
-            "csc",
-            "cot",
-            "asin",
-            "acos",
-            "atan",
-            "atan2",
-            "asinh",
-            "acosh",
-            "atanh",
-            "sinh",
-            "cosh",
-            "tanh",
-            "exp",
-            "log",
-            "log10",
-            "ln",
-            "sqrt",
-            "abs",
-            "floor",
-            "ceil",
-            "round",
-            "factorial",
-            "gamma",
-        }
-
         # Pattern 1: Number followed by opening parenthesis -> add *
         # Examples: 3(a+b) -> 3*(a+b), 2.5(x+y) -> 2.5*(x+y)
-        formula = re.sub(r"(\d+\.?\d*)\(", r"\1*(", formula)
+        formula = _NUMBER_PAREN_RE.sub(r"\1*(", formula)
 
         # Pattern 2: Number followed by variable letter -> add * (but avoid function names)
         # Examples: 2x -> 2*x, 3a -> 3*a, 2.5y -> 2.5*y
-        for match in re.finditer(r"(\d+\.?\d*)([a-zA-Z_]\w*)", formula):
+        for match in _NUMBER_NAME_RE.finditer(formula):
             number = match.group(1)
             var_name = match.group(2)
             # Only add * if the variable name is not a mathematical function
-            if var_name not in math_functions:
+            if var_name not in MATH_FUNCTIONS:
                 formula = formula.replace(match.group(0), f"{number}*{var_name}", 1)
 
         # Pattern 3: Closing parenthesis followed by opening parenthesis -> add *
         # Examples: (a+b)(c+d) -> (a+b)*(c+d)
-        formula = re.sub(r"\)\(", ")*(", formula)
+        formula = _PAREN_PAREN_RE.sub(")*(", formula)
 
         # Pattern 4: Variable followed by opening parenthesis -> add * (but avoid function names)
         # Examples: x(a+b) -> x*(a+b), but keep sin(x) as sin(x)
-        for match in re.finditer(r"([a-zA-Z_]\w*)\(", formula):
+        for match in _NAME_PAREN_RE.finditer(formula):
             var_name = match.group(1)
             # Only add * if it's not a mathematical function
-            if var_name not in math_functions:
+            if var_name not in MATH_FUNCTIONS:
                 formula = formula.replace(match.group(0), f"{var_name}*(", 1)
 
         # Pattern 5: Closing parenthesis followed by variable -> add *
         # Examples: (a+b)x -> (a+b)*x
-        formula = re.sub(r"\)([a-zA-Z_]\w*)", r")*\1", formula)
+        formula = _PAREN_NAME_RE.sub(r")*\1", formula)
 
         return formula
 
@@ -419,50 +475,24 @@ class CalculoIncertezasFrame:
             # Preprocess formula for implicit multiplication
             formula = self._preprocess_formula(formula)
 
-            # Create symbol mapping for sympy with explicit symbols
-            # Only include user-defined variables, no function names
-            symbols_dict: Dict[str, Any] = {}
-            for var_name in variaveis.keys():
-                symbols_dict[var_name] = sp.Symbol(var_name)
-
-            # Parse and evaluate formula with safe parsing
-            try:
-                # Use a clean namespace with only user variables
-                safe_locals: Dict[str, Any] = symbols_dict.copy()
-                expr = sp.sympify(formula, locals=safe_locals)
-            except (sp.SympifyError, TypeError) as e:
-                messagebox.showerror(
-                    title=get_string("uncertainty_calc", "error_title", self.language),
-                    message=f"Error parsing formula: {str(e)}\nMake sure variable names don't conflict with mathematical functions.",
-                )
-                return
-            except Exception as e:
-                messagebox.showerror(
-                    title=get_string("uncertainty_calc", "error_title", self.language),
-                    message=f"Unexpected error parsing formula: {str(e)}",
-                )
-                return
-
-            # Verify that all symbols in the expression are user-defined variables
-            formula_symbols: Set[Any] = expr.free_symbols
-            for symbol in formula_symbols:
-                if str(symbol) not in variaveis:
-                    messagebox.showerror(
-                        title=get_string(
-                            "uncertainty_calc", "error_title", self.language
-                        ),
-                        message=f"Unknown variable '{symbol}' in formula. Please define all variables.",
-                    )
+            cache_key = (formula, tuple(variable_names))
+            compiled = self.formula_cache.get(cache_key)
+            if compiled is not None:
+                self.formula_cache.move_to_end(cache_key)
+            else:
+                compiled = self._compilar_formula(formula, variable_names)
+                if compiled is None:
                     return
+                self.formula_cache[cache_key] = compiled
+                if len(self.formula_cache) > FORMULA_CACHE_SIZE:
+                    self.formula_cache.popitem(last=False)
+            valor_fn, gradiente = compiled
 
-            # Create substitution mapping for evaluation
-            variables_dict_sympy: Dict[Any, float] = {
-                symbols_dict[k]: v[0] for k, v in variaveis.items()
-            }
-
-            # Calculate final value using sympy
+            # Calculate final value with the compiled formula
             try:
-                valor_final = float(expr.subs(variables_dict_sympy).evalf())
+                valor_final = self._avaliar_formula(
+                    valor_fn, [variaveis[nome][0] for nome in variable_names]
+                )
             except Exception as e:
                 messagebox.showerror(
                     title=get_string("uncertainty_calc", "error_title", self.language),
@@ -472,7 +502,9 @@ class CalculoIncertezasFrame:
 
             # Calculate uncertainty
             try:
-                incerteza_total = self._calcular_incerteza_total(formula, variaveis)
+                incerteza_total = self._calcular_incerteza_total(
+                    gradiente, [variaveis[nome] for nome in variable_names]
+                )
             except Exception as e:
                 messagebox.showerror(
                     title=get_string("uncertainty_calc", "error_title", self.language),
@@ -489,56 +521,91 @@ class CalculoIncertezasFrame:
                 message=f"Unexpected error: {str(e)}",
             )
 
-    def _calcular_incerteza_total(
-        self, formula: str, variaveis: Dict[str, Tuple[float, float]]
-    ) -> float:
-        """Calculate total uncertainty using partial derivatives"""
-        try:
-            # Preprocess formula for implicit multiplication (safety measure)
-            formula = self._preprocess_formula(formula)
+    def _compilar_formula(
+        self, formula: str, variable_names: List[str]
+    ) -> Optional[Tuple[ValueCallable, GradientCallable]]:
+        """Parse the formula and lambdify it together with its partial derivatives
 
-            # Create symbol mapping with only user-defined variables
-            symbols_dict: Dict[str, Any] = {}
-            for var_name in variaveis.keys():
-                symbols_dict[var_name] = sp.Symbol(var_name)
+        Returns None (after showing the error) if the formula cannot be used.
+        """
+        # Create symbol mapping for sympy with explicit symbols
+        # Only include user-defined variables, no function names
+        symbols_dict: Dict[str, Any] = {
+            var_name: sp.Symbol(var_name) for var_name in variable_names
+        }
 
-            # Parse expression with safe namespace
+        # Parse and evaluate formula with safe parsing
+        try:
+            # Use a clean namespace with only user variables
             safe_locals: Dict[str, Any] = symbols_dict.copy()
             expr = sp.sympify(formula, locals=safe_locals)
-            # Create substitution mapping
-            symbols_map: Dict[Any, float] = {
-                symbols_dict[k]: v[0] for k, v in variaveis.items()
-            }
+        except (sp.SympifyError, TypeError) as e:
+            messagebox.showerror(
+                title=get_string("uncertainty_calc", "error_title", self.language),
+                message=f"Error parsing formula: {str(e)}\nMake sure variable names don't conflict with mathematical functions.",
+            )
+            return None
+        except Exception as e:
+            messagebox.showerror(
+                title=get_string("uncertainty_calc", "error_title", self.language),
+                message=f"Unexpected error parsing formula: {str(e)}",
+            )
+            return None
 
-            incerteza_total = 0.0
-            for var, (_, sigma) in variaveis.items():
-                symbol: Any = symbols_dict[var]
+        # Verify that all symbols in the expression are user-defined variables
+        formula_symbols: Set[Any] = expr.free_symbols
+        for symbol in formula_symbols:
+            if str(symbol) not in symbols_dict:
+                messagebox.showerror(
+                    title=get_string("uncertainty_calc", "error_title", self.language),
+                    message=f"Unknown variable '{symbol}' in formula. Please define all variables.",
+                )
+                return None
 
-                # Calculate partial derivative
-                try:
-                    derivada = sp.diff(expr, symbol)
-                except Exception as e:
-                    raise ValueError(
-                        f"Error calculating derivative for variable '{var}': {str(e)}"
-                    )
+        # Differentiate once per variable and compile the formula and the whole
+        # gradient into SciPy/NumPy callables
+        simbolos = [symbols_dict[var_name] for var_name in variable_names]
+        try:
+            valor_fn: ValueCallable = _com_fallback_evalf(
+                sp.lambdify(simbolos, expr, LAMBDIFY_MODULES), expr, simbolos
+            )
+            derivadas = [sp.diff(expr, symbol) for symbol in simbolos]
+            gradiente: GradientCallable = _com_fallback_evalf(
+                sp.lambdify(simbolos, derivadas, LAMBDIFY_MODULES), derivadas, simbolos
+            )
+        except Exception as e:
+            messagebox.showerror(
+                title=get_string("uncertainty_calc", "error_title", self.language),
+                message=f"Error calculating derivatives: {str(e)}",
+            )
+            return None
 
-                # Evaluate derivative at the point
-                try:
-                    derivada_num = derivada.subs(symbols_map)
-                    derivada_num_val = float(derivada_num.evalf())
-                except Exception as e:
-                    raise ValueError(
-                        f"Error evaluating derivative for variable '{var}': {str(e)}"
-                    )
+        return valor_fn, gradiente
 
-                # Add contribution to total uncertainty
-                incerteza_total += (derivada_num_val * sigma) ** 2
+    def _avaliar_formula(self, valor_fn: ValueCallable, valores: List[float]) -> float:
+        """Evaluate the compiled formula at the given variable values"""
+        # Raise instead of silently returning inf/nan (e.g. 1/x at x = 0)
+        with np.errstate(divide="raise", invalid="raise", over="raise"):
+            valor = float(valor_fn(*np.array(valores, dtype=float)))
+        if not math.isfinite(valor):
+            raise ValueError("result is not finite")
+        return valor
 
-            return math.sqrt(incerteza_total)
+    def _calcular_incerteza_total(
+        self, gradiente: GradientCallable, variaveis: List[Tuple[float, float]]
+    ) -> float:
+        """Calculate total uncertainty using partial derivatives"""
+        valores = np.array([valor for valor, _ in variaveis], dtype=float)
+        sigmas = np.array([sigma for _, sigma in variaveis], dtype=float)
 
-        except Exception as e:
-            # Re-raise with more context
-            raise ValueError(f"Error in uncertainty calculation: {str(e)}")
+        # Raise instead of silently propagating inf/nan (e.g. 1/x at x = 0)
+        with np.errstate(divide="raise", invalid="raise", over="raise"):
+            derivadas = np.asarray(gradiente(*valores), dtype=float)
+            incerteza_total = float(np.sqrt(np.sum((derivadas * sigmas) ** 2)))
+
+        if not math.isfinite(incerteza_total):
+            raise ValueError("Error in uncertainty calculation: result is not finite")
+        return incerteza_total
 
     def _mostrar_resultados(self, valor: float, incerteza: float) -> None:
         """Display calculation results in the text area"""
@@ -565,8 +632,8 @@ class CalculoIncertezasFrame:
 
     def _clear_latex_display(self) -> None:
         """Clear any LaTeX rendering from the interface"""
-        for widget in self.latex_frame.winfo_children():
-            widget.destroy()
+        if self._latex_canvas is not None:
+            self._latex_canvas.get_tk_widget().pack_forget()
 
     def gerar_formula_incerteza(self) -> None:
         """Generate uncertainty formula for given variables"""
@@ -646,25 +713,26 @@ class CalculoIncertezasFrame:
                 )
                 return
 
-            # Generate uncertainty terms
+            # Generate uncertainty terms from the gradient, computed in one
+            # jacobian call instead of one sp.diff per variable
+            try:
+                jacobiana = sp.Matrix([expr]).jacobian(
+                    [simbolos[var_str] for var_str in variaveis_str]
+                )
+            except Exception as e:
+                messagebox.showerror(
+                    title=get_string("uncertainty_calc", "error_title", self.language),
+                    message=f"Error calculating derivatives: {str(e)}",
+                )
+                return
+
             termos: List[str] = []
-            for var_str in variaveis_str:
-                try:
-                    symbol: Any = simbolos[var_str]
-                    derivada = sp.diff(expr, symbol)
-                    # Get LaTeX representation - keep it simple
-                    latex_derivada: str = str(sp.latex(derivada))
-                    # Create the term with simpler LaTeX formatting
-                    latex_term = f"({latex_derivada} \\cdot \\delta_{{{var_str}}})^2"
-                    termos.append(latex_term)
-                except Exception as e:
-                    messagebox.showerror(
-                        title=get_string(
-                            "uncertainty_calc", "error_title", self.language
-                        ),
-                        message=f"Error calculating derivative for {var_str}: {str(e)}",
-                    )
-                    return
+            for i, var_str in enumerate(variaveis_str):
+                # Get LaTeX representation - keep it simple
+                latex_derivada: str = str(sp.latex(jacobiana[0, i]))
+                # Create the term with simpler LaTeX formatting
+                latex_term = f"({latex_derivada} \\cdot \\delta_{{{var_str}}})^2"
+                termos.append(latex_term)
 
             # Build the complete uncertainty formula with simpler LaTeX syntax
             formula_incerteza = "\\delta_{total} = \\sqrt{" + " + ".join(termos) + "}"
@@ -721,49 +789,19 @@ class CalculoIncertezasFrame:
 
     def _renderizar_formula_incerteza_na_interface(self, formula_latex: str) -> None:
         """Render the uncertainty formula using matplotlib"""
-        self._clear_latex_display()
-
         try:
-            fig = Figure(figsize=(7, 2))
-            ax: Axes = fig.add_subplot(111)
-            ax.axis("off")
-            # Try to render the LaTeX formula
-            ax.text(
-                0.5,
-                0.5,
-                f"${formula_latex}$",
-                fontsize=16,
-                ha="center",
-                va="center",
-            )
-            fig.tight_layout(pad=0)
-
-            canvas = FigureCanvasTkAgg(fig, master=self.latex_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Parse up front so syntax errors surface here and not in the
+            # deferred draw
+            _MATHTEXT_PARSER.parse(f"${formula_latex}$")
+            self._mostrar_texto_latex(f"${formula_latex}$", fontsize=16)
 
         except Exception as e:
             # If LaTeX rendering fails, show a simplified version
             logging.warning(f"LaTeX rendering failed: {str(e)}")
             try:
-                fig = Figure(figsize=(7, 2))
-                ax: Axes = fig.add_subplot(111)
-                ax.axis("off")
                 # Show a simple text version if LaTeX fails
                 simple_text = "Uncertainty formula generated (LaTeX rendering failed)"
-                ax.text(
-                    0.5,
-                    0.5,
-                    simple_text,
-                    fontsize=12,
-                    ha="center",
-                    va="center",
-                )
-                fig.tight_layout(pad=0)
-
-                canvas = FigureCanvasTkAgg(fig, master=self.latex_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+                self._mostrar_texto_latex(simple_text, fontsize=12)
 
             except Exception:
                 # If everything fails, just show an error message
@@ -777,6 +815,31 @@ class CalculoIncertezasFrame:
                 ),
             )
 
+    def _mostrar_texto_latex(self, text: str, fontsize: int) -> None:
+        """Show text in the cached LaTeX figure, creating it on first use"""
+        if self._latex_canvas is None or self._latex_text is None:
+            self._latex_fig = Figure(figsize=(7, 2))
+            ax: Axes = self._latex_fig.add_subplot(111)
+            ax.axis("off")
+            self._latex_text = ax.text(
+                0.5,
+                0.5,
+                text,
+                fontsize=fontsize,
+                ha="center",
+                va="center",
+            )
+            self._latex_fig.tight_layout(pad=0)
+            self._latex_canvas = FigureCanvasTkAgg(
+                self._latex_fig, master=self.latex_frame
+            )
+        else:
+            self._latex_text.set_text(text)
+            self._latex_text.set_fontsize(fontsize)
+
+        self._latex_canvas.draw_idle()
+        self._latex_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
     def exibir_formula_latex(self, formula_latex: str) -> None:
         """Display LaTeX formula in a separate window"""
         if not formula_latex.strip():
@@ -14,7 +14,7 @@ from app_files import __version__
 
 from app_files.utils.user_preferences import user_preferences
 from app_files.utils.lazy_loader import lazy_import
-from app_files.utils.translations.api import get_string, get_language_code_from_name
+from app_files.utils.translations.api import LANGS, get_string, get_language_code_from_name
 from app_files.utils.error_handler import show_error
 from app_files.utils.tab_manager import TabManager
 
@@ -228,26 +228,18 @@ class AplicativoUnificado:
     def _update_toolbar_buttons(self) -> None:
         """Update toolbar button texts to current language."""
         if self.toolbar_frame is not None:
+            # Button text in any language -> translation key, built once per switch
+            button_keys = {
+                get_string("main_app", key, lang): key
+                for key in ("curve_fitting", "uncertainty_calc")
+                for lang in LANGS
+            }
             for widget in self.toolbar_frame.winfo_children():
                 if isinstance(widget, ttk.Button):
-                    current_text = widget.cget("text")
-                    # Check if it's the curve fitting button
-                    if current_text in [
-                        get_string("main_app", "curve_fitting", "pt"),
-                        get_string("main_app", "curve_fitting", "en"),
-                    ]:
+                    key = button_keys.get(widget.cget("text"))
+                    if key is not None:
                         widget.configure(
-                            text=get_string("main_app", "curve_fitting", self.language)
-                        )
-                    # Check if it's the uncertainty calc button
-                    elif current_text in [
-                        get_string("main_app", "uncertainty_calc", "pt"),
-                        get_string("main_app", "uncertainty_calc", "en"),
-                    ]:
-                        widget.configure(
-                            text=get_string(
-                                "main_app", "uncertainty_calc", self.language
-                            )
+                            text=get_string("main_app", key, self.language)
                         )
 
     def close_current_tab(self) -> None:
@@ -275,7 +267,7 @@ class AplicativoUnificado:
             parent, text=f"🔄 {message}...", font=("Arial", 12), fg="gray"
         )
         loading_label.pack(expand=True)
-        parent.update()
+        parent.update_idletasks()
         return loading_label
 
     def _hide_loading_indicator(self, loading_widget: tk.Widget) -> None:
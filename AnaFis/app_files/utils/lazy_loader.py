@@ -68,7 +68,7 @@ class LazyModule:
                 raise ImportError(f"Circular import detected for {self._module_name}")
 
             self._loading = True
-            self._load_start_time = time.time()
+            self._load_start_time = time.perf_counter()
 
             try:
                 # Load dependencies first if specified
@@ -81,7 +81,7 @@ class LazyModule:
 
                 # Load the main module
                 self._module = importlib.import_module(self._module_name)
-                load_time = time.time() - self._load_start_time
+                load_time = time.perf_counter() - self._load_start_time
 
                 # Update lazy loader statistics
                 lazy_loader.record_module_load(self._module_name, load_time, None)
@@ -92,7 +92,7 @@ class LazyModule:
                 return self._module
 
             except ImportError as e:
-                load_time = time.time() - self._load_start_time
+                load_time = time.perf_counter() - self._load_start_time
                 lazy_loader.record_module_load(self._module_name, load_time, str(e))
                 logging.error("Failed to lazy load %s: %s", self._module_name, e)
                 raise
@@ -145,7 +145,8 @@ class ModuleCache:
         self._cache: Dict[str, ModuleType] = {}
         self.lock = threading.Lock()
         self._access_count: Dict[str, int] = {}
-        self._last_access: Dict[str, float] = {}
+        # Monotonic nanosecond stamps; only ever compared to rank recent access
+        self._last_access: Dict[str, int] = {}
 
     def get(self, module_name: str) -> Optional[ModuleType]:
         """Get a cached module and update access statistics"""
@@ -155,7 +156,7 @@ class ModuleCache:
                 self._access_count[module_name] = (
                     self._access_count.get(module_name, 0) + 1
                 )
-                self._last_access[module_name] = time.time()
+                self._last_access[module_name] = time.monotonic_ns()
             return module
 
     def put(self, module_name: str, module: ModuleType) -> None:
@@ -163,7 +164,7 @@ class ModuleCache:
         with self.lock:
             self._cache[module_name] = module
             self._access_count[module_name] = 1
-            self._last_access[module_name] = time.time()
+            self._last_access[module_name] = time.monotonic_ns()
 
     def clear(self) -> None:
         """Clear the cache"""
@@ -236,14 +237,14 @@ class LazyLoader:
         if module_name in self.preloaded_modules:
             return True
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             # Update status to loading
             if module_name in self.module_stats:
                 self.module_stats[module_name].status = LoadStatus.LOADING
 
             module = importlib.import_module(module_name)
-            load_time = time.time() - start_time
+            load_time = time.perf_counter() - start_time
 
             self.cache.put(module_name, module)
             with self.lock:
@@ -256,7 +257,7 @@ class LazyLoader:
             return True
 
         except ImportError as e:
-            load_time = time.time() - start_time
+            load_time = time.perf_counter() - start_time
             self.record_module_load(module_name, load_time, str(e))
             logging.warning("Failed to preload %s: %s", module_name, e)
             return False
@@ -185,7 +185,7 @@ class TabManager:
             fg="gray",
         )
         loading_label.pack(expand=True)
-        content_area.update()
+        content_area.update_idletasks()
         try:
             curve_fitting_instance = AjusteCurvaFrame(content_area, self.language)
             loading_label.destroy()
@@ -233,7 +233,7 @@ class TabManager:
             fg="gray",
         )
         loading_label.pack(expand=True)
-        content_area.update()
+        content_area.update_idletasks()
         try:
             uncertainty_calc_instance = CalculoIncertezasFrame(
                 content_area, self.language
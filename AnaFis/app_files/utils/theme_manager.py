@@ -14,6 +14,18 @@ from enum import Enum
 import time
 
 
+# Colors used when no theme is active or a theme lacks a color entry
+DEFAULT_COLORS: Dict[str, str] = {
+    "background": "#f0f0f0",
+    "foreground": "#000000",
+    "text_info": "#666666",
+    "text_error": "#ff0000",
+    "text_success": "#008000",
+    "text_warning": "#ffa500",
+    "text_valid": "#008000",
+}
+
+
 class ThemeType(Enum):
     """Types of themes supported"""
 
@@ -52,6 +64,8 @@ class ThemeManager:
 
         logging.info("Creating ThemeManager singleton instance.")
         self.available_themes: List[ThemeInfo] = []
+        # Name -> ThemeInfo index so lookups on theme switch are O(1)
+        self._themes_by_name: Dict[str, ThemeInfo] = {}
         self.root: Optional[tk.Tk] = None
         self._initialized = False
         self._color_callbacks: List[Callable[[], None]] = []
@@ -95,7 +109,7 @@ class ThemeManager:
             # Preload common themes in background
             common_themes = ["vista", "clam", "alt"]
             for theme_name in common_themes:
-                if theme_name in [t.name for t in self.available_themes]:
+                if theme_name in self._themes_by_name:
                     self._preload_theme_colors(theme_name)
         except Exception as e:
             logging.debug(f"Theme optimization failed: {e}")
@@ -145,6 +159,7 @@ class ThemeManager:
     def _load_all_themes(self) -> None:
         """Load all available themes (built-in TTK and package themes)"""
         self.available_themes.clear()
+        self._themes_by_name.clear()
 
         # Load built-in TTK themes
         self._load_builtin_ttk_themes()
@@ -170,7 +185,7 @@ class ThemeManager:
                     display_name=theme_name.title(),
                     description=f"Built-in TTK theme: {theme_name}",
                 )
-                self.available_themes.append(theme_info)
+                self._register_theme(theme_info)
 
         except Exception as e:
             logging.error(f"Error loading built-in TTK themes: {e}")
@@ -185,7 +200,7 @@ class ThemeManager:
 
             for theme_name in package_themes:
                 # Skip if already loaded as built-in
-                if any(t.name == theme_name for t in self.available_themes):
+                if theme_name in self._themes_by_name:
                     continue
 
                 theme_info = ThemeInfo(
@@ -194,7 +209,7 @@ class ThemeManager:
                     display_name=theme_name.title(),
                     description=f"ttkthemes package theme: {theme_name}",
                 )
-                self.available_themes.append(theme_info)
+                self._register_theme(theme_info)
 
             logging.info(f"Loaded {len(package_themes)} ttkthemes package themes")
         except ImportError:
@@ -248,12 +263,14 @@ class ThemeManager:
             logging.error("Error applying theme '%s': %s", theme_name, e)
             return False
 
+    def _register_theme(self, theme_info: ThemeInfo) -> None:
+        """Add a theme to the available list and the name index"""
+        self.available_themes.append(theme_info)
+        self._themes_by_name[theme_info.name] = theme_info
+
     def _find_theme_info(self, theme_name: str) -> Optional[ThemeInfo]:
         """Find theme info by name"""
-        for theme in self.available_themes:
-            if theme.name == theme_name:
-                return theme
-        return None
+        return self._themes_by_name.get(theme_name)
 
     def _apply_ttk_theme(self, theme_name: str) -> bool:
         """Apply a TTK theme"""
@@ -295,16 +312,7 @@ class ThemeManager:
 
     def _get_default_color(self, color_type: str) -> str:
         """Get default colors"""
-        default_colors = {
-            "background": "#f0f0f0",
-            "foreground": "#000000",
-            "text_info": "#666666",
-            "text_error": "#ff0000",
-            "text_success": "#008000",
-            "text_warning": "#ffa500",
-            "text_valid": "#008000",
-        }
-        return default_colors.get(color_type, "#000000")
+        return DEFAULT_COLORS.get(color_type, "#000000")
 
     def get_available_themes(self) -> List[ThemeInfo]:
         """Get list of available themes"""
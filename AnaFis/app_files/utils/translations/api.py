@@ -3,6 +3,7 @@ Translation API for AnaFis
 Provides functions to get UI and help strings with error handling and fallback.
 """
 
+import functools
 import importlib
 import logging
 from typing import Optional, Dict, List, Tuple
@@ -171,6 +172,14 @@ def get_string(
         return f"[MISSING: {lang}.{component}.{key}]"
 
 
+@functools.lru_cache(maxsize=1024)
+def get_string_cached(
+    component: str, key: str, lang: str, fallback: Optional[str] = None
+) -> str:
+    """Get a UI string like get_string, memoised per (component, key, lang, fallback)."""
+    return get_string(component, key, lang, fallback)
+
+
 def get_help(topic: str, key: str, lang: str, fallback: Optional[str] = None) -> str:
     """Get a help string for a given language, topic, and key."""
     try:
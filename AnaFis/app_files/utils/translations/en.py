@@ -152,6 +152,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "format_changed_title": "Format Changed",
         "format_changed_message": "Columns reassigned: {}",
         "no_data_loaded_reinterpret": "No data loaded to reinterpret.",
+        "preview_truncated": "... showing the first {shown} of {total} rows",
     "column_assignment_title": "Column Assignment",
     "assign_columns": "Assign columns:",
     "current_format": "Now: {}",
@@ -214,6 +215,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "data_label": "Data",
         "fit_label": "Fit",
         "fit_title_prefix": "Fit",
+        "use_numba": "Compile the model with numba (faster on many points)",
     },
     "custom_function": {
         "custom_functions": "Custom Functions",
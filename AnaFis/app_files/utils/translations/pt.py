@@ -152,6 +152,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "format_changed_title": "Formato Alterado",
         "format_changed_message": "Colunas reatribuídas: {}",
         "no_data_loaded_reinterpret": "Nenhum dado carregado para reinterpretar.",
+        "preview_truncated": "... exibindo as primeiras {shown} de {total} linhas",
         "column_assignment_title": "Atribuição de Colunas",
         "assign_columns": "Atribuir colunas:",
         "current_format": "Atual: {}",
@@ -213,6 +214,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "data_label": "Dados",
         "fit_label": "Ajuste",
         "fit_title_prefix": "Ajuste",
+        "use_numba": "Compilar o modelo com numba (mais rápido em muitos pontos)",
         "models_presets": '{"Linear: a*x + b": "a*x + b", "Quadrático: a*x² + b*x + c": "a*x**2 + b*x + c", "Cúbico: a*x³ + b*x² + c*x + d": "a*x**3 + b*x**2 + c*x + d", "Exponencial: a*exp(b*x)": "a*exp(b*x)", "Exponencial com offset: a*exp(b*x) + c": "a*exp(b*x) + c", "Logarítmico: a*log(x) + b": "a*log(x) + b", "Potência: a*x^b": "a*x**b", "Senoidal: a*sin(b*x + c) + d": "a*sin(b*x + c) + d", "Gaussiana: a*exp(-((x-b)/c)**2)": "a*exp(-((x-b)/c)**2)", "Sigmoidal: a/(1 + exp(-b*(x-c)))": "a/(1 + exp(-b*(x-c)))"}',
     },
     "custom_function": {
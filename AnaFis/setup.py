@@ -40,12 +40,15 @@ setup(
     install_requires=[
         "numpy>=1.20.0",
         "scipy>=1.7.0",
-        "sympy>=1.8.0",
+        "sympy>=1.9.0",
         "matplotlib>=3.3.0",
         "pandas>=1.3.0",
         "scikit-learn>=1.0.0",
         "ttkthemes>=3.2.0",
     ],
+    extras_require={
+        "performance": ["numba>=0.55.0", "orjson>=3.0.0"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Science/Research",
@@ -43,6 +43,8 @@ def setup_environment_variables() -> None:
     os.environ["MKL_NUM_THREADS"] = "1"
     os.environ["NUMEXPR_NUM_THREADS"] = "1"
     os.environ["MPLBACKEND"] = "TkAgg"
+    # Larger SymPy cache for repeated diff/sympify; must be set before sympy is imported
+    os.environ.setdefault("SYMPY_CACHE_SIZE", "10000")
 
 
 def optimize_imports() -> None: